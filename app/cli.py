@@ -0,0 +1,129 @@
+import click
+
+
+@click.pass_context
+def _run_migrate_group(ctx, directory, x_arg):
+    return ctx.invoke(ctx.command._load().callback, directory=directory, x_arg=x_arg)
+
+
+class _LazyMigrateGroup(click.Group):
+    """
+    Stand-in for Flask-Migrate's `flask db` group.
+
+    Flask-Migrate imports alembic (and with it mako and pygments) at import
+    time; this defers that cost from every create_app() to the first
+    `flask db ...` command. The group options are declared here too (they are
+    parsed before anything is loaded) and handed to the real group's callback,
+    which stores them on `g` for Migrate.get_config().
+    """
+
+    def __init__(self, app, **kwargs):
+        params = [
+            click.Option(["-d", "--directory"], default=None,
+                         help='Migration script directory (default is "migrations")'),
+            click.Option(["-x", "--x-arg"], multiple=True,
+                         help="Additional arguments consumed by custom env.py scripts"),
+        ]
+        super().__init__("db", help="Perform database migrations.", params=params, callback=_run_migrate_group, **kwargs)
+        self.app = app
+
+    def _load(self):
+        from flask_migrate import Migrate
+        from app.extensions import db
+
+        if "migrate" not in self.app.extensions:
+            Migrate(self.app, db)  # registers the real `db` group in place of this one
+        return self.app.cli.commands["db"]
+
+    def list_commands(self, ctx):
+        return self._load().list_commands(ctx)
+
+    def get_command(self, ctx, name):
+        return self._load().get_command(ctx, name)
+
+
+def register_cli(app):
+    """Attach maintenance commands to `flask ...`."""
+
+    app.cli.add_command(_LazyMigrateGroup(app))
+
+    @app.cli.group("leaderboard")
+    def leaderboard_cli():
+        """Leaderboard rollup maintenance."""
+
+    @leaderboard_cli.command("rebuild")
+    def rebuild_leaderboard_command():
+        """Recompute current leaderboard buckets from completed earnings."""
+        from app.services.leaderboard_service import rebuild_leaderboard
+        rebuild_leaderboard()
+        click.echo("Leaderboard rebuilt.")
+
+    @app.cli.group("writer-stats")
+    def writer_stats_cli():
+        """Writer stats rollup maintenance."""
+
+    @writer_stats_cli.command("rebuild")
+    def rebuild_writer_stats_command():
+        """Recompute every writer's stats row from orders, bids, submissions and earnings."""
+        from app.services.writer_stats_service import rebuild_writer_stats
+        rebuild_writer_stats()
+        click.echo("Writer stats rebuilt.")
+
+    @app.cli.group("applications")
+    def applications_cli():
+        """Writer application maintenance."""
+
+    @applications_cli.command("backfill-manifests")
+    def backfill_manifests_command():
+        """Store file manifests for applications submitted before manifests existed."""
+        from app.services.application_service import backfill_file_manifests
+        click.echo(f"Stored manifests for {backfill_file_manifests()} application(s).")
+
+    @app.cli.group("documents")
+    def documents_cli():
+        """Upload preprocessing (text, page counts, thumbnails, hashes)."""
+
+    @documents_cli.command("work")
+    @click.option("--workers", type=int, default=None, help="Extraction processes (default DOCUMENT_WORKERS).")
+    @click.option("--batch-size", type=int, default=None, help="Rows claimed per round (default 4 per worker).")
+    @click.option("--once", is_flag=True, help="Exit when the queue is empty instead of polling.")
+    def documents_work_command(workers, batch_size, once):
+        """Process queued uploads."""
+        from app.services.document_service import process_pending
+        handled = process_pending(workers=workers, batch_size=batch_size, once=once)
+        click.echo(f"Processed {handled} document(s).")
+
+    @documents_cli.command("backfill")
+    def documents_backfill_command():
+        """Queue application and submission files uploaded before the pipeline existed."""
+        from app.services.document_service import enqueue_existing_uploads
+        click.echo(f"Queued {enqueue_existing_uploads()} document(s).")
+
+    @app.cli.group("uploads")
+    def uploads_cli():
+        """Upload storage maintenance."""
+
+    @uploads_cli.command("reconcile")
+    @click.option("--grace", type=int, default=None, help="Only settle operations older than this many seconds.")
+    def reconcile_uploads_command(grace):
+        """Finish or discard staged uploads and deletes left behind by interrupted requests."""
+        from app.services.upload_service import reconcile_uploads
+        counts = reconcile_uploads(grace)
+        click.echo(", ".join(f"{k}: {v}" for k, v in counts.items()))
+
+    @app.cli.group("sweeps")
+    def sweeps_cli():
+        """Time-based state transitions (warning expiry, bid deadlines, overdue orders)."""
+
+    @sweeps_cli.command("run")
+    @click.option("--loop", is_flag=True, help="Keep sweeping every --interval seconds instead of once.")
+    @click.option("--interval", type=float, default=None, help="Seconds between runs with --loop (default SWEEP_INTERVAL).")
+    @click.option("--batch-size", type=int, default=None, help="Rows changed per statement (default SWEEP_BATCH_SIZE).")
+    def sweeps_run_command(loop, interval, batch_size):
+        """Apply every due transition and send its notifications."""
+        from app.services.sweep_service import run_forever, run_sweeps
+        if loop:
+            run_forever(interval=interval, batch_size=batch_size)
+            return
+        counts = run_sweeps(batch_size=batch_size)
+        click.echo(", ".join(f"{k}: {'failed' if v is None else v}" for k, v in counts.items()))
@@ -1,6 +1,8 @@
 import os
 from datetime import timedelta
 from dotenv import load_dotenv
+from app.utils.db_tuning import build_engine_options
+from app.utils.db_routing import replica_binds
 
 load_dotenv()
 
@@ -8,15 +10,111 @@ class Config:
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY", "super-secret-change-me")
     SQLALCHEMY_DATABASE_URI = os.getenv("DATABASE_URL", "sqlite:///dev.db")
+    # pool sizing/pre-ping/recycle, statement timeout and executemany batching:
+    # DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT, DB_POOL_RECYCLE, DB_POOL_PRE_PING,
+    # DB_STATEMENT_TIMEOUT_MS, DB_EXECUTEMANY_MODE, DB_INSERT_PAGE_SIZE
+    SQLALCHEMY_ENGINE_OPTIONS = build_engine_options(SQLALCHEMY_DATABASE_URI, os.environ)
+    # timeout applied with SET LOCAL to transactions opened during web requests (0 disables);
+    # DB_STATEMENT_TIMEOUT_MS, if set, is a connection default for every process including CLI jobs
+    DB_REQUEST_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_REQUEST_STATEMENT_TIMEOUT_MS", 30000)) or None
+
+    # read replicas (comma-separated URLs) serve reads during GET requests; after a write the
+    # caller is pinned to the primary for DB_STICKY_PRIMARY_SECONDS ("redis" backend shares this across workers)
+    SQLALCHEMY_BINDS = replica_binds(os.getenv("DATABASE_REPLICA_URLS"))
+    DB_STICKY_PRIMARY_SECONDS = float(os.getenv("DB_STICKY_PRIMARY_SECONDS", 5))
+    DB_STICKY_BACKEND = os.getenv("DB_STICKY_BACKEND", "memory")
+    DB_STICKY_URL = os.getenv("DB_STICKY_URL")
     CORS_ORIGINS = os.getenv("CORS_ORIGINS", "http://localhost:8080, http://127.0.0.1:8080, https://id-preview--1ddf316e-9ab9-41ad-ab11-efb95ff33ef9.lovable.app")
+    # rate limiting (app.utils.rate_limits): counters in RATELIMIT_STORAGE_URI, "memory://" per worker or
+    # "redis://host:6379/0" shared by all workers (needs `redis`); RATELIMIT_DEFAULT applies per route to
+    # each caller, and password-hashing / chat-sanitizing routes also spend RATELIMIT_COST_* from RATELIMIT_EXPENSIVE
     RATELIMIT_HEADERS_ENABLED = True
+    RATELIMIT_STORAGE_URI = os.getenv("RATELIMIT_STORAGE_URI", "memory://")
+    RATELIMIT_STORAGE_OPTIONS = {
+        # a stalled limiter store must not stall requests; errors switch to the in-memory fallback
+        "socket_timeout": float(os.getenv("RATELIMIT_STORAGE_TIMEOUT", 0.5)),
+        "socket_connect_timeout": float(os.getenv("RATELIMIT_STORAGE_TIMEOUT", 0.5)),
+    } if RATELIMIT_STORAGE_URI.startswith("redis") else {}
+    RATELIMIT_IN_MEMORY_FALLBACK_ENABLED = os.getenv("RATELIMIT_IN_MEMORY_FALLBACK_ENABLED", "true").lower() == "true"
+    RATELIMIT_STRATEGY = os.getenv("RATELIMIT_STRATEGY", "fixed-window")
+    RATELIMIT_KEY_PREFIX = os.getenv("RATELIMIT_KEY_PREFIX", "writing")
+    RATELIMIT_DEFAULT = os.getenv("RATELIMIT_DEFAULT", "600 per hour")
+    RATELIMIT_EXPENSIVE = os.getenv("RATELIMIT_EXPENSIVE", "300 per hour")
+    RATELIMIT_COST_PASSWORD = int(os.getenv("RATELIMIT_COST_PASSWORD", 10))
+    RATELIMIT_COST_SANITIZE = int(os.getenv("RATELIMIT_COST_SANITIZE", 2))
 
     ACCESS_EXPIRES = int(os.getenv("ACCESS_EXPIRES", 86400))
     REFRESH_EXPIRES = int(os.getenv("REFRESH_EXPIRES", 86400))
+    # seconds after issue during which role/status claims in a token are trusted without a DB lookup
+    ROLE_CLAIMS_TTL = int(os.getenv("ROLE_CLAIMS_TTL", 300))
+    # token version/revocation store: "memory" or "redis" (shared, needs TOKEN_STORE_URL)
+    TOKEN_STORE_BACKEND = os.getenv("TOKEN_STORE_BACKEND", "memory")
+    TOKEN_STORE_URL = os.getenv("TOKEN_STORE_URL")
+
+    # password hashing: bcrypt cost, and a bounded pool so login storms can't pin every worker
+    BCRYPT_LOG_ROUNDS = int(os.getenv("BCRYPT_LOG_ROUNDS", 12))
+    PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", 2))
+    PASSWORD_HASH_BACKLOG = int(os.getenv("PASSWORD_HASH_BACKLOG", 8))
+    PASSWORD_HASH_TIMEOUT = float(os.getenv("PASSWORD_HASH_TIMEOUT", 10))
+    LOGIN_RATE_LIMIT = os.getenv("LOGIN_RATE_LIMIT", "10 per minute")
+
+    # logging: root level, per-module overrides ("app.routes.bid_routes=DEBUG,sqlalchemy.engine=WARNING"),
+    # "json" or "text" records, and whether records are written from a background thread
+    LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+    LOG_LEVELS = os.getenv("LOG_LEVELS", "")
+    LOG_FORMAT = os.getenv("LOG_FORMAT", "json")
+    LOG_ASYNC = os.getenv("LOG_ASYNC", "true").lower() == "true"
+
+    # per-request query instrumentation (Server-Timing header + structured log line)
+    INSTRUMENTATION_ENABLED = os.getenv("INSTRUMENTATION_ENABLED", "true").lower() == "true"
+    SERVER_TIMING_ENABLED = os.getenv("SERVER_TIMING_ENABLED", "true").lower() == "true"
+    # same statement this many times in one request is logged as a likely N+1
+    QUERY_REPEAT_THRESHOLD = int(os.getenv("QUERY_REPEAT_THRESHOLD", 5))
+    # fallback budget for views without @query_budget; strict mode raises instead of logging
+    QUERY_BUDGET_DEFAULT = int(os.getenv("QUERY_BUDGET_DEFAULT")) if os.getenv("QUERY_BUDGET_DEFAULT") else None
+    QUERY_BUDGET_STRICT = os.getenv("QUERY_BUDGET_STRICT", "false").lower() == "true"
+
+    # /metrics exposition; set METRICS_MULTIPROC_DIR under gunicorn so workers' values are merged
+    METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+    METRICS_MULTIPROC_DIR = os.getenv("METRICS_MULTIPROC_DIR")
+    METRICS_FLUSH_INTERVAL = float(os.getenv("METRICS_FLUSH_INTERVAL", 5))
+    METRICS_AUTH_TOKEN = os.getenv("METRICS_AUTH_TOKEN")
     basedir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
     UPLOAD_FOLDER = os.path.join(basedir, "uploads/applications")
     ORDERS_FOLDER = os.path.join(basedir, "uploads/orders")
     SUBMISSIONS_FOLDER = os.path.join(basedir, "uploads/submissions")
+    # uploads are staged here and renamed into place on commit; keep it on the same volume
+    UPLOAD_STAGING_FOLDER = os.getenv("UPLOAD_STAGING_FOLDER", os.path.join(basedir, "uploads/.staging"))
+    # staged operations older than this (seconds) are settled by `flask uploads reconcile`
+    UPLOAD_RECONCILE_GRACE = int(os.getenv("UPLOAD_RECONCILE_GRACE", 3600))
+
+    # upload preprocessing (`flask documents work`): text, page counts, thumbnails, hashes
+    DOCUMENT_ARTIFACTS_FOLDER = os.getenv("DOCUMENT_ARTIFACTS_FOLDER", os.path.join(basedir, "uploads/derived"))
+    DOCUMENT_WORKERS = int(os.getenv("DOCUMENT_WORKERS", os.cpu_count() or 2))
+    DOCUMENT_POLL_INTERVAL = float(os.getenv("DOCUMENT_POLL_INTERVAL", 2))
+    DOCUMENT_CLAIM_TIMEOUT = int(os.getenv("DOCUMENT_CLAIM_TIMEOUT", 600))
+    DOCUMENT_MAX_ATTEMPTS = int(os.getenv("DOCUMENT_MAX_ATTEMPTS", 3))
+    DOCUMENT_THUMBNAIL_PX = int(os.getenv("DOCUMENT_THUMBNAIL_PX", 320))
+    DOCUMENT_TEXT_MAX_CHARS = int(os.getenv("DOCUMENT_TEXT_MAX_CHARS", 1_000_000))
+
+    # time-based transitions (chat warning expiry, bid response deadlines, overdue orders):
+    # run by `flask sweeps run` from cron, or every SWEEP_INTERVAL seconds in-process with SWEEPS_ENABLED
+    SWEEPS_ENABLED = os.getenv("SWEEPS_ENABLED", "false").lower() == "true"
+    SWEEP_INTERVAL = float(os.getenv("SWEEP_INTERVAL", 60))
+    SWEEP_BATCH_SIZE = int(os.getenv("SWEEP_BATCH_SIZE", 500))
+
+    # seconds a leaderboard snapshot is served before being rebuilt
+    LEADERBOARD_SNAPSHOT_TTL = int(os.getenv("LEADERBOARD_SNAPSHOT_TTL", 60))
+
+    # writer search: "auto" uses pg_trgm on PostgreSQL and an in-memory trigram index elsewhere
+    USER_SEARCH_BACKEND = os.getenv("USER_SEARCH_BACKEND", "auto")
+    USER_SEARCH_INDEX_TTL = int(os.getenv("USER_SEARCH_INDEX_TTL", 300))
+
+    # response cache: "memory" (per-process LRU) or "redis" (shared, needs RESPONSE_CACHE_URL)
+    RESPONSE_CACHE_ENABLED = os.getenv("RESPONSE_CACHE_ENABLED", "true").lower() == "true"
+    RESPONSE_CACHE_BACKEND = os.getenv("RESPONSE_CACHE_BACKEND", "memory")
+    RESPONSE_CACHE_URL = os.getenv("RESPONSE_CACHE_URL")
+    RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", 2048))
 
 class DevelopmentConfig(Config):
     DEBUG = True
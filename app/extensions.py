@@ -1,34 +1,30 @@
-from sqlalchemy.dialects.postgresql.base import PGDialect
-import re
+from app.utils.db_tuning import patch_pg_version_detection
 
-old_initialize = PGDialect.initialize
-
-def patched_initialize(self, connection):
-    try:
-        old_initialize(self, connection)
-    except AssertionError:
-        version_string = connection.exec_driver_sql("SELECT version()").scalar()
-        match = re.search(r"v?(\d+\.\d+)", version_string)
-        if match:
-            self.server_version_info = tuple(map(int, match.group(1).split(".")))
-        else:
-            self.server_version_info = (25, 0)  # fallback
-
-PGDialect.initialize = patched_initialize
+# CockroachDB's version() string trips PGDialect's parser; applied once per process
+patch_pg_version_detection()
 
 from flask_sqlalchemy import SQLAlchemy
-from flask_migrate import Migrate
 from flask_jwt_extended import JWTManager
 from flask_marshmallow import Marshmallow
 from flask_cors import CORS
 from flask_limiter import Limiter
-from flask_limiter.util import get_remote_address
 from flask_bcrypt import Bcrypt
+from app.utils.response_cache import ResponseCache
+from app.utils.token_store import TokenStore
+from app.utils.instrumentation import QueryInstrumentation
+from app.utils.metrics import MetricsRegistry
+from app.utils.rate_limits import rate_limit_key, deduct
+from app.utils.db_routing import RoutingSession
 
-db = SQLAlchemy()
-migrate = Migrate()
+# RoutingSession sends GET-request reads to replica binds when DATABASE_REPLICA_URLS is set
+db = SQLAlchemy(session_options={"class_": RoutingSession})
 jwt = JWTManager()
 ma = Marshmallow()
 cors = CORS()
 bcrypt = Bcrypt()
-limiter = Limiter(key_func=get_remote_address, default_limits=["600 per hour"])
+# limits, storage and strategy come from RATELIMIT_* config (see app.utils.rate_limits)
+limiter = Limiter(key_func=rate_limit_key, default_limits_deduct_when=deduct)
+response_cache = ResponseCache()
+token_store = TokenStore()
+instrumentation = QueryInstrumentation()
+metrics = MetricsRegistry()
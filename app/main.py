@@ -1,20 +1,29 @@
-from flask import Flask, jsonify
+from flask import Flask, jsonify, request
 from .config import DevelopmentConfig, ProductionConfig
-from .extensions import db, migrate, jwt, ma, cors, limiter, bcrypt
+from .extensions import db, jwt, ma, cors, limiter, bcrypt, response_cache, token_store, instrumentation, metrics
 import os
+from sqlalchemy.exc import TimeoutError as SQLAlchemyTimeoutError
 from flask_cors import CORS
 
 def create_app(config_name=None):
     app = Flask(__name__, instance_relative_config=False)
+    from app.utils.json_provider import FastJSONProvider
+    app.json = FastJSONProvider(app)
     env = os.getenv("FLASK_ENV", "development")
     if env == "production":
         app.config.from_object(ProductionConfig)
     else:
         app.config.from_object(DevelopmentConfig)
 
+    from app.utils.log_config import configure_logging
+    configure_logging(app)
+
     # initialize extensions
     db.init_app(app)
-    migrate.init_app(app, db)
+    from app.utils import db_tuning
+    db_tuning.init_app(app, db)
+    from app.utils import db_routing
+    db_routing.init_app(app, db)
     jwt.init_app(app)
     ma.init_app(app)
     origins = [o.strip() for o in app.config["CORS_ORIGINS"].split(",")]
@@ -27,6 +36,10 @@ def create_app(config_name=None):
     )
     bcrypt.init_app(app)
     limiter.init_app(app)
+    response_cache.init_app(app)
+    token_store.init_app(app)
+    instrumentation.init_app(app)
+    metrics.init_app(app)
 
     # register blueprints
     from app.routes.auth_routes import bp as auth_bp
@@ -43,6 +56,8 @@ def create_app(config_name=None):
     from app.routes.admin_writers import bp as admin_writers_bp
     from app.routes.user_routes import bp as user_bp
     from app.routes.submission_routes import bp as submission_bp
+    from app.routes.system_routes import bp as system_bp
+    from app.routes.document_routes import bp as document_bp
 
     # available orders optional
     try:
@@ -65,6 +80,15 @@ def create_app(config_name=None):
     app.register_blueprint(admin_writers_bp)
     app.register_blueprint(user_bp)
     app.register_blueprint(submission_bp)
+    app.register_blueprint(system_bp)
+    app.register_blueprint(document_bp)
+
+    from app.cli import register_cli
+    register_cli(app)
+
+    if app.config["SWEEPS_ENABLED"]:
+        from app.services.sweep_service import start_scheduler
+        start_scheduler(app)
 
     # error handlers to match required error format
     from app.utils.response_formatter import error_response
@@ -77,10 +101,20 @@ def create_app(config_name=None):
     def unauthorized(e):
         return error_response("UNAUTHORIZED", str(e), status=401)
 
+    @app.errorhandler(429)
+    def rate_limited(e):
+        metrics.rate_limited.inc(endpoint=request.endpoint or "unmatched")
+        return error_response("RATE_LIMITED", "Too many requests, please slow down", status=429)
+
     @app.errorhandler(404)
     def not_found(e):
         return error_response("NOT_FOUND", "Resource not found", status=404)
 
+    @app.errorhandler(SQLAlchemyTimeoutError)
+    def pool_exhausted(e):
+        app.logger.error("database pool exhausted: %s", e)
+        return error_response("SERVICE_UNAVAILABLE", "Server is busy, please retry shortly", status=503)
+
     @app.errorhandler(500)
     def server_error(e):
         return error_response("SERVER_ERROR", "Internal server error", status=500)
@@ -19,17 +19,23 @@ class Bid(db.Model):
     is_counter_offer = db.Column(db.Boolean, default=False)
 
     submitted_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, onupdate=datetime.utcnow)
     response_deadline = db.Column(db.DateTime)
 
     # Relationships
     order = db.relationship("Order", backref=db.backref("bids", lazy=True, cascade="all, delete-orphan"))
     user = db.relationship("User", backref=db.backref("bids", lazy=True))
 
+    __table_args__ = (
+        # the bid-expiry sweep: open bids past their response deadline
+        db.Index("ix_bids_status_response_deadline", "status", "response_deadline"),
+    )
+
     def get_derived_status(self) -> str:
         """
         Compute the effective status for the bid, including unconfirmed bids.
         """
-        if self.status in ["accepted", "rejected", "cancelled"]:
+        if self.status in ["accepted", "rejected", "cancelled", "expired"]:
             return self.status
         if self.order and self.order.updated_at and self.order.updated_at > self.submitted_at:
             return "unconfirmed"
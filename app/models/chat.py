@@ -14,8 +14,8 @@ class Chat(db.Model):
     order_id = db.Column(db.String(50), db.ForeignKey("orders.id"), nullable=False)
 
     # Two participants explicitly: client and writer
-    client_id = db.Column(db.String(50), db.ForeignKey("users.id"), nullable=False)
-    writer_id = db.Column(db.String(50), db.ForeignKey("users.id"), nullable=False)
+    client_id = db.Column(db.String(50), db.ForeignKey("users.id"), nullable=False, index=True)
+    writer_id = db.Column(db.String(50), db.ForeignKey("users.id"), nullable=False, index=True)
 
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
@@ -32,4 +32,6 @@ class Chat(db.Model):
 
     __table_args__ = (
         db.UniqueConstraint("order_id", "client_id", "writer_id", name="uq_chat_order_client_writer"),
+        # the warning-expiry sweep
+        db.Index("ix_chats_warning_expires", "warning_active", "warning_expires_at"),
     )
@@ -8,3 +8,7 @@ class DeclinedOrder(db.Model):
     writer_id = db.Column(db.String, db.ForeignKey("users.id"), nullable=False)
     reason = db.Column(db.String(255))
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        db.Index("ix_declined_orders_writer_order", "writer_id", "order_id"),
+    )
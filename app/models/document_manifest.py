@@ -0,0 +1,40 @@
+from app.extensions import db
+from datetime import datetime
+
+class DocumentManifest(db.Model):
+    """
+    Derived data for one uploaded file, filled in by `flask documents work`.
+
+    The table doubles as the job queue: rows start "pending", are claimed as
+    "processing" and end "done" or "failed".
+    """
+    __tablename__ = "document_manifests"
+
+    id = db.Column(db.Integer, primary_key=True)
+    owner_type = db.Column(db.String(20), nullable=False)  # "application" | "submission"
+    owner_id = db.Column(db.String(50), nullable=False)
+    kind = db.Column(db.String(30), nullable=False)        # essay, cv, work_sample, degree_certificate, submission
+    path = db.Column(db.String(512), nullable=False)       # original upload, absolute
+    filename = db.Column(db.String(255), nullable=False)
+
+    content_type = db.Column(db.String(120))
+    size_bytes = db.Column(db.BigInteger)
+    sha256 = db.Column(db.String(64), index=True)
+    page_count = db.Column(db.Integer)
+    text_excerpt = db.Column(db.Text)
+    text_path = db.Column(db.String(512))
+    thumbnail_path = db.Column(db.String(512))
+
+    status = db.Column(db.String(20), nullable=False, default="pending")
+    error = db.Column(db.Text)
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    claim_token = db.Column(db.String(32))
+    claimed_at = db.Column(db.DateTime)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    processed_at = db.Column(db.DateTime)
+
+    __table_args__ = (
+        db.Index("ix_document_manifests_owner", "owner_type", "owner_id"),
+        # worker claim scan: oldest pending first
+        db.Index("ix_document_manifests_status", "status", "id"),
+    )
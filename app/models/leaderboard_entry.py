@@ -0,0 +1,21 @@
+from app.extensions import db
+from datetime import datetime
+
+class LeaderboardEntry(db.Model):
+    """Per-period earnings rollup, maintained incrementally as earnings complete."""
+    __tablename__ = "leaderboard_entries"
+
+    id = db.Column(db.Integer, primary_key=True)
+    period = db.Column(db.String(10), nullable=False)  # week | month | all
+    period_start = db.Column(db.DateTime, nullable=False)
+    user_id = db.Column(db.String(50), db.ForeignKey("users.id"), nullable=False)
+    total_earned = db.Column(db.Float, nullable=False, default=0.0)
+    orders_completed = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    user = db.relationship("User", lazy=True)
+
+    __table_args__ = (
+        db.UniqueConstraint("period", "period_start", "user_id", name="uq_leaderboard_period_user"),
+        db.Index("ix_leaderboard_period_total", "period", "period_start", "total_earned"),
+    )
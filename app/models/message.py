@@ -16,3 +16,8 @@ class Message(db.Model):
 
     chat = db.relationship("Chat", backref="messages", lazy=True)
     sender = db.relationship("User", backref="messages", lazy=True)
+
+    __table_args__ = (
+        # leading chat_id also serves the plain per-chat history lookups
+        db.Index("ix_messages_chat_read_sender", "chat_id", "is_read", "sender_id"),
+    )
@@ -23,7 +23,7 @@ class Notification(db.Model):
     message = db.Column(db.Text, nullable=False)
     details = db.Column(db.JSON, nullable=True)
 
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
 
     # Relationships
     sender = db.relationship("User", foreign_keys=[sender_id], backref="sent_notifications", lazy=True)
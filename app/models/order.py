@@ -14,18 +14,28 @@ class Order(db.Model):
     pages = db.Column(db.Integer, default=1)
     deadline = db.Column(db.DateTime)
     budget = db.Column(db.Float, default=0.0)
-    status = db.Column(db.String(50), default="in_progress")
-    client_id = db.Column(db.String(50), db.ForeignKey("users.id"), nullable=True)
-    writer_id = db.Column(db.String(50), db.ForeignKey("users.id"), nullable=True)
+    status = db.Column(db.String(50), default="in_progress", index=True)
+    client_id = db.Column(db.String(50), db.ForeignKey("users.id"), nullable=True, index=True)
+    writer_id = db.Column(db.String(50), db.ForeignKey("users.id"), nullable=True, index=True)
     progress = db.Column(db.Integer, default=0)
     description = db.Column(db.Text)
     requirements = db.Column(db.Text)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
     updated_at = db.Column(db.DateTime, onupdate=datetime.utcnow)
+    # set by the overdue-orders sweep once the deadline passes unfinished; cleared when the deadline moves
+    overdue_at = db.Column(db.DateTime, nullable=True)
     minimum_allowed_budget = db.Column(db.Float, nullable=False)
-    tags = db.Column(db.ARRAY(db.String), default=list)
+    # JSON on SQLite (tests, benchmarks); ARRAY everywhere else
+    tags = db.Column(db.ARRAY(db.String).with_variant(db.JSON, "sqlite"), default=list)
     detailed_requirements = db.Column(db.Text)
     additional_notes = db.Column(db.Text)
+    # last allocated submission number; bumped with UPDATE ... RETURNING by create_submission
+    submission_counter = db.Column(db.Integer, nullable=False, default=0, server_default="0")
 
     client = db.relationship("User", foreign_keys=[client_id], backref="client_orders", lazy=True)
     writer = db.relationship("User", foreign_keys=[writer_id], backref="writer_orders", lazy=True)
+
+    __table_args__ = (
+        # the overdue-orders sweep: unfinished orders past their deadline
+        db.Index("ix_orders_status_deadline", "status", "deadline"),
+    )
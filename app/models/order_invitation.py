@@ -6,7 +6,7 @@ class OrderInvitation(db.Model):
     __tablename__ = "order_invitations"
     id = db.Column(db.String(50), primary_key=True, default=lambda: f"INV-{uuid.uuid4().hex[:8]}")
     order_id = db.Column(db.String(50), db.ForeignKey("orders.id"), nullable=False)
-    writer_id = db.Column(db.String(50), db.ForeignKey("users.id"), nullable=False)
+    writer_id = db.Column(db.String(50), db.ForeignKey("users.id"), nullable=False, index=True)
     invited_at = db.Column(db.DateTime, default=datetime.utcnow)
 
     order = db.relationship("Order", backref=db.backref("invitations", lazy=True, cascade="all, delete-orphan"))
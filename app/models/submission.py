@@ -9,7 +9,7 @@ class Submission(db.Model):
     __tablename__ = "submissions"
 
     id = db.Column(db.String(50), primary_key=True, default=gen_submission_id)
-    order_id = db.Column(db.String(50), db.ForeignKey("orders.id"), nullable=False)
+    order_id = db.Column(db.String(50), db.ForeignKey("orders.id"), nullable=False, index=True)
     submission_number = db.Column(db.Integer, nullable=False)
 
     writer_id = db.Column(db.String(50), db.ForeignKey("users.id"), nullable=False)
@@ -24,7 +24,9 @@ class Submission(db.Model):
     order = db.relationship("Order", backref="submissions", lazy=True)
     writer = db.relationship("User", lazy=True)
 
-    db.UniqueConstraint("order_id", "submission_number")
+    __table_args__ = (
+        db.UniqueConstraint("order_id", "submission_number", name="uq_submissions_order_number"),
+    )
 
     def to_dict(self):
         return {
@@ -17,3 +17,7 @@ class Transaction(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
     user = db.relationship("User", backref="transactions", lazy=True)
+
+    __table_args__ = (
+        db.Index("ix_transactions_user_type_status", "user_id", "type", "status"),
+    )
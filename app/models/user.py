@@ -13,18 +13,32 @@ class User(db.Model):
     email = db.Column(db.String(255), unique=True, nullable=False, index=True)
     password_hash = db.Column(db.String(255), nullable=False)
     full_name = db.Column(db.String(255))
-    role = db.Column(db.String(50), nullable=False)
+    role = db.Column(db.String(50), nullable=False, index=True)
     profile_image = db.Column(db.String(1024), nullable=True)
     rating = db.Column(db.Float, default=0.0)
     completed_orders = db.Column(db.Integer, default=0)
     bio = db.Column(db.Text, nullable=True)
     total_earned = db.Column(db.Float, default=0.0)
     joined_at = db.Column(db.DateTime, default=datetime.utcnow)
-    application_status = db.Column(db.String(50), default="not_applied")
+    updated_at = db.Column(db.DateTime, onupdate=datetime.utcnow)
+    application_status = db.Column(db.String(50), default="not_applied", index=True)
     is_verified = db.Column(db.Boolean, default=False)
     country = db.Column(db.String(100), nullable=True)
     account_status = db.Column(db.String(50), default="awaiting_initial_deposit")
 
+    __table_args__ = (
+        # trigram GIN index for fuzzy writer search (needs pg_trgm; plain index elsewhere)
+        db.Index(
+            "ix_users_full_name_trgm", "full_name",
+            postgresql_using="gin", postgresql_ops={"full_name": "gin_trgm_ops"},
+        ),
+        # substring search on email for the admin directory; ix_users_email covers the rest
+        db.Index(
+            "ix_users_email_trgm", "email",
+            postgresql_using="gin", postgresql_ops={"email": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
+
     def to_dict(self):
         return {
             "id": self.id,
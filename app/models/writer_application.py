@@ -8,7 +8,7 @@ class WriterApplication(db.Model):
     __tablename__ = "writer_applications"
 
     id = db.Column(db.String, primary_key=True)
-    user_id = db.Column(db.String, db.ForeignKey("users.id"), nullable=False)
+    user_id = db.Column(db.String, db.ForeignKey("users.id"), nullable=False, index=True)
     country = db.Column(db.String(100))
     city = db.Column(db.String(100))
     education = db.Column(db.String(120))
@@ -24,6 +24,8 @@ class WriterApplication(db.Model):
     work_samples = db.Column(db.JSON, default=list)
     degree_certificates = db.Column(db.JSON, default=list)
     cv_file_path = db.Column(db.String(255))
+    # upload paths relative to UPLOAD_FOLDER: {"essay", "cv", "work_samples", "degree_certificates"}
+    file_manifest = db.Column(db.JSON, nullable=True)
 
     status = db.Column(db.String(50), default="pending")
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
@@ -32,6 +34,12 @@ class WriterApplication(db.Model):
 
     user = db.relationship("User", backref=db.backref("writer_application", uselist=False))
 
+    __table_args__ = (
+        # review queue: newest first, optionally filtered by status
+        db.Index("ix_writer_applications_status_created", "status", "created_at", "id"),
+        db.Index("ix_writer_applications_created", "created_at", "id"),
+    )
+
 def serialize(self):
     return {
         "id": self.id,
@@ -0,0 +1,39 @@
+from app.extensions import db
+from datetime import datetime
+
+class WriterStats(db.Model):
+    """Per-writer performance rollup, refreshed for the writers each commit touches."""
+    __tablename__ = "writer_stats"
+
+    user_id = db.Column(db.String(50), db.ForeignKey("users.id"), primary_key=True)
+    rating = db.Column(db.Float, nullable=False, default=0.0)
+    completed_orders = db.Column(db.Integer, nullable=False, default=0)
+    total_earned = db.Column(db.Float, nullable=False, default=0.0)
+    active_orders = db.Column(db.Integer, nullable=False, default=0)
+    delivered_orders = db.Column(db.Integer, nullable=False, default=0)   # orders with at least one submission
+    on_time_deliveries = db.Column(db.Integer, nullable=False, default=0)  # first submission by the deadline
+    revised_orders = db.Column(db.Integer, nullable=False, default=0)      # delivered more than once
+    bid_count = db.Column(db.Integer, nullable=False, default=0)
+    bid_total = db.Column(db.Float, nullable=False, default=0.0)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    user = db.relationship("User", lazy=True)
+
+    __table_args__ = (
+        # roster sort keys; user_id breaks ties for keyset pagination
+        db.Index("ix_writer_stats_rating", "rating", "user_id"),
+        db.Index("ix_writer_stats_completed", "completed_orders", "user_id"),
+        db.Index("ix_writer_stats_earned", "total_earned", "user_id"),
+    )
+
+    @property
+    def on_time_rate(self):
+        return round(self.on_time_deliveries / self.delivered_orders, 3) if self.delivered_orders else None
+
+    @property
+    def revision_rate(self):
+        return round(self.revised_orders / self.delivered_orders, 3) if self.delivered_orders else None
+
+    @property
+    def average_bid(self):
+        return round(self.bid_total / self.bid_count, 2) if self.bid_count else None
@@ -1,57 +1,49 @@
 from flask import Blueprint, request
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from flask_jwt_extended import jwt_required
 from app.extensions import db
 from app.models.user import User
-from app.models.order import Order
+from app.services.client_directory_service import SORTS, MAX_DIRECTORY_LIMIT, list_client_directory
 from app.utils.response_formatter import success_response, error_response
+from app.utils.auth_utils import admin_required, invalidate_user_claims
+from app.utils.instrumentation import query_budget
 
 bp = Blueprint("admin_clients", __name__, url_prefix="/api/v1/admin/clients")
 
 # ---- List all clients ----
 @bp.route("", methods=["GET"])
+@query_budget(4)
 @jwt_required()
+@admin_required
 def list_clients():
-    # You can add an is_admin check here if you have roles
-    search = request.args.get("search", "").strip().lower()
+    """
+    Paginated client directory.
+    Query: search, sort=joinedDate|totalOrders|totalSpent, order=asc|desc, limit, cursor
+    """
+    search = request.args.get("search", "").strip()
+    sort = request.args.get("sort", "joinedDate")
+    order = request.args.get("order", "desc")
+    if sort not in SORTS or order not in ("asc", "desc"):
+        return error_response("VALIDATION_ERROR", f"sort must be one of {', '.join(SORTS)}; order asc or desc", status=400)
+    try:
+        limit = max(1, min(int(request.args.get("limit", 50)), MAX_DIRECTORY_LIMIT))
+    except ValueError:
+        return error_response("VALIDATION_ERROR", "limit must be an integer", status=400)
 
-    q = User.query.filter(User.role == "client")
-    if search:
-        q = q.filter(
-            db.or_(
-                User.full_name.ilike(f"%{search}%"),
-                User.email.ilike(f"%{search}%"),
-                User.id.ilike(f"%{search}%"),
-            )
+    try:
+        data = list_client_directory(
+            search=search, sort=sort, descending=order == "desc",
+            limit=limit, cursor=request.args.get("cursor"),
         )
+    except ValueError as e:
+        return error_response("VALIDATION_ERROR", str(e), status=400)
 
-    clients = q.order_by(User.joined_at.desc()).all()
-
-    results = []
-    for c in clients:
-        total_orders = Order.query.filter_by(client_id=c.id).count()
-        total_spent = (
-            db.session.query(db.func.sum(Order.budget))
-            .filter(Order.client_id == c.id)
-            .scalar()
-            or 0
-        )
-        results.append({
-            "id": c.id,
-            "name": c.full_name,
-            "email": c.email,
-            "phone": getattr(c, "phone", None),
-            "joinedDate": c.joined_at.strftime("%Y-%m-%d"),
-            "totalOrders": total_orders,
-            "totalSpent": total_spent,
-            "status": "active" if c.is_verified else "suspended",
-        })
-
-    return success_response({"clients": results})
+    return success_response(data)
 
 
 # ---- Suspend a client ----
 @bp.route("/<client_id>/suspend", methods=["PATCH"])
 @jwt_required()
+@admin_required
 def suspend_client(client_id):
     client = User.query.get(client_id)
     if not client or client.role != "client":
@@ -59,12 +51,14 @@ def suspend_client(client_id):
 
     client.is_verified = False
     db.session.commit()
+    invalidate_user_claims(client.id)
     return success_response({"id": client.id, "status": "suspended"})
 
 
 # ---- Activate a client ----
 @bp.route("/<client_id>/activate", methods=["PATCH"])
 @jwt_required()
+@admin_required
 def activate_client(client_id):
     client = User.query.get(client_id)
     if not client or client.role != "client":
@@ -72,4 +66,5 @@ def activate_client(client_id):
 
     client.is_verified = True
     db.session.commit()
+    invalidate_user_claims(client.id)
     return success_response({"id": client.id, "status": "active"})
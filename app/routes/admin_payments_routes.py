@@ -1,23 +1,28 @@
 from flask import Blueprint, request
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from flask_jwt_extended import jwt_required
 from app.models.user import User
 from app.models.transaction import Transaction
 from app.utils.response_formatter import success_response, error_response
 from app.extensions import db
 from sqlalchemy import or_
-from app.services.payment_service import get_balance_for_user
+from sqlalchemy.orm import joinedload
+from app.services.payment_service import get_balances_for_users
 from app.services.notification_service import send_notification_to_user
+from app.utils.auth_utils import role_required
+from app.utils.instrumentation import query_budget
+from app.utils.db_tuning import statement_timeout
+from app.services.export_service import (
+    EXPORT_FORMATS,
+    ADMIN_WITHDRAWAL_EXPORT_COLUMNS,
+    build_export_query,
+    parse_date_filter,
+    stream_export,
+    EXPORT_STATEMENT_TIMEOUT_MS,
+)
 
 bp = Blueprint("admin_payments", __name__, url_prefix="/api/v1/admin")
 
-def require_admin():
-    uid = get_jwt_identity()
-    user = User.query.get(uid)
-
-    if not user or user.role != "admin":
-        return None, error_response("FORBIDDEN", "Admin access required", status=403)
-
-    return user, None
+require_admin = role_required("admin", message="Admin access required")
 
 
 # ==========================================================
@@ -28,12 +33,10 @@ def require_admin():
 #    search (writer name or email)
 # ==========================================================
 @bp.route("/withdrawals", methods=["GET"])
+@query_budget(8)
 @jwt_required()
+@require_admin
 def admin_list_withdrawals():
-    admin, err = require_admin()
-    if err:
-        return err
-
     page = int(request.args.get("page", 1))
     limit = int(request.args.get("limit", 20))
     status = request.args.get("status")
@@ -54,17 +57,18 @@ def admin_list_withdrawals():
 
     total = q.count()
     items = (
-        q.order_by(Transaction.created_at.desc())
+        q.options(joinedload(Transaction.user))
+        .order_by(Transaction.created_at.desc())
         .offset((page - 1) * limit)
         .limit(limit)
         .all()
     )
+    # balance snapshots for every writer on the page in one grouped query
+    balances = get_balances_for_users(t.user_id for t in items)
 
     withdrawals = []
     for t in items:
-
-        # NEW: balance snapshot
-        balance_snapshot = get_balance_for_user(t.user)
+        balance_snapshot = balances[t.user_id]
 
         withdrawals.append({
             "id": t.id,
@@ -90,16 +94,50 @@ def admin_list_withdrawals():
     return success_response({"withdrawals": withdrawals, "pagination": pagination})
 
 
+# ==========================================================
+#  GET /admin/withdrawals/export
+#  Streams every matching withdrawal as CSV/NDJSON for finance
+#  reconciliation (no COUNT/OFFSET per page).
+#  Filters:
+#    status=pending|approved|rejected
+#    search (writer name or email)
+#    from, to (ISO dates)
+#    format=csv|ndjson
+# ==========================================================
+@bp.route("/withdrawals/export", methods=["GET"])
+@jwt_required()
+@require_admin
+@statement_timeout(EXPORT_STATEMENT_TIMEOUT_MS)
+def admin_export_withdrawals():
+    fmt = request.args.get("format", "csv").lower()
+    if fmt not in EXPORT_FORMATS:
+        return error_response("VALIDATION_ERROR", "format must be 'csv' or 'ndjson'", status=422)
+
+    try:
+        date_from = parse_date_filter(request.args.get("from"))
+        date_to = parse_date_filter(request.args.get("to"))
+    except ValueError as e:
+        return error_response("VALIDATION_ERROR", str(e), status=422)
+
+    q = build_export_query(
+        ADMIN_WITHDRAWAL_EXPORT_COLUMNS,
+        ttype="withdrawal",
+        status=request.args.get("status"),
+        search=request.args.get("search"),
+        date_from=date_from,
+        date_to=date_to,
+        join_user=True,
+    )
+    return stream_export(q, ADMIN_WITHDRAWAL_EXPORT_COLUMNS, fmt, "withdrawals")
+
+
 # ==========================================================
 #  PATCH /admin/withdrawals/<id>/approve
 # ==========================================================
 @bp.route("/withdrawals/<wid>/approve", methods=["PATCH"])
 @jwt_required()
+@require_admin
 def admin_approve_withdrawal(wid):
-    admin, err = require_admin()
-    if err:
-        return err
-
     txn = Transaction.query.filter_by(id=wid, type="withdrawal").first()
     if not txn:
         return error_response("NOT_FOUND", "Withdrawal request not found", status=404)
@@ -129,11 +167,8 @@ def admin_approve_withdrawal(wid):
 # ==========================================================
 @bp.route("/withdrawals/<wid>/reject", methods=["PATCH"])
 @jwt_required()
+@require_admin
 def admin_reject_withdrawal(wid):
-    admin, err = require_admin()
-    if err:
-        return err
-
     txn = Transaction.query.filter_by(id=wid, type="withdrawal").first()
     if not txn:
         return error_response("NOT_FOUND", "Withdrawal request not found", status=404)
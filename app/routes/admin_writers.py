@@ -1,57 +1,47 @@
-from flask import Blueprint
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from flask import Blueprint, request
+from flask_jwt_extended import jwt_required
 from app.extensions import db
 from app.models.user import User
 from app.utils.response_formatter import success_response, error_response
-from sqlalchemy import or_, and_
+from app.utils.auth_utils import admin_required, invalidate_user_claims
+from app.utils.instrumentation import query_budget
+from app.services.writer_stats_service import SORTS, MAX_ROSTER_LIMIT, list_writer_roster
 
 bp = Blueprint("admin_writers", __name__, url_prefix="/api/v1/admin/writers")
 
-def admin_required(user):
-    return user and user.role == "admin"
-
 @bp.route("", methods=["GET"])
+@query_budget(4)
 @jwt_required()
+@admin_required
 def list_writers():
-    uid = get_jwt_identity()
-    admin = User.query.get(uid)
-    if not admin_required(admin):
-        return error_response("FORBIDDEN", "Admin privileges required", status=403)
-
-    writers = User.query.filter(
-        User.role == "writer",
-        or_(
-            User.application_status == "approved",
-            User.application_status == "awaiting_initial_deposit"
+    """
+    Paginated writer roster with performance stats.
+    Query: sort=rating|completed_orders|total_earned, order=asc|desc, account_status (comma-separated), limit, cursor
+    """
+    sort = request.args.get("sort", "rating")
+    order = request.args.get("order", "desc")
+    if sort not in SORTS or order not in ("asc", "desc"):
+        return error_response("VALIDATION_ERROR", f"sort must be one of {', '.join(SORTS)}; order asc or desc", status=400)
+    try:
+        limit = max(1, min(int(request.args.get("limit", 50)), MAX_ROSTER_LIMIT))
+    except ValueError:
+        return error_response("VALIDATION_ERROR", "limit must be an integer", status=400)
+    account_statuses = [s.strip() for s in request.args.get("account_status", "").split(",") if s.strip()]
+
+    try:
+        data = list_writer_roster(
+            sort=sort, descending=order == "desc", account_statuses=account_statuses,
+            limit=limit, cursor=request.args.get("cursor"),
         )
-    ).all()
-
-    data = [
-        {
-            "id": w.id,
-            "email": w.email,
-            "full_name": w.full_name,
-            "rating": w.rating,
-            "completed_orders": w.completed_orders,
-            "total_earned": w.total_earned,
-            "joined_at": w.joined_at.isoformat() if w.joined_at else None,
-            "status": "active" if w.is_verified else "suspended-temporary",
-            "account_status": w.account_status
-        }
-        for w in writers
-    ]
-
-    return success_response({"writers": data})
+    except ValueError as e:
+        return error_response("VALIDATION_ERROR", str(e), status=400)
 
+    return success_response(data)
 
 @bp.route("/<string:user_id>/approve-deposit", methods=["PATCH"])
 @jwt_required()
+@admin_required
 def approve_deposit(user_id):
-    uid = get_jwt_identity()
-    admin = User.query.get(uid)
-    if not admin_required(admin):
-        return error_response("FORBIDDEN", "Admin privileges required", status=403)
-
     writer = User.query.get(user_id)
     if not writer:
         return error_response("NOT_FOUND", "Writer not found", 404)
@@ -63,6 +53,7 @@ def approve_deposit(user_id):
     writer.is_verified = True  # allow access to orders
 
     db.session.commit()
+    invalidate_user_claims(writer.id)
 
     return success_response({
         "message": "Writer deposit verified. Account activated.",
@@ -1,3 +1,4 @@
+import logging
 from flask import (
     Blueprint, request, url_for, send_file, current_app
 )
@@ -5,21 +6,29 @@ from flask_jwt_extended import jwt_required, get_jwt_identity
 from app.extensions import db
 from app.models.user import User
 from app.models.writer_application import WriterApplication
-from app.services.application_service import create_writer_application
+from app.services.application_service import create_writer_application, file_manifest
+from app.services.document_service import documents_for, serialize_document
+from app.services.user_search_service import escape_like
 from app.utils.response_formatter import success_response, error_response
+from app.utils.auth_utils import admin_required, get_current_user, invalidate_user_claims
+from app.utils.instrumentation import query_budget
+from app.utils.pagination import keyset_paginate
+from sqlalchemy.orm import contains_eager, load_only
+from urllib.parse import quote
 from datetime import datetime
 import os 
 from flask import current_app
 
+MAX_APPLICATIONS_LIMIT = 200
+
 bp = Blueprint("applications", __name__, url_prefix="/api/v1/applications")
 
+logger = logging.getLogger(__name__)
+
 @bp.route("/apply-writer", methods=["POST"])
 @jwt_required()
 def apply_writer():
-    print("Authorization header:", request.headers.get("Authorization"))
-    uid = get_jwt_identity()
-    print(f"user_id = {uid}")
-    user = User.query.get(uid)
+    user = get_current_user()
     if not user:
         return error_response("NOT_FOUND", "User not found", status=404)
 
@@ -43,33 +52,38 @@ def apply_writer():
         })
     except Exception as e:
         db.session.rollback()
-        print(f"error = {str(e)}")
+        logger.warning("writer application failed: %s", e)
         return error_response("APPLICATION_ERROR", str(e), status=400)
 
 
-def admin_required(user):
-    """Ensure that the current user has admin privileges."""
-    if not user or user.role.lower() != "admin":
-        return False
-    return True
-
-
 # ------------------------------------------
 # 1. LIST ALL APPLICATIONS (Already implemented)
 # ------------------------------------------
 
 @bp.route("/all", methods=["GET"])
+@query_budget(4)
 @jwt_required()
+@admin_required
 def list_applications():
-    uid = get_jwt_identity()
-    user = User.query.get(uid)
-    if not admin_required(user):
-        return error_response("FORBIDDEN", "Admin privileges required", status=403)
-
+    """
+    Review queue, newest first. Query: status, search, limit, cursor
+    """
     status = request.args.get("status")
-    search = request.args.get("search", "").strip().lower()
-
-    query = WriterApplication.query.join(User).order_by(WriterApplication.created_at.desc())
+    search = request.args.get("search", "").strip()
+    try:
+        limit = max(1, min(int(request.args.get("limit", 50)), MAX_APPLICATIONS_LIMIT))
+    except ValueError:
+        return error_response("VALIDATION_ERROR", "limit must be an integer", status=400)
+
+    # summary columns only; the answers, prompt response and file lists stay in the database
+    query = (
+        WriterApplication.query.join(User)
+        .options(
+            load_only(WriterApplication.id, WriterApplication.user_id,
+                      WriterApplication.status, WriterApplication.created_at),
+            contains_eager(WriterApplication.user).load_only(User.id, User.full_name),
+        )
+    )
 
     if status and status != "all":
         query = query.filter(WriterApplication.status == status)
@@ -77,12 +91,18 @@ def list_applications():
     if search:
         query = query.filter(
             db.or_(
-                WriterApplication.id.ilike(f"%{search}%"),
-                User.full_name.ilike(f"%{search}%"),
+                WriterApplication.id == search,
+                User.full_name.ilike(f"%{escape_like(search)}%", escape="\\"),
             )
         )
 
-    apps = query.all()
+    try:
+        apps, next_cursor = keyset_paginate(
+            query, (WriterApplication.created_at, WriterApplication.id),
+            request.args.get("cursor"), limit, scope="applications",
+        )
+    except ValueError as e:
+        return error_response("VALIDATION_ERROR", str(e), status=400)
 
     data = [
         {
@@ -95,9 +115,7 @@ def list_applications():
         for a in apps
     ]
 
-    # print(f"data = {data}")
-
-    return success_response(data)
+    return success_response({"data": data, "pagination": {"limit": limit, "next_cursor": next_cursor}})
 
 
 
@@ -105,19 +123,26 @@ def list_applications():
 # 2. GET APPLICATION DETAILS
 # ------------------------------------------
 
+def _file_url_prefix():
+    # one url_for per response; each file URL is this prefix plus its stored relative path
+    return url_for("applications.serve_file", filename="~", _external=True)[:-1]
+
+
 @bp.route("/<string:application_id>", methods=["GET"])
 @jwt_required()
+@admin_required
 def get_application_details(application_id):
-    uid = get_jwt_identity()
-    user = User.query.get(uid)
-    if not admin_required(user):
-        return error_response("FORBIDDEN", "Admin privileges required", status=403)
-
     app = WriterApplication.query.get(application_id)
     if not app:
         return error_response("NOT_FOUND", "Application not found", status=404)
 
     user_data = app.user
+    manifest = file_manifest(app)
+    prefix = _file_url_prefix()
+
+    def file_url(relative_path):
+        return prefix + quote(relative_path) if relative_path else None
+
     response_data = {
         "id": app.id,
         "user_id": user_data.id,
@@ -132,32 +157,12 @@ def get_application_details(application_id):
         "selected_prompt": app.selected_prompt,
         "prompt_response": app.prompt_response,
         "selected_essay_topic": app.selected_essay_topic,
-        "essay_file_url": (
-            url_for("applications.serve_file",
-                filename=os.path.relpath(app.essay_file_path, current_app.config.get("UPLOAD_FOLDER")),
-                _external=True
-            ) if app.essay_file_path else None
-        ),
-        "cv_file_url": (
-            url_for("applications.serve_file",
-                filename=os.path.relpath(app.cv_file_path, current_app.config.get("UPLOAD_FOLDER")),
-                _external=True
-            ) if app.cv_file_path else None
-        ),
-        "degree_certificates": [
-            url_for("applications.serve_file",
-                filename=os.path.relpath(f, current_app.config.get("UPLOAD_FOLDER")),
-                _external=True
-            )
-            for f in (app.degree_certificates or [])
-        ],
-        "work_samples": [
-            url_for("applications.serve_file",
-                filename=os.path.relpath(f, current_app.config.get("UPLOAD_FOLDER")),
-                _external=True
-            )
-            for f in (app.work_samples or [])
-        ],
+        "essay_file_url": file_url(manifest["essay"]),
+        "cv_file_url": file_url(manifest["cv"]),
+        "degree_certificates": [file_url(f) for f in manifest["degree_certificates"]],
+        "work_samples": [file_url(f) for f in manifest["work_samples"]],
+        # derived previews (page count, text excerpt, thumbnail) once the document worker has run
+        "documents": [serialize_document(d) for d in documents_for("application", [app.id])[app.id]],
         "status": app.status,
         "admin_feedback": getattr(app, "admin_feedback", None),
         "submitted_at": app.created_at.isoformat(),
@@ -171,12 +176,8 @@ def get_application_details(application_id):
 # ------------------------------------------
 @bp.route("/<string:application_id>/approve", methods=["POST"])
 @jwt_required()
+@admin_required
 def approve_application(application_id):
-    uid = get_jwt_identity()
-    admin_user = User.query.get(uid)
-    if not admin_required(admin_user):
-        return error_response("FORBIDDEN", "Admin privileges required", status=403)
-
     app = WriterApplication.query.get(application_id)
     if not app:
         return error_response("NOT_FOUND", "Application not found", status=404)
@@ -199,6 +200,7 @@ def approve_application(application_id):
         user.role = "writer"
 
         db.session.commit()
+        invalidate_user_claims(user.id)
 
         # (Optional) Trigger email notification here
         # send_application_status_email(user.email, "approved", feedback)
@@ -220,12 +222,8 @@ def approve_application(application_id):
 # ------------------------------------------
 @bp.route("/<string:application_id>/reject", methods=["POST"])
 @jwt_required()
+@admin_required
 def reject_application(application_id):
-    uid = get_jwt_identity()
-    admin_user = User.query.get(uid)
-    if not admin_required(admin_user):
-        return error_response("FORBIDDEN", "Admin privileges required", status=403)
-
     app = WriterApplication.query.get(application_id)
     if not app:
         return error_response("NOT_FOUND", "Application not found", status=404)
@@ -248,6 +246,7 @@ def reject_application(application_id):
         user.account_status = "rejected"
 
         db.session.commit()
+        invalidate_user_claims(user.id)
 
         # (Optional) Trigger email notification here
         # send_application_status_email(user.email, "rejected", feedback)
@@ -281,7 +280,7 @@ def serve_file(filename):
             decoded = decode_token(token)
             uid = decoded.get("sub")
         except Exception as e:
-            print(f"Token decode failed: {e}")
+            logger.info("file token decode failed: %s", e)
             return error_response("UNAUTHORIZED", "Invalid or expired token", status=401)
 
     user = User.query.get(uid)
@@ -290,7 +289,7 @@ def serve_file(filename):
     if not user:
         return error_response("FORBIDDEN", "User not found or unauthorized", status=403)
 
-    if not admin_required(user):
+    if user.role.lower() != "admin":
         return error_response("FORBIDDEN", "Admin privileges required", status=403)
 
     try:
@@ -1,14 +1,31 @@
+import logging
 from flask import Blueprint, request, current_app
 from app.services.auth_service import register_user, authenticate_user, generate_tokens_for_user
 from app.utils.response_formatter import success_response, error_response
-from app.extensions import db, jwt
-from app.models.user import User
-from flask_jwt_extended import jwt_required, get_jwt_identity, unset_jwt_cookies
-from app.utils.auth_utils import hash_password, check_password
+from app.extensions import db, jwt, limiter, token_store
+from flask_jwt_extended import jwt_required, get_jwt, unset_jwt_cookies
+from app.utils.auth_utils import hash_password, check_password, get_current_user
+from app.utils.exceptions import ServiceError
+from app.utils.rate_limits import weighted
 
 bp = Blueprint("auth", __name__, url_prefix="/api/v1/auth")
 
+logger = logging.getLogger(__name__)
+
+
+def _login_email_key():
+    data = request.get_json(silent=True) or {}
+    return f"login:{str(data.get('email') or '').strip().lower()}"
+
+
+def _busy_response(e):
+    resp, status = error_response(e.code, e.message, status=503)
+    resp.headers["Retry-After"] = "1"
+    return resp, status
+
+
 @bp.route("/register", methods=["POST"])
+@weighted("password")
 def register():
     data = request.get_json() or {}
     full_name = data.get("full_name")
@@ -39,11 +56,18 @@ def register():
             "access_token": access,
             "refresh_token": refresh
         }, status=200)
+    except ServiceError as e:
+        if e.code == "AUTH_BUSY":
+            return _busy_response(e)
+        return error_response("USER_REGISTER_ERROR", str(e), status=400)
     except Exception as e:
         return error_response("USER_REGISTER_ERROR", str(e), status=400)
 
 
 @bp.route("/login", methods=["POST"])
+# per-email throttle runs in before_request, i.e. before any hashing happens
+@limiter.limit(lambda: current_app.config["LOGIN_RATE_LIMIT"], key_func=_login_email_key)
+@weighted("password")
 def login():
     data = request.get_json() or {}
     email = data.get("email")
@@ -70,13 +94,19 @@ def login():
         }
 
         return success_response(response_data)
+    except ServiceError as e:
+        if e.code == "AUTH_BUSY":
+            return _busy_response(e)
+        return error_response("AUTH_ERROR", "Invalid credentials", status=401)
     except Exception as e:
-        print(f"error = {str(e)}")
+        logger.exception("login failed")
         return error_response("AUTH_ERROR", "Invalid credentials", status=401)
 
 @bp.route("/logout", methods=["POST"])
 @jwt_required()
 def logout():
+    claims = get_jwt()
+    token_store.revoke(claims["jti"], claims["exp"])
     resp = success_response({"message": "Successfully logged out"})
     # unset cookies if you were using cookies; client should discard tokens.
     response, status = resp
@@ -87,8 +117,7 @@ def logout():
 @bp.route("/me", methods=["GET"])
 @jwt_required()
 def me():
-    uid = get_jwt_identity()
-    user = User.query.get(uid)
+    user = get_current_user()
     if not user:
         return error_response("NOT_FOUND", "User not found", status=404)
     return success_response({
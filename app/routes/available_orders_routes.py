@@ -3,11 +3,13 @@ from flask_jwt_extended import jwt_required
 from app.models.order import Order
 from app.utils.response_formatter import success_response
 from app.utils.pagination import paginate_query
+from app.extensions import response_cache
 
 bp = Blueprint("available_orders", __name__, url_prefix="/api/v1")
 
 @bp.route("/available-orders", methods=["GET"])
 @jwt_required()
+@response_cache.cached(ttl=30, tags=("orders",))
 def available_orders():
     subject = request.args.get("subject")
     min_budget = request.args.get("min_budget")
@@ -1,3 +1,4 @@
+import logging
 from flask import Blueprint, request
 from flask_jwt_extended import jwt_required, get_jwt_identity
 
@@ -14,20 +15,27 @@ from app.services.chat_service import (
     sanitize_message
 )
 
-from app.extensions import db
+from app.extensions import db, response_cache
 from app.utils.response_formatter import success_response, error_response
+from app.utils.instrumentation import query_budget
+from app.utils.conditional import conditional
+from app.utils.rate_limits import weighted
+from app.schemas.bid_schema import BID_ROW, BID_WITH_WRITER_ROW
 
 from datetime import datetime
-from sqlalchemy import or_, and_
+from sqlalchemy import or_, and_, func, select
 
 
 
 bp = Blueprint("bids", __name__, url_prefix="/api/v1")
 
+logger = logging.getLogger(__name__)
+
 # ------------------------------------------------------------
 #  GET /bids  —  List bids for current writer
 # ------------------------------------------------------------
 @bp.route("/bids", methods=["GET"])
+@query_budget(8)
 @jwt_required()
 def list_bids():
     user_id = get_jwt_identity()
@@ -93,18 +101,20 @@ def list_bids():
             )
 
     total = q.count()
-    items = (
-        q.order_by(Bid.submitted_at.desc())
+    rows = (
+        q.with_entities(*BID_ROW.columns)
+         .order_by(Bid.submitted_at.desc())
          .offset((page - 1) * limit)
          .limit(limit)
          .all()
     )
 
-    bids = [b.serialize() for b in items]
-
-    print(f"query = {q}")
+    bids = BID_ROW.many(rows)
 
-    print(f"bids = {bids}")
+    # compiling the SQL and dumping the page is costly; only do it when asked for
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("list_bids query: %s", q)
+        logger.debug("list_bids returned %d bids: %s", len(bids), bids)
 
     pagination = {
         "total": total,
@@ -140,6 +150,7 @@ def get_bid(bid_id):
 #  POST /orders/<order_id>/bids — Place a bid
 # ------------------------------------------------------------
 @bp.route("/orders/<order_id>/bids", methods=["POST"])
+@weighted("sanitize")
 @jwt_required()
 def create_bid(order_id):
     data = request.get_json() or {}
@@ -281,6 +292,7 @@ def withdraw_bid(bid_id):
 #  GET /client/bids — List bids on client’s orders
 # ------------------------------------------------------------
 @bp.route("/client/bids", methods=["GET"])
+@query_budget(8)
 @jwt_required()
 def list_bids_for_client():
     client_id = get_jwt_identity()
@@ -304,16 +316,16 @@ def list_bids_for_client():
         q = q.filter(Bid.status == status)
 
     total = q.count()
-    bids = (
-        q.order_by(Bid.submitted_at.desc())
+    rows = (
+        q.join(User, User.id == Bid.user_id)
+        .with_entities(*BID_WITH_WRITER_ROW.columns)
+        .order_by(Bid.submitted_at.desc())
         .offset((page - 1) * limit)
         .limit(limit)
         .all()
     )
 
-    serialized = []
-    for b in bids:
-        serialized.append(b.serialize(include_user_info = True))
+    serialized = BID_WITH_WRITER_ROW.many(rows)
 
     pagination = {
         "total": total,
@@ -398,6 +410,7 @@ def client_update_bid_status(bid_id):
         return error_response("VALIDATION_ERROR", "Invalid action (use 'accept' or 'reject')", status=422)
 
     db.session.commit()
+    response_cache.invalidate("orders")
 
     # -------------------------------------------------------------------
     # SEND NOTIFICATION TO WRITER (uses bid.user and bid.user_id)
@@ -432,11 +445,30 @@ def client_update_bid_status(bid_id):
     return success_response({"message": f"Bid {action}ed successfully"})
 
 
+def _order_bids_version(order_id):
+    """The client's order row, its bids and the bidding writers' profiles."""
+    of_order = Bid.order_id == Order.id
+    row = (
+        db.session.query(
+            func.coalesce(Order.updated_at, Order.created_at),
+            select(func.count(Bid.id)).where(of_order).scalar_subquery(),
+            select(func.max(func.coalesce(Bid.updated_at, Bid.submitted_at))).where(of_order).scalar_subquery(),
+            select(func.max(func.coalesce(User.updated_at, User.joined_at)))
+            .join(Bid, Bid.user_id == User.id)
+            .where(of_order).scalar_subquery(),
+        )
+        .filter(Order.id == order_id, Order.client_id == get_jwt_identity())
+        .first()
+    )
+    return tuple(row) if row else None
+
+
 # ------------------------------------------------------------
 #  GET /client/orders/<order_id>/bids  — Bids for a specific order
 # ------------------------------------------------------------
 @bp.route("/client/orders/<order_id>/bids", methods=["GET"])
 @jwt_required()
+@conditional(_order_bids_version)
 def list_bids_for_order(order_id):
     client_id = get_jwt_identity()
 
@@ -464,14 +496,17 @@ def list_bids_for_order(order_id):
 
     total = q.count()
 
-    bids = (
-        q.order_by(Bid.submitted_at.desc())
+    rows = (
+        q.join(Order, Order.id == Bid.order_id)
+         .join(User, User.id == Bid.user_id)
+         .with_entities(*BID_WITH_WRITER_ROW.columns)
+         .order_by(Bid.submitted_at.desc())
          .offset((page - 1) * limit)
          .limit(limit)
          .all()
     )
 
-    serialized = [b.serialize(include_user_info=True) for b in bids]
+    serialized = BID_WITH_WRITER_ROW.many(rows)
 
     pagination = {
         "total": total,
@@ -1,21 +1,31 @@
+import logging
 from flask import Blueprint, request
 from flask_jwt_extended import jwt_required, get_jwt_identity
+from sqlalchemy.orm import joinedload
 from datetime import datetime, timedelta
 
 from app.services.chat_service import (
     get_or_create_chat,
     add_message,
     sanitize_message,
+    last_messages,
+    unread_counts,
 )
 from app.services.chat_behavior_analyzer import analyze_chat_behavior
 from app.utils.response_formatter import success_response, error_response
 from app.models.chat import Chat
 from app.models.message import Message
-from app.extensions import db
 from app.models.user import User
+from app.schemas.chat_schema import MESSAGE_ROW
+from app.extensions import db
+from app.utils.auth_utils import get_current_user
+from app.utils.instrumentation import query_budget
+from app.utils.rate_limits import weighted
 
 bp = Blueprint("chat", __name__, url_prefix="/api/v1/chats")
 
+logger = logging.getLogger(__name__)
+
 
 # -----------------------------------------------------------
 # CREATE OR GET CHAT
@@ -29,7 +39,7 @@ def create_or_get_chat():
     writer_id = data.get("writer_id")
     client_id = data.get("client_id")
 
-    print(f"order = {order_id} client = {client_id} writer = {writer_id}")
+    logger.debug("create_or_get_chat order=%s client=%s writer=%s", order_id, client_id, writer_id)
     uid = get_jwt_identity()
 
     if not order_id:
@@ -38,7 +48,7 @@ def create_or_get_chat():
     # ----------------------------------
     # Determine role of caller
     # ----------------------------------
-    user = User.query.get(uid)
+    user = get_current_user()
 
     if user.role.lower() == "client":
         # Client is starting the chat
@@ -95,30 +105,29 @@ def create_or_get_chat():
 # LIST CHATS
 # -----------------------------------------------------------
 @bp.route("", methods=["GET"])
+@query_budget(10)
 @jwt_required()
 def list_chats():
     uid = get_jwt_identity()
-
-    chats_q = Chat.query.filter(
-        (Chat.client_id == uid) | (Chat.writer_id == uid)
-    ).order_by(Chat.created_at.desc()).all()
+    now = datetime.utcnow()
+
+    chats_q = (
+        Chat.query.filter((Chat.client_id == uid) | (Chat.writer_id == uid))
+        .options(joinedload(Chat.order), joinedload(Chat.client), joinedload(Chat.writer))
+        .order_by(Chat.created_at.desc())
+        .all()
+    )
+    chat_ids = [chat.id for chat in chats_q]
+    newest = last_messages(chat_ids)
+    unread = unread_counts(chat_ids, uid)
 
     out = []
 
     for chat in chats_q:
-        # Auto-clear expired warnings
-        if chat.warning_active and chat.warning_expires_at and chat.warning_expires_at < datetime.utcnow():
-            chat.warning_active = False
-            chat.warning_risk = None
-            chat.warning_message = None
-            chat.warning_expires_at = None
-            db.session.commit()
-
-        last_msg = (
-            Message.query.filter_by(chat_id=chat.id)
-            .order_by(Message.created_at.desc())
-            .first()
-        )
+        # expired warnings are cleared by the sweeps (sweep_service); hide any it hasn't reached yet
+        warning_live = chat.warning_active and not (chat.warning_expires_at and chat.warning_expires_at < now)
+
+        last_msg = newest.get(chat.id)
 
         other_user = chat.writer if chat.client_id == uid else chat.client
 
@@ -136,12 +145,12 @@ def list_chats():
 
             "warning": (
                 {
-                    "active": chat.warning_active,
+                    "active": True,
                     "risk": chat.warning_risk,
                     "message": chat.warning_message,
                     "expires_at": chat.warning_expires_at.isoformat() + "Z"
                 }
-                if chat.warning_active and chat.warning_for_user_id == uid
+                if warning_live and chat.warning_for_user_id == uid
                 else None
             ),
 
@@ -151,11 +160,7 @@ def list_chats():
                 "is_read": last_msg.is_read,
             } if last_msg else None,
 
-            "unread_count": Message.query.filter(
-                Message.chat_id == chat.id,
-                Message.sender_id != uid,
-                Message.is_read == False
-            ).count()
+            "unread_count": unread.get(chat.id, 0),
         })
 
     return success_response({"chats": out})
@@ -179,21 +184,13 @@ def list_messages(chat_id):
 
     msgs_q = Message.query.filter_by(chat_id=chat_id).order_by(Message.created_at.asc())
     total = msgs_q.count()
-    items = msgs_q.offset((page - 1) * limit).limit(limit).all()
+    rows = (
+        msgs_q.join(User, User.id == Message.sender_id)
+        .with_entities(*MESSAGE_ROW.columns)
+        .offset((page - 1) * limit).limit(limit).all()
+    )
 
-    messages = [{
-        "id": m.id,
-        "chat_id": m.chat_id,
-        "sender": {
-            "id": m.sender.id,
-            "name": m.sender.full_name,
-            "avatar": m.sender.profile_image,
-        },
-        "content": m.content,
-        "sent_at": m.created_at.isoformat() + "Z",
-        "is_read": m.is_read,
-        "attachments": [],
-    } for m in items]
+    messages = MESSAGE_ROW.many(rows)
 
     return success_response({
         "messages": messages,
@@ -220,6 +217,7 @@ def list_messages(chat_id):
 # POST MESSAGE
 # -----------------------------------------------------------
 @bp.route("/<chat_id>/messages", methods=["POST"])
+@weighted("sanitize")
 @jwt_required()
 def post_message(chat_id):
     chat = Chat.query.get(chat_id)
@@ -282,6 +280,7 @@ def post_message(chat_id):
 # EDIT MESSAGE
 # -----------------------------------------------------------
 @bp.route("/<chat_id>/messages/<message_id>", methods=["PUT"])
+@weighted("sanitize")
 @jwt_required()
 def edit_message(chat_id, message_id):
     chat = Chat.query.get(chat_id)
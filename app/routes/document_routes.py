@@ -0,0 +1,76 @@
+import logging
+from flask import Blueprint, request, send_file
+from flask_jwt_extended import jwt_required, get_jwt_identity
+from app.models.document_manifest import DocumentManifest
+from app.models.submission import Submission
+from app.models.user import User
+from app.utils.auth_utils import identity_from_token
+from app.utils.response_formatter import error_response
+
+logger = logging.getLogger(__name__)
+
+bp = Blueprint("documents", __name__, url_prefix="/api/v1/documents")
+
+# artifacts are named by content hash and never rewritten
+ARTIFACT_MAX_AGE = 7 * 24 * 3600
+
+
+def _caller():
+    """Authorization header, or ?token= so previews work in <img> tags (as for application files)."""
+    uid = get_jwt_identity()
+    if not uid and "token" in request.args:
+        uid = identity_from_token(request.args["token"])
+    return User.query.get(uid) if uid else None
+
+
+def _can_view(user, document):
+    """Same rules as the original upload: admins for applications; order parties for submissions."""
+    role = (user.role or "").lower()
+    if role == "admin":
+        return True
+    if document.owner_type != "submission":
+        return False
+    submission = Submission.query.get(document.owner_id)
+    if submission is None:
+        return False
+    order = submission.order
+    if role == "client":
+        return order.client_id == user.id
+    if role == "writer":
+        return order.writer_id == user.id
+    return False
+
+
+def _serve_artifact(document_id, field, mimetype=None):
+    user = _caller()
+    if not user:
+        return error_response("UNAUTHORIZED", "Authentication required", status=401)
+
+    document = DocumentManifest.query.get(document_id)
+    if document is None:
+        return error_response("NOT_FOUND", "Document not found", status=404)
+    if not _can_view(user, document):
+        return error_response("FORBIDDEN", "You cannot view this document", status=403)
+
+    path = getattr(document, field)
+    if not path:
+        return error_response("NOT_FOUND", "Preview not available yet", status=404)
+    try:
+        response = send_file(path, mimetype=mimetype, max_age=ARTIFACT_MAX_AGE)
+    except FileNotFoundError:
+        return error_response("NOT_FOUND", "Preview file missing on server", status=404)
+    response.cache_control.private = True
+    response.cache_control.public = False
+    return response
+
+
+@bp.route("/<int:document_id>/thumbnail", methods=["GET"])
+@jwt_required(optional=True)
+def get_thumbnail(document_id):
+    return _serve_artifact(document_id, "thumbnail_path")
+
+
+@bp.route("/<int:document_id>/text", methods=["GET"])
+@jwt_required(optional=True)
+def get_text(document_id):
+    return _serve_artifact(document_id, "text_path", mimetype="text/plain; charset=utf-8")
@@ -1,13 +1,32 @@
-from flask import Blueprint, request
-from app.services.leaderboard_service import get_leaderboard
-from app.utils.response_formatter import success_response
+from flask import Blueprint, request, current_app
+from flask_jwt_extended import jwt_required, get_jwt_identity
+from app.services.leaderboard_service import get_leaderboard, get_user_rank, PERIODS
+from app.utils.response_formatter import success_response, error_response
+from app.extensions import response_cache
 
 bp = Blueprint("leaderboard", __name__, url_prefix="/api/v1")
 
 @bp.route("/leaderboard", methods=["GET"])
+@jwt_required(optional=True)
+@response_cache.cached(ttl=60, tags=("leaderboard",), per_user=True)
 def leaderboard():
     period = request.args.get("period", "month")
-    limit = int(request.args.get("limit", 50))
+    if period not in PERIODS:
+        return error_response("VALIDATION_ERROR", f"period must be one of {', '.join(PERIODS)}", status=422)
+    try:
+        limit = int(request.args.get("limit", 50))
+    except ValueError:
+        return error_response("VALIDATION_ERROR", "limit must be an integer", status=422)
+
     lb = get_leaderboard(period=period, limit=limit)
-    # For demo, current_user_rank left as sample; frontend can call /leaderboard and /me separately
-    return success_response({"leaderboard": lb, "current_user_rank": None})
+
+    uid = get_jwt_identity()
+    current_user_rank = get_user_rank(uid, period) if uid else None
+
+    response, status = success_response({"leaderboard": lb, "current_user_rank": current_user_rank})
+
+    # Anonymous snapshots are shareable; personalised ones must stay private
+    max_age = current_app.config.get("LEADERBOARD_SNAPSHOT_TTL", 60)
+    response.headers["Cache-Control"] = f"{'private' if uid else 'public'}, max-age={max_age}"
+    response.headers["Vary"] = "Authorization"
+    return response, status
@@ -13,21 +13,18 @@ from app.models.user import User
 from app.models.notification_read import NotificationRead
 from app.models.notification import Notification
 from app.extensions import db
+from app.utils.auth_utils import admin_required, get_current_user
+from app.schemas.notification_schema import NOTIFICATION_ROW
 from datetime import datetime
 
 bp = Blueprint("notifications", __name__, url_prefix="/api/v1/notifications")
 
 
-def admin_required(user):
-    return user and user.role.lower() == "admin"
-
 @bp.route("/send", methods=["POST"])
 @jwt_required()
+@admin_required
 def send_notification():
     uid = get_jwt_identity()
-    admin_user = User.query.get(uid)
-    if not admin_required(admin_user):
-        return error_response("FORBIDDEN", "Admin privileges required", status=403)
 
     data = request.get_json() or {}
     title = data.get("title")
@@ -76,7 +73,7 @@ def send_notification():
 @jwt_required()
 def get_notifications():
     uid = get_jwt_identity()
-    user = User.query.get(uid)
+    user = get_current_user()
     if not user:
         return error_response("UNAUTHORIZED", "Invalid user", 401)
 
@@ -110,24 +107,16 @@ def get_notifications():
     total_items = q.count()
     total_pages = (total_items + limit - 1) // limit
 
-    notifications = (
-        q.order_by(Notification.created_at.desc())
+    # read/unread is computed by the query against the user's last_read
+    rows = (
+        q.with_entities(*NOTIFICATION_ROW.columns)
+         .params(last_read=notif_read.last_read)
+         .order_by(Notification.created_at.desc())
          .offset(offset)
          .limit(limit)
          .all()
     )
-
-    # Determine read/unread
-    results = [{
-        "id": n.id,
-        "title": n.title,
-        "message": n.message,
-        "type": n.type,
-        "target_type": n.target_type,
-        "target_group": n.target_group,
-        "created_at": n.created_at.isoformat(),
-        "is_read": n.created_at <= notif_read.last_read
-    } for n in notifications]
+    results = NOTIFICATION_ROW.many(rows)
 
     return success_response({
         "notifications": results,
@@ -1,19 +1,27 @@
+import logging
 import os
 from datetime import timezone, datetime
 from flask import Blueprint, request, send_file, current_app
 from flask_jwt_extended import jwt_required, get_jwt_identity
-from app.extensions import db
+from app.extensions import db, response_cache
 from app.models.order import Order
 from app.models.user import User
 from app.models.declined_order import DeclinedOrder
 from app.services.order_service import create_order, update_order_status
 from app.utils.response_formatter import success_response, error_response
 from app.utils.pagination import paginate_query
+from app.utils.auth_utils import get_current_user
+from app.utils.instrumentation import query_budget
+from app.utils.conditional import conditional
 from app.models.order_invitation import OrderInvitation
 from dateutil import parser
 from app.models.bid import Bid
 from app.services.notification_service import send_notification_to_user
-from sqlalchemy import or_, cast
+from app.services.user_search_service import resolve_writers
+from app.services.upload_service import schedule_delete
+from app.schemas.order_schema import ORDER_LIST_ROW, OrderClient
+from sqlalchemy import or_, cast, func, select
+from sqlalchemy.orm import selectinload
 from sqlalchemy.types import String
 from app.services.order_service import (
     save_uploaded_file,
@@ -22,15 +30,17 @@ from app.services.order_service import (
 
 bp = Blueprint("orders", __name__, url_prefix="/api/v1/orders")
 
+logger = logging.getLogger(__name__)
+
 
 # ------------------------------------------------------------
 #  GET /orders — List orders (clients see their orders; writers see marketplace or assigned)
 # ------------------------------------------------------------
 @bp.route("", methods=["GET"])
+@query_budget(10)
 @jwt_required()
 def list_orders():
-    uid = get_jwt_identity()
-    user = User.query.get(uid)
+    user = get_current_user()
     if not user:
         return error_response("NOT_FOUND", "User not found", status=404)
 
@@ -128,28 +138,14 @@ def list_orders():
         except:
             pass
 
-    # Pagination & serialization
-    items, pagination = paginate_query(q.order_by(Order.created_at.desc()), page, limit)
-    orders = []
-    for o in items:
-        orders.append({
-            "id": o.id,
-            "title": o.title,
-            "subject": o.subject,
-            "type": o.type,
-            "pages": o.pages,
-            "deadline": o.deadline.isoformat() + "Z" if o.deadline else None,
-            "budget": o.budget,
-            "status": o.status,
-            "client": {
-                "id": o.client.id,
-                "name": o.client.full_name,
-                "country": o.client.country,
-                "avatar": o.client.profile_image
-            } if o.client else None,
-            "created_at": o.created_at.isoformat() + "Z" if o.created_at else None,
-            "writer_assigned": o.writer_id is not None,
-        })
+    # Pagination & serialization: only the listed columns, client joined in the same query
+    q = (
+        q.outerjoin(OrderClient, OrderClient.id == Order.client_id)
+        .with_entities(*ORDER_LIST_ROW.columns)
+        .order_by(Order.created_at.desc())
+    )
+    rows, pagination = paginate_query(q, page, limit)
+    orders = ORDER_LIST_ROW.many(rows)
 
     return success_response({"orders": orders, "pagination": pagination})
 
@@ -166,6 +162,7 @@ def serialize_order(order):
         "type": order.type,
         "pages": order.pages,
         "deadline": order.deadline.isoformat() if order.deadline else None,
+        "overdue_at": order.overdue_at.isoformat() + "Z" if order.overdue_at else None,
         "budget": order.budget,
         "status": order.status,
         "description": order.description,
@@ -200,14 +197,40 @@ def serialize_order(order):
     return data
 
 
+def _order_version(order_id):
+    """Everything serialize_order reads: the order row (attachments are listed in requirements) and its invitations."""
+    invited = OrderInvitation.order_id == Order.id
+    row = (
+        db.session.query(
+            func.coalesce(Order.updated_at, Order.created_at),
+            # stamped by the overdue sweep without touching updated_at
+            Order.overdue_at,
+            select(func.count(OrderInvitation.id)).where(invited).scalar_subquery(),
+            select(func.max(OrderInvitation.invited_at)).where(invited).scalar_subquery(),
+            select(func.max(func.coalesce(User.updated_at, User.joined_at)))
+            .join(OrderInvitation, OrderInvitation.writer_id == User.id)
+            .where(invited).scalar_subquery(),
+        )
+        .filter(Order.id == order_id)
+        .first()
+    )
+    return tuple(row) if row else None
+
+
 # ------------------------------------------------------------
 #  GET /orders/<order_id> — Get single order details
 # ------------------------------------------------------------
 @bp.route("/<order_id>", methods=["GET"])
+@query_budget(10)
 @jwt_required()
+# no response cache: the version lookup is the cheap path, and a cached body could outlive the ETag it was built for
+@conditional(_order_version)
 def get_order(order_id):
     uid = get_jwt_identity()
-    order = Order.query.get(order_id)
+    # serialize_order lists every invited writer
+    order = db.session.get(
+        Order, order_id, options=[selectinload(Order.invitations).joinedload(OrderInvitation.writer)],
+    )
     if not order:
         return error_response("NOT_FOUND", "Order not found", status=404)
     return success_response(serialize_order(order))
@@ -219,9 +242,8 @@ def get_order(order_id):
 @bp.route("", methods=["POST"])
 @jwt_required()
 def create_new_order():
-    uid = get_jwt_identity()
-    user = User.query.get(uid)
-    
+    user = get_current_user()
+
     if not user:
         return error_response("NOT_FOUND", "User not found", status=404)
 
@@ -264,7 +286,7 @@ def create_new_order():
             # Accept many ISO variants
             form_data["deadline"] = parser.parse(deadline_str)
         except Exception as e:
-            print(f"[DEADLINE_PARSE_ERROR] {e} for {deadline_str}")
+            logger.info("could not parse deadline %r: %s", deadline_str, e)
             form_data["deadline"] = None
     else:
         form_data["deadline"] = None
@@ -279,8 +301,6 @@ def create_new_order():
     except ValueError:
         budget = 0.0
 
-    print(f"deadline before create_order = {form_data.get('deadline')} ({type(form_data.get('deadline'))})")
-
     try:
         # collect preferred writers if provided
         preferred_writers = []
@@ -297,17 +317,13 @@ def create_new_order():
 
         # --- Handle preferred writer invitations ---
         if preferred_writers:
-            invited = []
-            for w in preferred_writers:
-                writer = User.query.filter(
-                    (User.id == w) | (User.full_name.ilike(f"%{w}%"))
-                ).first()
-                if writer and writer.role == "writer":
-                    inv = OrderInvitation(order_id=order.id, writer_id=writer.id)
-                    db.session.add(inv)
-                    invited.append(writer.full_name)
+            invited = {}
+            for writer in resolve_writers(preferred_writers).values():
+                if writer.id not in invited:
+                    db.session.add(OrderInvitation(order_id=order.id, writer_id=writer.id))
+                    invited[writer.id] = writer.full_name
             db.session.commit()
-            print(f"[ORDER_INVITE] Invited writers: {invited}")
+            logger.info("order %s invited writers: %s", order.id, list(invited.values()))
 
         return success_response({
             "id": order.id,
@@ -317,7 +333,7 @@ def create_new_order():
         }, status=200)
     except Exception as e:
         db.session.rollback()
-        print(f"[ORDER_CREATE_ERROR] {str(e)}")
+        logger.exception("order create failed")
         return error_response("ORDER_CREATE_ERROR", str(e), status=400)
 
 
@@ -413,29 +429,31 @@ def patch_order(order_id):
     # Apply updates to model
     for k, v in updates.items():
         setattr(order, k, v)
+    if "deadline" in updates:
+        # the overdue sweep re-flags it if the new deadline has passed too
+        order.overdue_at = None
 
-    # --- Handle file uploads & removals ---
+    # --- Handle file uploads & removals (applied on disk only when the commit succeeds) ---
     root_dir = current_app.config.get("ORDERS_FOLDER", "uploads/orders")
     order_dir = os.path.join(root_dir, str(order.client_id), str(order.id))
-    os.makedirs(order_dir, exist_ok=True)
 
     # remove files not in existing_files
     current_files = os.listdir(order_dir) if os.path.exists(order_dir) else []
+    kept_files = []
     for fname in current_files:
-        if fname not in existing_filenames:
-            try:
-                os.remove(os.path.join(order_dir, fname))
-            except FileNotFoundError:
-                pass
+        if fname in existing_filenames:
+            kept_files.append(fname)
+        else:
+            schedule_delete(os.path.join(order_dir, fname), "order", order.id)
 
-    # Save newly uploaded files
+    # Stage newly uploaded files
     uploaded_files = []
     for file in files:
         if file and getattr(file, "filename", None):
-            fname, fpath = save_uploaded_file(file, order_dir)
+            fname, fpath = save_uploaded_file(file, order_dir, owner_id=order.id)
             uploaded_files.append(fname)
 
-    all_files = os.listdir(order_dir) if os.path.exists(order_dir) else []
+    all_files = kept_files + uploaded_files
     file_list_text = "\n".join(all_files)
     existing_text = (order.requirements or "").split("\n\n[Attachments:")[0]
     order.requirements = f"{existing_text}\n\n[Attachments: {len(all_files)} file(s)]\n{file_list_text}"
@@ -452,12 +470,13 @@ def patch_order(order_id):
     preferred_writers = [v for k, v in data.items() if k.startswith("preferred_writers[") and v and v.strip()]
     if preferred_writers:
         existing_invites = {inv.writer_id for inv in order.invitations}
-        for w in preferred_writers:
-            writer = User.query.filter((User.id == w) | (User.full_name.ilike(f"%{w}%"))).first()
-            if writer and writer.role == "writer" and writer.id not in existing_invites:
+        for writer in resolve_writers(preferred_writers).values():
+            if writer.id not in existing_invites:
                 db.session.add(OrderInvitation(order_id=order.id, writer_id=writer.id))
+                existing_invites.add(writer.id)
 
     db.session.commit()
+    response_cache.invalidate("orders")
 
     # Determine changed fields for notification
     real_changes = {}
@@ -540,8 +559,7 @@ def patch_order(order_id):
 @bp.route("/<order_id>/decline", methods=["POST"])
 @jwt_required()
 def decline_order(order_id):
-    uid = get_jwt_identity()
-    user = User.query.get(uid)
+    user = get_current_user()
     order = Order.query.get(order_id)
 
     if not order:
@@ -578,8 +596,6 @@ def decline_order(order_id):
 @bp.route("/files/<order_id>/<filename>", methods=["GET"])
 @jwt_required()
 def get_order_file(order_id, filename):
-    uid = get_jwt_identity()
-    user = User.query.get(uid)
     order = Order.query.get(order_id)
 
     if not order:
@@ -602,8 +618,7 @@ def get_order_file(order_id, filename):
 @bp.route("/<order_id>/cancel", methods=["POST"])
 @jwt_required()
 def cancel_order(order_id):
-    uid = get_jwt_identity()
-    user = User.query.get(uid)
+    user = get_current_user()
     order = Order.query.get(order_id)
 
     if not order:
@@ -628,6 +643,7 @@ def cancel_order(order_id):
     order.status = "cancelled"
     order.updated_at = datetime.utcnow()
     db.session.commit()
+    response_cache.invalidate("orders")
 
     # Notify writer if assigned
     if order.writer_id:
@@ -659,6 +675,7 @@ def cancel_order(order_id):
 # ------------------------------------------------------------
 @bp.route("/pricing/preview", methods=["POST"])
 @jwt_required(optional=True)
+@response_cache.cached(ttl=60)
 def preview_pricing():
     data = request.json or {}
     category = data.get("category")
@@ -1,18 +1,33 @@
+import logging
 from flask import Blueprint, request
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from app.services.payment_service import get_balance_for_user, create_withdrawal
-from app.models.user import User
+from app.services.export_service import (
+    EXPORT_FORMATS,
+    TRANSACTION_EXPORT_COLUMNS,
+    WITHDRAWAL_EXPORT_COLUMNS,
+    build_export_query,
+    parse_date_filter,
+    stream_export,
+    EXPORT_STATEMENT_TIMEOUT_MS,
+)
+from app.utils.auth_utils import get_current_user
 from app.utils.response_formatter import success_response, error_response
+from app.utils.db_tuning import statement_timeout
+from app.utils.db_routing import primary_required
 from app.models.payment_method import PaymentMethod
+from app.schemas.transaction_schema import TRANSACTION_ROW, WITHDRAWAL_ROW
 from app.extensions import db
 
 bp = Blueprint("payments", __name__, url_prefix="/api/v1")
 
+logger = logging.getLogger(__name__)
+
 @bp.route("/balance", methods=["GET"])
 @jwt_required()
+@primary_required
 def balance():
-    uid = get_jwt_identity()
-    user = User.query.get(uid)
+    user = get_current_user()
     if not user:
         return error_response("NOT_FOUND", "User not found", status=404)
     bal = get_balance_for_user(user)
@@ -36,23 +51,45 @@ def transactions():
         q = q.filter_by(type=ttype)
 
     total = q.count()
-    items = q.order_by(Transaction.created_at.desc()).offset((page-1)*limit).limit(limit).all()
-
-    txns = []
-    for t in items:
-        txns.append({
-            "id": t.id,
-            "type": t.type,
-            "amount": t.amount,
-            "description": t.description,
-            "status": t.status,
-            "order_id": t.order_id,
-            "created_at": t.created_at.isoformat() + "Z"
-        })
+    rows = (
+        q.with_entities(*TRANSACTION_ROW.columns)
+        .order_by(Transaction.created_at.desc()).offset((page-1)*limit).limit(limit).all()
+    )
+    txns = TRANSACTION_ROW.many(rows)
 
     pagination = {"total": total, "page": page, "limit": limit, "total_pages": (total + limit-1)//limit}
     return success_response({"transactions": txns, "pagination": pagination})
 
+# ------------------------------------------------------------
+#  GET /transactions/export — Stream the caller's transactions as CSV/NDJSON
+#  Filters: type, status, from, to; format=csv|ndjson
+# ------------------------------------------------------------
+@bp.route("/transactions/export", methods=["GET"])
+@jwt_required()
+@statement_timeout(EXPORT_STATEMENT_TIMEOUT_MS)
+def export_transactions():
+    uid = get_jwt_identity()
+    fmt = request.args.get("format", "csv").lower()
+    if fmt not in EXPORT_FORMATS:
+        return error_response("VALIDATION_ERROR", "format must be 'csv' or 'ndjson'", status=422)
+
+    try:
+        date_from = parse_date_filter(request.args.get("from"))
+        date_to = parse_date_filter(request.args.get("to"))
+    except ValueError as e:
+        return error_response("VALIDATION_ERROR", str(e), status=422)
+
+    q = build_export_query(
+        TRANSACTION_EXPORT_COLUMNS,
+        user_id=uid,
+        ttype=request.args.get("type"),
+        status=request.args.get("status"),
+        date_from=date_from,
+        date_to=date_to,
+    )
+    return stream_export(q, TRANSACTION_EXPORT_COLUMNS, fmt, "transactions")
+
+
 @bp.route("/withdrawals", methods=["POST"])
 @jwt_required()
 def withdraw():
@@ -69,7 +106,7 @@ def withdraw():
     try:
         txn = create_withdrawal(uid, amount, method, details)
     except Exception as e:
-        print(f"error = {str(e)}")
+        logger.info("withdrawal rejected: %s", e)
         return error_response("NO_PAYMENT_METHOD", str(e), status=400)
 
     return success_response({
@@ -101,22 +138,16 @@ def list_withdrawals():
         q = q.filter(Transaction.created_at <= date_to)
 
     total = q.count()
-    items = (
-        q.order_by(Transaction.created_at.desc())
+    rows = (
+        q.with_entities(*WITHDRAWAL_ROW.columns)
+         .order_by(Transaction.created_at.desc())
          .offset((page - 1) * limit)
          .limit(limit)
          .all()
     )
 
     return success_response({
-        "withdrawals": [
-            {
-                "id": t.id,
-                "amount": t.amount,
-                "status": t.status,
-                "created_at": t.created_at.isoformat() + "Z"
-            } for t in items
-        ],
+        "withdrawals": WITHDRAWAL_ROW.many(rows),
         "pagination": {
             "total": total,
             "page": page,
@@ -126,13 +157,42 @@ def list_withdrawals():
     })
 
 
+# ------------------------------------------------------------
+#  GET /withdrawals/export — Stream the caller's withdrawals as CSV/NDJSON
+#  Filters: status, from, to; format=csv|ndjson
+# ------------------------------------------------------------
+@bp.route("/withdrawals/export", methods=["GET"])
+@jwt_required()
+@statement_timeout(EXPORT_STATEMENT_TIMEOUT_MS)
+def export_withdrawals():
+    uid = get_jwt_identity()
+    fmt = request.args.get("format", "csv").lower()
+    if fmt not in EXPORT_FORMATS:
+        return error_response("VALIDATION_ERROR", "format must be 'csv' or 'ndjson'", status=422)
+
+    try:
+        date_from = parse_date_filter(request.args.get("from"))
+        date_to = parse_date_filter(request.args.get("to"))
+    except ValueError as e:
+        return error_response("VALIDATION_ERROR", str(e), status=422)
+
+    q = build_export_query(
+        WITHDRAWAL_EXPORT_COLUMNS,
+        user_id=uid,
+        ttype="withdrawal",
+        status=request.args.get("status"),
+        date_from=date_from,
+        date_to=date_to,
+    )
+    return stream_export(q, WITHDRAWAL_EXPORT_COLUMNS, fmt, "withdrawals")
+
+
 @bp.route("/payment-methods", methods=["POST"])
 @jwt_required()
 def add_payment_method():
     from app.models.payment_method import PaymentMethod
 
     data = request.get_json() or {}
-    print(f"incoming data = {data}")
     method = data.get("method")
     details = data.get("details")
     is_default = data.get("is_default", False)
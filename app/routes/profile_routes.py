@@ -1,16 +1,22 @@
 from flask import Blueprint, request
-from flask_jwt_extended import jwt_required, get_jwt_identity
-from app.models.user import User
+from flask_jwt_extended import jwt_required
+from app.utils.auth_utils import get_current_user
+from app.utils.conditional import conditional
 from app.extensions import db
 from app.utils.response_formatter import success_response, error_response
 
 bp = Blueprint("profile", __name__, url_prefix="/api/v1/profile")
 
+def _profile_version():
+    # the same cached lookup the view uses, so a 304 costs one primary-key read
+    u = get_current_user()
+    return (u.updated_at or u.joined_at,) if u else None
+
 @bp.route("", methods=["GET"])
 @jwt_required()
+@conditional(_profile_version)
 def get_profile():
-    uid = get_jwt_identity()
-    u = User.query.get(uid)
+    u = get_current_user()
     if not u:
         return error_response("NOT_FOUND", "User not found", status=404)
     return success_response({
@@ -30,9 +36,8 @@ def get_profile():
 @bp.route("", methods=["PATCH"])
 @jwt_required()
 def patch_profile():
-    uid = get_jwt_identity()
     data = request.get_json() or {}
-    u = User.query.get(uid)
+    u = get_current_user()
     if not u:
         return error_response("NOT_FOUND", "User not found", status=404)
     if "full_name" in data:
@@ -40,4 +45,4 @@ def patch_profile():
     if "bio" in data:
         u.bio = data.get("bio")
     db.session.commit()
-    return success_response({"id": u.id, "full_name": u.full_name, "bio": u.bio, "updated_at": u.joined_at.isoformat() + "Z"})
+    return success_response({"id": u.id, "full_name": u.full_name, "bio": u.bio, "updated_at": (u.updated_at or u.joined_at).isoformat() + "Z"})
@@ -10,7 +10,9 @@ from flask_jwt_extended import (
     jwt_required,
     get_jwt_identity
 )
+from sqlalchemy import and_, func, select
 from app.extensions import db
+from app.models.document_manifest import DocumentManifest
 from app.models.order import Order
 from app.models.submission import Submission
 from app.models.user import User
@@ -19,11 +21,18 @@ from app.services.submission_service import (
     list_submissions,
     request_revision
 )
+from app.services.document_service import documents_for, serialize_document
 from app.services.order_service import update_order_status
 from app.utils.response_formatter import (
     success_response,
     error_response
 )
+from app.utils.auth_utils import (
+    get_current_user,
+    get_role_claims,
+    role_required
+)
+from app.utils.conditional import conditional
 
 bp = Blueprint(
     "submissions",
@@ -36,17 +45,14 @@ bp = Blueprint(
 # ------------------------------------------------------------
 @bp.route("/<order_id>/submissions", methods=["POST"])
 @jwt_required()
+@role_required("writer", message="Writer access required")
 def submit_work(order_id):
     uid = get_jwt_identity()
-    user = User.query.get(uid)
-
-    if not user or user.role != "writer":
-        return error_response("FORBIDDEN", "Writer access required", status=403)
 
     order = Order.query.get_or_404(order_id)
 
     # Writer must be assigned
-    if order.writer_id != user.id:
+    if order.writer_id != uid:
         return error_response("FORBIDDEN", "You are not assigned to this order", status=403)
 
     files = request.files.getlist("files")
@@ -58,7 +64,7 @@ def submit_work(order_id):
     try:
         submission = create_submission(
             order=order,
-            writer=user,
+            writer=get_current_user(),
             files=files,
             message=message
         )
@@ -71,25 +77,61 @@ def submit_work(order_id):
         db.session.rollback()
         return error_response("SUBMISSION_ERROR", str(e), status=400)
 
+def _submissions_version(order_id):
+    """Order row, its submissions, their document manifests and the submitting writers."""
+    of_order = Submission.order_id == Order.id
+    documents = and_(
+        DocumentManifest.owner_type == "submission",
+        DocumentManifest.owner_id.in_(select(Submission.id).where(of_order)),
+    )
+    row = (
+        db.session.query(
+            Order.client_id,
+            func.coalesce(Order.updated_at, Order.created_at),
+            select(func.count(Submission.id)).where(of_order).scalar_subquery(),
+            select(func.max(func.coalesce(Submission.updated_at, Submission.created_at))).where(of_order).scalar_subquery(),
+            select(func.max(func.coalesce(User.updated_at, User.joined_at)))
+            .join(Submission, Submission.writer_id == User.id)
+            .where(of_order).scalar_subquery(),
+            # preprocessing moves documents pending -> processing -> done after the upload
+            select(func.max(DocumentManifest.claimed_at)).where(documents).scalar_subquery(),
+            select(func.max(DocumentManifest.processed_at)).where(documents).scalar_subquery(),
+        )
+        .filter(Order.id == order_id)
+        .first()
+    )
+    if row is None:
+        return None
+    claims = get_role_claims() or {}
+    if claims.get("role") == "client" and row[0] != get_jwt_identity():
+        return None
+    return tuple(row)
+
+
 # ------------------------------------------------------------
 # Client views submissions
 # ------------------------------------------------------------
 @bp.route("/<order_id>/submissions", methods=["GET"])
 @jwt_required()
+@conditional(_submissions_version)
 def get_submissions(order_id):
     uid = get_jwt_identity()
-    user = User.query.get(uid)
+    claims = get_role_claims() or {}
 
     order = Order.query.get_or_404(order_id)
 
-    if user.role == "client" and order.client_id != user.id:
+    if claims.get("role") == "client" and order.client_id != uid:
         return error_response("FORBIDDEN", "Not your order", status=403)
 
     submissions = list_submissions(order)
+    documents = documents_for("submission", [s.id for s in submissions])
     payload = {
         "order_status": order.status,  # NEW: Include order status
         "writer_assigned": bool(order.writer_id),
-        "submissions": [s.to_dict() for s in submissions]
+        "submissions": [
+            {**s.to_dict(), "documents": [serialize_document(d) for d in documents[s.id]]}
+            for s in submissions
+        ]
     }
     return success_response(payload)
 
@@ -103,11 +145,11 @@ def get_submissions(order_id):
 @jwt_required()
 def revision_request_endpoint(order_id, submission_id):
     uid = get_jwt_identity()
-    user = User.query.get(uid)
+    claims = get_role_claims() or {}
 
     order = Order.query.get_or_404(order_id)
 
-    if user.role != "client" or order.client_id != user.id:
+    if claims.get("role") != "client" or order.client_id != uid:
         return error_response("FORBIDDEN", "Client access required", status=403)
 
     submission = Submission.query.filter_by(
@@ -136,15 +178,15 @@ from flask import send_file
 @jwt_required()
 def get_submission_file(order_id, submission_id, filename):
     uid = get_jwt_identity()
-    user = User.query.get(uid)
+    claims = get_role_claims() or {}
 
     # Ensure order exists
     order = Order.query.get_or_404(order_id)
 
     # Ensure user has access
-    if user.role == "client" and order.client_id != user.id:
+    if claims.get("role") == "client" and order.client_id != uid:
         return error_response("FORBIDDEN", "Not your order", status=403)
-    if user.role == "writer" and order.writer_id != user.id:
+    if claims.get("role") == "writer" and order.writer_id != uid:
         return error_response("FORBIDDEN", "Writer access required", status=403)
 
     # Ensure submission exists
@@ -172,12 +214,12 @@ def get_submission_file(order_id, submission_id, filename):
 @jwt_required()
 def complete_order(order_id):
     uid = get_jwt_identity()
-    user = User.query.get(uid)
+    claims = get_role_claims() or {}
 
     order = Order.query.get_or_404(order_id)
 
     # Only the client who owns the order can mark it complete
-    if user.role != "client" or order.client_id != user.id:
+    if claims.get("role") != "client" or order.client_id != uid:
         return error_response("FORBIDDEN", "Client access required", status=403)
 
     # Mark the order as complete
@@ -0,0 +1,45 @@
+import logging
+from flask import Blueprint
+from flask_jwt_extended import jwt_required
+from app.extensions import db, limiter, response_cache
+from app.utils.db_tuning import ping, pool_status
+from app.utils.auth_utils import admin_required
+from app.utils.response_formatter import success_response
+
+bp = Blueprint("system", __name__, url_prefix="/api/v1/system")
+
+logger = logging.getLogger(__name__)
+
+
+# ------------------------------------------------------------
+#  GET /system/health — DB reachability and pool saturation
+# ------------------------------------------------------------
+@bp.route("/health", methods=["GET"])
+@limiter.exempt
+def health():
+    pools = {}
+    healthy = True
+    for bind, engine in db.engines.items():
+        name = bind or "default"
+        status = pool_status(engine)
+        try:
+            ping(engine)
+            status["reachable"] = True
+        except Exception as e:
+            logger.error("health check failed for %s: %s", name, e)
+            status["reachable"] = False
+            healthy = False
+        pools[name] = status
+
+    payload = {"status": "ok" if healthy else "degraded", "databases": pools}
+    return success_response(payload, status=200 if healthy else 503)
+
+
+# ------------------------------------------------------------
+#  GET /system/cache — Response cache hit/miss counters (admin)
+# ------------------------------------------------------------
+@bp.route("/cache", methods=["GET"])
+@jwt_required()
+@admin_required
+def cache_stats():
+    return success_response(response_cache.stats())
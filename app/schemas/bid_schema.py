@@ -1,5 +1,48 @@
 from app.extensions import ma
+from app.models.bid import Bid
+from app.models.order import Order
+from app.models.user import User
+from app.utils.serialization import RowSerializer, utc_iso
 
 class BidSchema(ma.Schema):
     class Meta:
         fields = ("id", "order_id", "order_title", "bid_amount", "original_budget", "status", "message", "is_counter_offer", "submitted_at", "response_deadline")
+
+
+# ---------------------------------------
+# row serializers (bids joined to orders, and to users for the writer fields)
+# ---------------------------------------
+
+def derived_bid_status(status, order_updated_at, submitted_at):
+    """Bid.get_derived_status over selected columns."""
+    if status in ("accepted", "rejected", "cancelled", "expired"):
+        return status
+    if order_updated_at and order_updated_at > submitted_at:
+        return "unconfirmed"
+    return status
+
+
+_BID_FIELDS = (
+    ("id", Bid.id),
+    ("order_id", Bid.order_id),
+    ("user_id", Bid.user_id),
+    ("order_title", Order.title),
+    ("bid_amount", Bid.bid_amount),
+    ("original_budget", Bid.original_budget),
+    ("budget", Order.budget),
+    ("status", (Bid.status, Order.updated_at, Bid.submitted_at), derived_bid_status),
+    ("message", Bid.message),
+    ("is_counter_offer", Bid.is_counter_offer),
+    ("submitted_at", Bid.submitted_at, utc_iso),
+    ("response_deadline", Bid.response_deadline, utc_iso),
+)
+
+BID_ROW = RowSerializer(*_BID_FIELDS)
+
+BID_WITH_WRITER_ROW = RowSerializer(
+    *_BID_FIELDS,
+    ("writerId", User.id),
+    ("writerName", User.full_name),
+    ("writerRating", User.rating),
+    ("writerCompletedOrders", User.completed_orders),
+)
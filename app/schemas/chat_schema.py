@@ -1,4 +1,7 @@
 from app.extensions import ma
+from app.models.message import Message
+from app.models.user import User
+from app.utils.serialization import RowSerializer, utc_iso
 
 class ChatListSchema(ma.Schema):
     class Meta:
@@ -7,3 +10,19 @@ class ChatListSchema(ma.Schema):
 class MessageSchema(ma.Schema):
     class Meta:
         fields = ("id", "chat_id", "sender", "content", "sent_at", "is_read", "attachments")
+
+
+# ---------------------------------------
+# row serializers (messages joined to their sender)
+# ---------------------------------------
+
+MESSAGE_ROW = RowSerializer(
+    ("id", Message.id),
+    ("chat_id", Message.chat_id),
+    ("sender", (User.id, User.full_name, User.profile_image),
+     lambda id, name, avatar: {"id": id, "name": name, "avatar": avatar}),
+    ("content", Message.content),
+    ("sent_at", Message.created_at, utc_iso),
+    ("is_read", Message.is_read),
+    ("attachments", (), list),
+)
@@ -1,5 +1,24 @@
-from app.extensions import ma
+from app.extensions import db, ma
+from sqlalchemy import bindparam
+from app.models.notification import Notification
+from app.utils.serialization import RowSerializer, iso
 
 class NotificationSchema(ma.Schema):
     class Meta:
         fields = ("id", "type", "title", "message", "is_read", "created_at", "metadata")
+
+
+# ---------------------------------------
+# row serializers (bind last_read with .params(last_read=...))
+# ---------------------------------------
+
+NOTIFICATION_ROW = RowSerializer(
+    ("id", Notification.id),
+    ("title", Notification.title),
+    ("message", Notification.message),
+    ("type", Notification.type),
+    ("target_type", Notification.target_type),
+    ("target_group", Notification.target_group),
+    ("created_at", Notification.created_at, iso),
+    ("is_read", Notification.created_at <= bindparam("last_read", type_=db.DateTime), bool),
+)
@@ -1,4 +1,8 @@
 from app.extensions import ma
+from sqlalchemy.orm import aliased
+from app.models.order import Order
+from app.models.user import User
+from app.utils.serialization import RowSerializer, utc_iso
 
 class OrderListSchema(ma.Schema):
     class Meta:
@@ -7,3 +11,30 @@ class OrderListSchema(ma.Schema):
 class OrderDetailSchema(ma.Schema):
     class Meta:
         fields = ("id", "title", "subject", "type", "pages", "deadline", "budget", "status", "client", "writer", "progress", "description", "requirements", "attachments", "created_at", "updated_at")
+
+
+# ---------------------------------------
+# row serializers (select ORDER_LIST_ROW.columns, then ORDER_LIST_ROW.many(rows))
+# ---------------------------------------
+
+# outer-joined on Order.client_id by the list query
+OrderClient = aliased(User, name="order_client")
+
+
+def _client(id, name, country, avatar):
+    return {"id": id, "name": name, "country": country, "avatar": avatar} if id is not None else None
+
+
+ORDER_LIST_ROW = RowSerializer(
+    ("id", Order.id),
+    ("title", Order.title),
+    ("subject", Order.subject),
+    ("type", Order.type),
+    ("pages", Order.pages),
+    ("deadline", Order.deadline, utc_iso),
+    ("budget", Order.budget),
+    ("status", Order.status),
+    ("client", (OrderClient.id, OrderClient.full_name, OrderClient.country, OrderClient.profile_image), _client),
+    ("created_at", Order.created_at, utc_iso),
+    ("writer_assigned", Order.writer_id, lambda writer_id: writer_id is not None),
+)
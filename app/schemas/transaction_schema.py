@@ -1,5 +1,29 @@
 from app.extensions import ma
+from app.models.transaction import Transaction
+from app.utils.serialization import RowSerializer, utc_iso
 
 class TransactionSchema(ma.Schema):
     class Meta:
         fields = ("id", "type", "amount", "description", "status", "order_id", "created_at")
+
+
+# ---------------------------------------
+# row serializers
+# ---------------------------------------
+
+TRANSACTION_ROW = RowSerializer(
+    ("id", Transaction.id),
+    ("type", Transaction.type),
+    ("amount", Transaction.amount),
+    ("description", Transaction.description),
+    ("status", Transaction.status),
+    ("order_id", Transaction.order_id),
+    ("created_at", Transaction.created_at, utc_iso),
+)
+
+WITHDRAWAL_ROW = RowSerializer(
+    ("id", Transaction.id),
+    ("amount", Transaction.amount),
+    ("status", Transaction.status),
+    ("created_at", Transaction.created_at, utc_iso),
+)
@@ -1,4 +1,6 @@
 from app.extensions import ma
+from app.models.user import User
+from app.utils.serialization import RowSerializer
 
 class UserPublicSchema(ma.Schema):
     class Meta:
@@ -7,3 +9,15 @@ class UserPublicSchema(ma.Schema):
 class UserProfileSchema(ma.Schema):
     class Meta:
         fields = ("id", "email", "full_name", "profile_image", "bio", "rating", "completed_orders", "total_earned", "success_rate", "specializations", "joined_at")
+
+
+# ---------------------------------------
+# row serializers
+# ---------------------------------------
+
+USER_SUMMARY_ROW = RowSerializer(
+    ("id", User.id),
+    ("name", User.full_name),
+    ("email", User.email),
+    ("avatar", User.profile_image),
+)
@@ -1,12 +1,19 @@
+import logging
 import os
 from werkzeug.utils import secure_filename
 from app.models.writer_application import WriterApplication
-from app.extensions import db
+from app.extensions import db, metrics
+from app.services.document_service import application_files, enqueue_document
+from app.services.upload_service import stage_upload
 from datetime import datetime
+import time
 import uuid
 from flask import current_app
 
-def save_uploaded_file(file, subdir):
+logger = logging.getLogger(__name__)
+
+def save_uploaded_file(file, subdir, application_id=None):
+    """Stage an upload under UPLOAD_FOLDER/subdir; it is moved into place when the application commits."""
     if not file:
         return None
 
@@ -16,43 +23,81 @@ def save_uploaded_file(file, subdir):
 
     filename = secure_filename(file.filename)
     unique_name = f"{uuid.uuid4().hex}_{filename}"
-    upload_path = os.path.join(upload_folder, subdir)
-    os.makedirs(upload_path, exist_ok=True)
-    full_path = os.path.join(upload_path, unique_name)
-
-    print(f"Saving file {file.filename} to {full_path}")
-    file.save(full_path)
-    if os.path.exists(full_path):
-        print(f"File saved: {full_path}")
-    else:
-        print(f"Failed to save file: {full_path}")
+    full_path = os.path.join(upload_folder, subdir, unique_name)
+
+    started = time.perf_counter()
+    staged = stage_upload(file, full_path, "application", application_id)
+    metrics.observe_upload("application", staged, started)
+    logger.debug("staged upload %s for %s", file.filename, full_path)
     return full_path
 
 
+def build_file_manifest(essay_path=None, cv_path=None, work_samples=(), degree_certificates=()):
+    """Upload paths relative to UPLOAD_FOLDER, computed once when the files are saved."""
+    upload_folder = current_app.config.get("UPLOAD_FOLDER")
+
+    def relative(path):
+        return os.path.relpath(path, upload_folder).replace(os.sep, "/") if path else None
+
+    return {
+        "essay": relative(essay_path),
+        "cv": relative(cv_path),
+        "work_samples": [relative(p) for p in work_samples if p],
+        "degree_certificates": [relative(p) for p in degree_certificates if p],
+    }
+
+
+def file_manifest(application):
+    """Stored manifest, or one derived from the absolute paths for rows saved before it existed."""
+    if application.file_manifest is not None:
+        return application.file_manifest
+    return build_file_manifest(
+        application.essay_file_path, application.cv_file_path,
+        application.work_samples or (), application.degree_certificates or (),
+    )
+
+
+def backfill_file_manifests(batch_size=500):
+    """Store manifests for applications created before the column existed; returns rows updated."""
+    updated = 0
+    while True:
+        batch = (
+            WriterApplication.query.filter(WriterApplication.file_manifest.is_(None))
+            .limit(batch_size).all()
+        )
+        if not batch:
+            return updated
+        for application in batch:
+            application.file_manifest = file_manifest(application)
+        db.session.commit()
+        updated += len(batch)
+
+
 def create_writer_application(user, form_data, files):
     existing = WriterApplication.query.filter_by(user_id=user.id).first()
     if existing:
         raise Exception("You already have a pending application.")
 
+    application_id = str(uuid.uuid4())
     essay_file = files.get("essayFile")
     cv_file = files.get("cvFile")
 
-    essay_path = save_uploaded_file(essay_file, f"{user.id}/essay") if essay_file else None
-    cv_path = save_uploaded_file(cv_file, f"{user.id}/cv") if cv_file else None
+    essay_path = save_uploaded_file(essay_file, f"{user.id}/essay", application_id) if essay_file else None
+    cv_path = save_uploaded_file(cv_file, f"{user.id}/cv", application_id) if cv_file else None
 
     # multiple files
     work_sample_paths = []
     for f in files.getlist("workSamples"):
-        path = save_uploaded_file(f, f"{user.id}/work_samples")
+        path = save_uploaded_file(f, f"{user.id}/work_samples", application_id)
         work_sample_paths.append(path)
 
     degree_paths = []
     for f in files.getlist("degreeCertificates"):
-        path = save_uploaded_file(f, f"{user.id}/degree_certificates")
+        path = save_uploaded_file(f, f"{user.id}/degree_certificates", application_id)
         degree_paths.append(path)
 
     application = WriterApplication(
-        id=str(uuid.uuid4()),
+        id=application_id,
         user_id=user.id,
         country=form_data.get("country"),
         city=form_data.get("city"),
@@ -67,11 +112,15 @@ def create_writer_application(user, form_data, files):
         work_samples=work_sample_paths,
         cv_file_path=cv_path,
         degree_certificates=degree_paths,
+        file_manifest=build_file_manifest(essay_path, cv_path, work_sample_paths, degree_paths),
         status="pending",
         created_at=datetime.utcnow(),
     )
 
     db.session.add(application)
+    upload_folder = current_app.config.get("UPLOAD_FOLDER")
+    for kind, relpath in application_files(application.file_manifest):
+        enqueue_document("application", application.id, kind, os.path.join(upload_folder, relpath))
     user.application_status = "pending"
     db.session.commit()
 
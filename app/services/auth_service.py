@@ -1,6 +1,7 @@
 from app.extensions import db
 from app.models.user import User
-from app.utils.auth_utils import hash_password, check_password
+from app.services import password_service
+from app.utils.auth_utils import hash_password, check_password, token_claims_for_user
 from app.utils.exceptions import ServiceError
 from flask_jwt_extended import create_access_token, create_refresh_token
 from datetime import timedelta
@@ -29,9 +30,14 @@ def authenticate_user(email, password):
     user = User.query.filter_by(email=email).first()
     if not user or not check_password(password, user.password_hash):
         raise ServiceError(code="AUTH_FAILED", message="Invalid credentials")
+
+    # upgrade hashes made at an older cost while we still have the plaintext
+    if password_service.needs_rehash(user.password_hash):
+        user.password_hash = hash_password(password)
+        db.session.commit()
     return user
 
 def generate_tokens_for_user(user):
-    access = create_access_token(identity=user.id, expires_delta=timedelta(seconds=current_app.config.get("ACCESS_EXPIRES", 86400)))
+    access = create_access_token(identity=user.id, additional_claims=token_claims_for_user(user), expires_delta=timedelta(seconds=current_app.config.get("ACCESS_EXPIRES", 86400)))
     refresh = create_refresh_token(identity=user.id, expires_delta=timedelta(seconds=current_app.config.get("REFRESH_EXPIRES", 86400)))
     return access, refresh
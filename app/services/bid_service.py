@@ -1,4 +1,4 @@
-from app.extensions import db
+from app.extensions import db, response_cache
 from app.models.bid import Bid
 from app.models.order import Order
 from datetime import datetime, timedelta
@@ -29,4 +29,6 @@ def place_bid(order_id, user_id, bid_amount, message=None, estimated_completion=
 
     db.session.add(bid)
     db.session.commit()
+    # available-orders shows bid counts
+    response_cache.invalidate("orders")
     return bid
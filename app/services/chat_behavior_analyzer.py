@@ -1,11 +1,16 @@
+import logging
 import re
-from presidio_analyzer import AnalyzerEngine
-from app.services.chat_service import normalize_text
-
-analyzer = AnalyzerEngine()
+from app.services.chat_service import normalize_text, get_analyzer
+from app.extensions import metrics
 
 WINDOW = 25
 
+logger = logging.getLogger(__name__)
+
+ANALYZE_SECONDS = metrics.histogram("chat_analyze_seconds", "analyze_chat_behavior duration")
+
+
+@ANALYZE_SECONDS.time()
 def analyze_chat_behavior(messages):
     """
     messages = list of message objects (sorted by ascending time)
@@ -18,10 +23,12 @@ def analyze_chat_behavior(messages):
     # 2. Normalize obfuscation
     norm = normalize_text(raw_text)
 
-    print(f"chat content = {norm}")
+    # never log the chat text itself; it is exactly the PII we are scanning for
+    logger.debug("analyzing %d messages (%d chars)", len(messages), len(norm))
 
-    # 3. Presidio hits
-    presidio_hits = analyzer.analyze(text=norm, language="en")
+    # 3. Presidio hits (shared engine with sanitize_message; none if Presidio is unavailable)
+    analyzer = get_analyzer()
+    presidio_hits = analyzer.analyze(text=norm, language="en") if analyzer else []
 
     # 4. Regex fallback hits
     regex_hits = []
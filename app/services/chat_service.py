@@ -1,8 +1,12 @@
+import logging
 import re
-from app.extensions import db
+import threading
+from app.extensions import db, metrics
 from app.models.chat import Chat
 from app.models.message import Message
 
+logger = logging.getLogger(__name__)
+
 # ---------------------------------------
 # 1. TEXT NORMALIZATION (obfuscation fixing)
 # ---------------------------------------
@@ -68,30 +72,56 @@ def regex_mask(t: str):
 
 
 # ---------------------------------------
-# 3. PRESIDIO (OPTIONAL) — add if installed
+# 3. PRESIDIO (OPTIONAL) — loaded on first use
 # ---------------------------------------
 
-try:
-    from presidio_analyzer import AnalyzerEngine
-    analyzer = AnalyzerEngine()
-
-    def presidio_mask(t: str):
-        results = analyzer.analyze(text=t, language="en")
-        for r in sorted(results, key=lambda x: x.start, reverse=True):
-            t = t[:r.start] + "[REDACTED]" + t[r.end:]
-        return t
-
-except Exception:
-    analyzer = None
-
-    def presidio_mask(t: str):
+_analyzer = None
+_analyzer_loaded = False
+_analyzer_lock = threading.Lock()
+
+
+def get_analyzer():
+    """
+    The process-wide Presidio AnalyzerEngine, or None if Presidio is unavailable.
+
+    Building the engine loads a spaCy model (seconds and hundreds of MB), so it
+    is done by the first caller instead of at import; CLI commands, tests and
+    workers that never scan chat text don't pay for it.
+    """
+    global _analyzer, _analyzer_loaded
+    if not _analyzer_loaded:
+        with _analyzer_lock:
+            if not _analyzer_loaded:
+                try:
+                    from presidio_analyzer import AnalyzerEngine
+                    _analyzer = AnalyzerEngine()
+                except ImportError:
+                    _analyzer = None
+                except Exception:
+                    logger.exception("could not load the Presidio analyzer; using regex masking only")
+                    _analyzer = None
+                _analyzer_loaded = True
+    return _analyzer
+
+
+def presidio_mask(t: str):
+    analyzer = get_analyzer()
+    if analyzer is None:
         return t  # fallback if Presidio not available
+    results = analyzer.analyze(text=t, language="en")
+    for r in sorted(results, key=lambda x: x.start, reverse=True):
+        t = t[:r.start] + "[REDACTED]" + t[r.end:]
+    return t
 
 
 # ---------------------------------------
 # 4. MAIN SANITIZER PIPELINE (call everywhere)
 # ---------------------------------------
 
+SANITIZE_SECONDS = metrics.histogram("chat_sanitize_seconds", "sanitize_message duration")
+
+
+@SANITIZE_SECONDS.time()
 def sanitize_message(content: str) -> str:
     """Runs normalization → presidio → regex in that order."""
 
@@ -137,3 +167,38 @@ def add_message(chat_id, sender_id, content):
     db.session.add(msg)
     db.session.commit()
     return msg
+
+
+def last_messages(chat_ids):
+    """{chat_id: newest Message} for many chats in one query."""
+    if not chat_ids:
+        return {}
+    ranked = (
+        db.session.query(
+            Message.id,
+            db.func.row_number().over(
+                partition_by=Message.chat_id,
+                order_by=(Message.created_at.desc(), Message.id.desc()),
+            ).label("rank"),
+        )
+        .filter(Message.chat_id.in_(chat_ids))
+        .subquery()
+    )
+    newest = Message.query.join(ranked, ranked.c.id == Message.id).filter(ranked.c.rank == 1)
+    return {m.chat_id: m for m in newest}
+
+
+def unread_counts(chat_ids, user_id):
+    """{chat_id: messages from the other participant that `user_id` hasn't read}, one grouped COUNT."""
+    if not chat_ids:
+        return {}
+    rows = (
+        db.session.query(Message.chat_id, db.func.count(Message.id))
+        .filter(
+            Message.chat_id.in_(chat_ids),
+            Message.sender_id != user_id,
+            Message.is_read == False,
+        )
+        .group_by(Message.chat_id)
+    )
+    return dict(rows.all())
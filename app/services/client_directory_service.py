@@ -0,0 +1,96 @@
+from sqlalchemy import func, or_
+from app.extensions import db
+from app.models.user import User
+from app.models.order import Order
+from app.services.user_search_service import escape_like
+from app.utils.pagination import keyset_paginate
+
+SORTS = ("joinedDate", "totalOrders", "totalSpent")
+
+MAX_DIRECTORY_LIMIT = 200
+
+
+def _search_filter(search):
+    # name/email ILIKE is served by the trigram indexes on PostgreSQL; IDs match exactly
+    pattern = f"%{escape_like(search)}%"
+    return or_(
+        User.id == search,
+        User.full_name.ilike(pattern, escape="\\"),
+        User.email.ilike(pattern, escape="\\"),
+    )
+
+
+def _order_totals():
+    return (
+        db.session.query(
+            Order.client_id.label("client_id"),
+            func.count(Order.id).label("total_orders"),
+            func.sum(Order.budget).label("total_spent"),
+        )
+        .filter(Order.client_id.isnot(None))
+        .group_by(Order.client_id)
+        .subquery()
+    )
+
+
+def _serialize(client, total_orders, total_spent):
+    return {
+        "id": client.id,
+        "name": client.full_name,
+        "email": client.email,
+        "phone": getattr(client, "phone", None),
+        "joinedDate": client.joined_at.strftime("%Y-%m-%d"),
+        "totalOrders": total_orders or 0,
+        "totalSpent": total_spent or 0,
+        "status": "active" if client.is_verified else "suspended",
+    }
+
+
+def list_client_directory(search=None, sort="joinedDate", descending=True, limit=50, cursor=None):
+    """
+    One page of the admin client directory with per-client order totals.
+
+    Sorting by join date pages through users first and totals just that page
+    (an indexed IN on orders.client_id). Sorting by a total joins the grouped
+    totals subquery and seeks on (total, id). Raises ValueError for a bad cursor.
+    """
+    base = db.session.query(User).filter(User.role == "client")
+    if search:
+        base = base.filter(_search_filter(search))
+    total = base.order_by(None).count()
+    scope = f"clients:{sort}:{'desc' if descending else 'asc'}"
+
+    if sort == "joinedDate":
+        clients, next_cursor = keyset_paginate(
+            base, (User.joined_at, User.id), cursor, limit, descending, scope=scope,
+        )
+        totals = {}
+        if clients:
+            totals = {
+                row.client_id: (row.total_orders, row.total_spent)
+                for row in db.session.query(
+                    Order.client_id, func.count(Order.id).label("total_orders"),
+                    func.sum(Order.budget).label("total_spent"),
+                )
+                .filter(Order.client_id.in_([c.id for c in clients]))
+                .group_by(Order.client_id)
+            }
+        rows = [(c, *totals.get(c.id, (0, 0))) for c in clients]
+    else:
+        totals = _order_totals()
+        total_orders = func.coalesce(totals.c.total_orders, 0)
+        total_spent = func.coalesce(totals.c.total_spent, 0.0)
+        metric = total_orders if sort == "totalOrders" else total_spent
+        q = (
+            base.outerjoin(totals, totals.c.client_id == User.id)
+            .add_columns(total_orders.label("total_orders"), total_spent.label("total_spent"))
+        )
+        rows, next_cursor = keyset_paginate(
+            q, (metric, User.id), cursor, limit, descending, scope=scope,
+            key=lambda row: [row.total_orders if sort == "totalOrders" else row.total_spent, row[0].id],
+        )
+
+    return {
+        "clients": [_serialize(*row) for row in rows],
+        "pagination": {"total": total, "limit": limit, "next_cursor": next_cursor},
+    }
@@ -0,0 +1,215 @@
+import logging
+import multiprocessing
+import os
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from flask import current_app, url_for
+from sqlalchemy import and_, or_, update
+from app.extensions import db
+from app.models.document_manifest import DocumentManifest
+from app.utils.documents import extract_document
+
+logger = logging.getLogger(__name__)
+
+
+# ---------------------------------------
+# 1. ENQUEUE (request side)
+# ---------------------------------------
+
+def enqueue_document(owner_type, owner_id, kind, path):
+    """Queue an upload for preprocessing; the row commits with the caller's transaction."""
+    if not path:
+        return None
+    document = DocumentManifest(
+        owner_type=owner_type,
+        owner_id=owner_id,
+        kind=kind,
+        path=os.path.abspath(path),
+        filename=os.path.basename(path),
+        status="pending",
+    )
+    db.session.add(document)
+    return document
+
+
+def documents_for(owner_type, owner_ids):
+    """{owner_id: [DocumentManifest, ...]} for every owner in one query."""
+    owner_ids = list(owner_ids)
+    grouped = {owner_id: [] for owner_id in owner_ids}
+    if not owner_ids:
+        return grouped
+    rows = (
+        DocumentManifest.query
+        .filter(DocumentManifest.owner_type == owner_type, DocumentManifest.owner_id.in_(owner_ids))
+        .order_by(DocumentManifest.id)
+    )
+    for document in rows:
+        grouped[document.owner_id].append(document)
+    return grouped
+
+
+def serialize_document(document):
+    def artifact_url(endpoint, present):
+        return url_for(endpoint, document_id=document.id, _external=True) if present else None
+
+    return {
+        "id": document.id,
+        "kind": document.kind,
+        "filename": document.filename,
+        "status": document.status,
+        "content_type": document.content_type,
+        "size_bytes": document.size_bytes,
+        "sha256": document.sha256,
+        "page_count": document.page_count,
+        "text_excerpt": document.text_excerpt,
+        "thumbnail_url": artifact_url("documents.get_thumbnail", document.thumbnail_path),
+        "text_url": artifact_url("documents.get_text", document.text_path),
+    }
+
+
+def enqueue_existing_uploads():
+    """Queue files uploaded before the pipeline existed; returns the number of rows queued."""
+    from app.models.writer_application import WriterApplication
+    from app.models.submission import Submission
+    from app.services.application_service import file_manifest
+
+    def unqueued(model, owner_type):
+        queued = db.session.query(DocumentManifest.owner_id).filter(DocumentManifest.owner_type == owner_type)
+        return model.query.filter(model.id.not_in(queued))
+
+    upload_folder = current_app.config.get("UPLOAD_FOLDER")
+    queued = 0
+    for application in unqueued(WriterApplication, "application"):
+        for kind, relpath in application_files(file_manifest(application)):
+            enqueue_document("application", application.id, kind, os.path.join(upload_folder, relpath))
+            queued += 1
+    for submission in unqueued(Submission, "submission"):
+        for entry in submission.files or ():
+            enqueue_document("submission", submission.id, "submission", entry.get("path"))
+            queued += 1
+    db.session.commit()
+    return queued
+
+
+def application_files(manifest):
+    """(kind, relative path) for every file in an application's file manifest."""
+    for kind in ("essay", "cv"):
+        if manifest.get(kind):
+            yield kind, manifest[kind]
+    for kind, key in (("work_sample", "work_samples"), ("degree_certificate", "degree_certificates")):
+        for relpath in manifest.get(key) or ():
+            yield kind, relpath
+
+
+# ---------------------------------------
+# 2. CLAIM / RECORD (worker side)
+# ---------------------------------------
+
+def claim_documents(limit):
+    """
+    Mark up to `limit` pending rows as processing and return them.
+
+    The UPDATE re-checks the claimable condition, so concurrent workers that
+    selected the same ids only claim each row once. Rows stuck in processing
+    longer than DOCUMENT_CLAIM_TIMEOUT (a crashed worker) are claimed again
+    until DOCUMENT_MAX_ATTEMPTS is reached, then failed.
+    """
+    cfg = current_app.config
+    now = datetime.utcnow()
+    stale = and_(
+        DocumentManifest.status == "processing",
+        DocumentManifest.claimed_at < now - timedelta(seconds=cfg["DOCUMENT_CLAIM_TIMEOUT"]),
+    )
+    exhausted = DocumentManifest.attempts >= cfg["DOCUMENT_MAX_ATTEMPTS"]
+
+    db.session.execute(
+        update(DocumentManifest).where(stale, exhausted)
+        .values(status="failed", error="worker did not finish", claim_token=None)
+        .execution_options(synchronize_session=False)
+    )
+
+    claimable = and_(or_(DocumentManifest.status == "pending", stale), ~exhausted)
+    ids = [
+        row.id for row in
+        db.session.query(DocumentManifest.id).filter(claimable).order_by(DocumentManifest.id).limit(limit)
+    ]
+    if not ids:
+        db.session.commit()
+        return []
+
+    token = uuid.uuid4().hex
+    db.session.execute(
+        update(DocumentManifest).where(DocumentManifest.id.in_(ids), claimable)
+        .values(status="processing", claim_token=token, claimed_at=now, attempts=DocumentManifest.attempts + 1)
+        .execution_options(synchronize_session=False)
+    )
+    db.session.commit()
+    return DocumentManifest.query.filter_by(claim_token=token).order_by(DocumentManifest.id).all()
+
+
+def _record(document_id, token, result=None, error=None):
+    document = DocumentManifest.query.get(document_id)
+    if document is None or document.claim_token != token:
+        # reclaimed after a timeout; the newer claim owns the row now
+        return
+
+    if error is None:
+        for field, value in result.items():
+            setattr(document, field, value)
+        document.status = "done"
+        document.error = None
+    else:
+        retry = document.attempts < current_app.config["DOCUMENT_MAX_ATTEMPTS"]
+        document.status = "pending" if retry else "failed"
+        document.error = error
+        logger.warning("document %s (%s) failed: %s", document.id, document.path, error)
+
+    document.claim_token = None
+    document.processed_at = datetime.utcnow()
+    db.session.commit()
+
+
+def process_pending(workers=None, batch_size=None, poll_interval=None, once=False):
+    """
+    Drain the queue through a pool of extraction processes.
+
+    Children only run `extract_document` on a path and return a dict; this
+    process does all database work. With `once` the loop returns when nothing
+    is left to claim, otherwise it polls. Returns the number of rows handled.
+    """
+    cfg = current_app.config
+    workers = workers or cfg["DOCUMENT_WORKERS"]
+    batch_size = batch_size or workers * 4
+    poll_interval = poll_interval or cfg["DOCUMENT_POLL_INTERVAL"]
+    options = {
+        "artifacts_dir": cfg["DOCUMENT_ARTIFACTS_FOLDER"],
+        "thumbnail_px": cfg["DOCUMENT_THUMBNAIL_PX"],
+        "max_text_chars": cfg["DOCUMENT_TEXT_MAX_CHARS"],
+    }
+
+    handled = 0
+    # spawn: children import only the extraction module, not a copy of this app and its pools
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+        while True:
+            batch = claim_documents(batch_size)
+            if not batch:
+                if once:
+                    return handled
+                time.sleep(poll_interval)
+                continue
+
+            futures = {
+                pool.submit(extract_document, document.path, **options): (document.id, document.claim_token)
+                for document in batch
+            }
+            db.session.remove()
+            for future in as_completed(futures):
+                document_id, token = futures[future]
+                try:
+                    result, error = future.result(), None
+                except Exception as e:
+                    result, error = None, f"{type(e).__name__}: {e}"
+                _record(document_id, token, result, error)
+            handled += len(batch)
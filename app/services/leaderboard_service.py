@@ -1,19 +1,286 @@
+import threading
+import time
+from bisect import bisect_left
+from datetime import datetime, timedelta
+from flask import current_app
+from sqlalchemy import event, func, inspect, literal, select
+from sqlalchemy.dialects import postgresql, sqlite
 from app.models.user import User
-from app.extensions import db
+from app.models.transaction import Transaction
+from app.models.leaderboard_entry import LeaderboardEntry
+from app.extensions import db, response_cache
 
-def get_leaderboard(period="month", limit=50):
-    # Simple leaderboard sorted by total_earned
-    users = User.query.order_by(User.total_earned.desc()).limit(limit).all()
-    leaderboard = []
-    rank = 1
-    for user in users:
-        leaderboard.append({
+PERIODS = ("week", "month", "all")
+
+# Upper bound for ?limit= so a snapshot only needs to hold this many detailed rows
+MAX_LEADERBOARD_LIMIT = 100
+
+ALL_TIME_START = datetime(1970, 1, 1)
+
+
+def period_start(period, at=None):
+    """Return the start of the rollup bucket that `at` falls into."""
+    at = at or datetime.utcnow()
+    if period == "week":
+        day = at - timedelta(days=at.weekday())
+        return day.replace(hour=0, minute=0, second=0, microsecond=0)
+    if period == "month":
+        return at.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    return ALL_TIME_START
+
+
+# ---------------------------------------
+# 1. INCREMENTAL ROLLUP MAINTENANCE
+# ---------------------------------------
+
+def _counts_as_earning(ttype, status):
+    return ttype == "earning" and status == "completed"
+
+
+def _previous_value(state, attr):
+    history = state.attrs[attr].history
+    if history.deleted:
+        return history.deleted[0]
+    return getattr(state.object, attr)
+
+
+def _earning_deltas(session):
+    """Collect (user_id, amount_delta, orders_delta, created_at) for this flush."""
+    deltas = []
+
+    for obj in session.new:
+        if isinstance(obj, Transaction) and _counts_as_earning(obj.type, obj.status):
+            deltas.append((obj.user_id, obj.amount or 0, 1 if obj.order_id else 0, obj.created_at))
+
+    for obj in session.dirty:
+        if not isinstance(obj, Transaction):
+            continue
+        state = inspect(obj)
+        if not any(state.attrs[a].history.has_changes() for a in ("type", "status", "amount")):
+            continue
+        was = _counts_as_earning(_previous_value(state, "type"), _previous_value(state, "status"))
+        now = _counts_as_earning(obj.type, obj.status)
+        old_amount = (_previous_value(state, "amount") or 0) if was else 0
+        new_amount = (obj.amount or 0) if now else 0
+        if old_amount != new_amount or was != now:
+            orders = (int(now) - int(was)) if obj.order_id else 0
+            deltas.append((obj.user_id, new_amount - old_amount, orders, obj.created_at))
+
+    for obj in session.deleted:
+        if isinstance(obj, Transaction) and _counts_as_earning(obj.type, obj.status):
+            deltas.append((obj.user_id, -(obj.amount or 0), -1 if obj.order_id else 0, obj.created_at))
+
+    return deltas
+
+
+def _upsert_entry(connection, period, start, user_id, amount, orders):
+    table = LeaderboardEntry.__table__
+    now = datetime.utcnow()
+    values = dict(
+        period=period, period_start=start, user_id=user_id,
+        total_earned=amount, orders_completed=orders, updated_at=now,
+    )
+
+    insert = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}.get(connection.dialect.name)
+    if insert is not None:
+        stmt = insert(table).values(**values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["period", "period_start", "user_id"],
+            set_={
+                "total_earned": table.c.total_earned + stmt.excluded.total_earned,
+                "orders_completed": table.c.orders_completed + stmt.excluded.orders_completed,
+                "updated_at": now,
+            },
+        )
+        connection.execute(stmt)
+        return
+
+    result = connection.execute(
+        table.update()
+        .where(
+            table.c.period == period,
+            table.c.period_start == start,
+            table.c.user_id == user_id,
+        )
+        .values(
+            total_earned=table.c.total_earned + amount,
+            orders_completed=table.c.orders_completed + orders,
+            updated_at=now,
+        )
+    )
+    if result.rowcount == 0:
+        connection.execute(table.insert().values(**values))
+
+
+def apply_earning_deltas(connection, deltas):
+    """Fold earning deltas into every period bucket they belong to."""
+    for user_id, amount, orders, created_at in deltas:
+        if not user_id or (not amount and not orders):
+            continue
+        for period in PERIODS:
+            _upsert_entry(connection, period, period_start(period, created_at), user_id, amount, orders)
+
+
+@event.listens_for(db.session, "after_flush")
+def _track_earnings(session, flush_context):
+    deltas = _earning_deltas(session)
+    if deltas:
+        apply_earning_deltas(session.connection(), deltas)
+        session.info["leaderboard_changed"] = True
+
+
+@event.listens_for(db.session, "after_commit")
+def _refresh_after_commit(session):
+    if session.info.pop("leaderboard_changed", False):
+        invalidate_snapshots()
+
+
+@event.listens_for(db.session, "after_rollback")
+def _discard_after_rollback(session):
+    session.info.pop("leaderboard_changed", None)
+
+
+def rebuild_leaderboard():
+    """Recompute the current week/month buckets and the all-time bucket from transactions."""
+    table = LeaderboardEntry.__table__
+    now = datetime.utcnow()
+
+    for period in PERIODS:
+        start = period_start(period, now)
+        db.session.execute(
+            table.delete().where(table.c.period == period, table.c.period_start == start)
+        )
+
+        source = (
+            select(
+                literal(period),
+                literal(start),
+                Transaction.user_id,
+                func.sum(Transaction.amount),
+                func.count(Transaction.order_id),
+                literal(now),
+            )
+            .where(
+                Transaction.type == "earning",
+                Transaction.status == "completed",
+                Transaction.user_id.isnot(None),
+            )
+            .group_by(Transaction.user_id)
+        )
+        if period != "all":
+            source = source.where(Transaction.created_at >= start)
+
+        db.session.execute(
+            table.insert().from_select(
+                ["period", "period_start", "user_id", "total_earned", "orders_completed", "updated_at"],
+                source,
+            )
+        )
+
+    db.session.commit()
+    invalidate_snapshots()
+
+
+# ---------------------------------------
+# 2. IN-MEMORY SNAPSHOTS (ranking)
+# ---------------------------------------
+
+class _Snapshot:
+    """
+    Sorted view of one period bucket. `keys` holds (-total, user_id) in rank
+    order, so any writer's rank is a dict lookup plus a bisect.
+    """
+
+    def __init__(self, start, keys, totals, top):
+        self.start = start
+        self.keys = keys
+        self.totals = totals
+        self.top = top
+        self.built_at = time.monotonic()
+
+
+_snapshots = {}
+_snapshot_lock = threading.Lock()
+
+
+def invalidate_snapshots():
+    _snapshots.clear()
+    response_cache.invalidate("leaderboard")
+
+
+def _build_snapshot(period, start):
+    rows = (
+        db.session.query(LeaderboardEntry.user_id, LeaderboardEntry.total_earned, LeaderboardEntry.orders_completed)
+        .join(User, User.id == LeaderboardEntry.user_id)
+        .filter(
+            LeaderboardEntry.period == period,
+            LeaderboardEntry.period_start == start,
+            LeaderboardEntry.total_earned > 0,
+            User.role == "writer",
+        )
+        .all()
+    )
+
+    keys = sorted((-float(total), user_id) for user_id, total, _ in rows)
+    totals = {user_id: float(total) for user_id, total, _ in rows}
+    orders = {user_id: completed for user_id, _, completed in rows}
+
+    top_ids = [user_id for _, user_id in keys[:MAX_LEADERBOARD_LIMIT]]
+    users = {}
+    if top_ids:
+        users = {
+            u.id: u for u in db.session.query(
+                User.id, User.full_name, User.profile_image, User.rating, User.completed_orders
+            ).filter(User.id.in_(top_ids))
+        }
+
+    top = []
+    for rank, user_id in enumerate(top_ids, start=1):
+        user = users.get(user_id)
+        if not user:
+            continue
+        top.append({
             "rank": rank,
             "writer": {"id": user.id, "name": user.full_name, "avatar": user.profile_image},
-            "total_earned": float(user.total_earned),
-            "orders_completed": user.completed_orders,
-            "average_rating": float(user.rating),
-            "success_rate": 100.0 if user.completed_orders > 0 else 0.0
+            "total_earned": totals[user_id],
+            "orders_completed": orders[user_id] or 0,
+            "average_rating": float(user.rating or 0),
+            "success_rate": 100.0 if (user.completed_orders or 0) > 0 else 0.0
         })
-        rank += 1
-    return leaderboard
+
+    return _Snapshot(start, keys, totals, top)
+
+
+def get_snapshot(period):
+    ttl = current_app.config.get("LEADERBOARD_SNAPSHOT_TTL", 60)
+    start = period_start(period)
+    snap = _snapshots.get(period)
+    if snap and snap.start == start and time.monotonic() - snap.built_at < ttl:
+        return snap
+
+    with _snapshot_lock:
+        snap = _snapshots.get(period)
+        if snap and snap.start == start and time.monotonic() - snap.built_at < ttl:
+            return snap
+        snap = _build_snapshot(period, start)
+        _snapshots[period] = snap
+        return snap
+
+
+# ---------------------------------------
+# 3. PUBLIC API
+# ---------------------------------------
+
+def get_leaderboard(period="month", limit=50):
+    limit = max(1, min(int(limit), MAX_LEADERBOARD_LIMIT))
+    return get_snapshot(period).top[:limit]
+
+
+def get_user_rank(user_id, period="month"):
+    """O(log n) rank lookup for any writer; None when they have no earnings this period."""
+    snap = get_snapshot(period)
+    total = snap.totals.get(user_id)
+    if total is None:
+        return None
+    rank = bisect_left(snap.keys, (-total, user_id)) + 1
+    return {"rank": rank, "total_earned": total, "total_writers": len(snap.keys)}
@@ -1,3 +1,4 @@
+from sqlalchemy import insert, select
 from app.extensions import db
 from app.models.notification import Notification
 from app.models.user import User
@@ -78,3 +79,35 @@ def send_notification_to_all(title, message, notif_type="info", details=None, se
         db.session.add(notif)
     db.session.commit()
     return len(users)
+
+
+def send_notifications_to_users(notes, notif_type="info", sender_id=None):
+    """
+    Queue individual notifications in one multi-row INSERT; the caller commits.
+
+    `notes` are dicts with user_id, title, message and optionally details.
+    Recipients' emails are looked up in one query; notes for users that no
+    longer exist are dropped. Returns the number queued.
+    """
+    if not notes:
+        return 0
+    emails = dict(db.session.execute(
+        select(User.id, User.email).where(User.id.in_({n["user_id"] for n in notes}))
+    ).all())
+    now = datetime.utcnow()
+    rows = [
+        {
+            "sender_id": sender_id,
+            "user_email": emails[n["user_id"]],
+            "target_type": "individual",
+            "type": notif_type,
+            "title": n["title"],
+            "message": n["message"],
+            "details": n.get("details"),
+            "created_at": now,
+        }
+        for n in notes if n["user_id"] in emails
+    ]
+    if rows:
+        db.session.execute(insert(Notification), rows)
+    return len(rows)
@@ -1,18 +1,25 @@
-from app.extensions import db
+from app.extensions import db, response_cache, metrics
 from app.models.order import Order
+from app.services.upload_service import stage_upload
 from datetime import timezone, datetime
 from flask import current_app, url_for, send_file, jsonify
 from werkzeug.utils import secure_filename
-import os, uuid
+import os, time, uuid
 
 
-def save_uploaded_file(file, upload_dir):
-    """Helper to securely save an uploaded file and return filename + path."""
-    os.makedirs(upload_dir, exist_ok=True)
+def save_uploaded_file(file, upload_dir, kind="order", owner_id=None):
+    """
+    Helper to securely stage an uploaded file and return filename + final path.
+
+    The file only appears at the returned path once the session commits
+    (see upload_service); `kind` and `owner_id` identify the row that references it.
+    """
     filename = secure_filename(file.filename)
     unique_name = f"{uuid.uuid4().hex}_{filename}"
     file_path = os.path.join(upload_dir, unique_name)
-    file.save(file_path)
+    started = time.perf_counter()
+    staged = stage_upload(file, file_path, kind, owner_id)
+    metrics.observe_upload(kind, staged, started)
     return unique_name, file_path
 
 
@@ -37,9 +44,8 @@ def create_order(user, form_data, files=None):
     )
 
     db.session.add(order)
-    db.session.commit()
 
-    # --- Handle file uploads ---
+    # --- Handle file uploads (moved into place when the order commits) ---
     saved_files = []
     if files:
         root_dir = current_app.config.get("ORDERS_FOLDER", "uploads/orders")
@@ -48,15 +54,16 @@ def create_order(user, form_data, files=None):
         for file in files.getlist("attachedFiles"):
             if not file or not file.filename:
                 continue
-            fname, fpath = save_uploaded_file(file, order_dir)
+            fname, fpath = save_uploaded_file(file, order_dir, owner_id=order.id)
             saved_files.append(fname)
 
     if saved_files:
         existing = order.requirements or ""
         file_list = "\n".join(saved_files)
         order.requirements = f"{existing}\n\n[Attachments: {len(saved_files)} file(s)]\n{file_list}"
-        db.session.commit()
+    db.session.commit()
 
+    response_cache.invalidate("orders")
     return order
 
 def update_order_status(order, **kwargs):
@@ -64,6 +71,7 @@ def update_order_status(order, **kwargs):
         if hasattr(order, k):
             setattr(order, k, v)
     db.session.commit()
+    response_cache.invalidate("orders")
     return order
 
 
@@ -0,0 +1,79 @@
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+import bcrypt as _bcrypt
+from flask import current_app
+from app.utils.exceptions import ServiceError
+
+# bcrypt releases the GIL while hashing, so a small thread pool is enough to
+# keep the CPU work off request threads. The pool (plus a bounded backlog)
+# caps how many cores auth can take at once; anything beyond that is turned
+# away immediately instead of queueing behind the hashes in flight.
+
+_HASH_ROUNDS_RE = re.compile(r"^\$2[abxy]?\$(\d{2})\$")
+
+_executor = None
+_slots = None
+_pool_lock = threading.Lock()
+
+
+def _pool():
+    global _executor, _slots
+    if _executor is None:
+        with _pool_lock:
+            if _executor is None:
+                workers = current_app.config.get("PASSWORD_HASH_WORKERS", 2)
+                backlog = current_app.config.get("PASSWORD_HASH_BACKLOG", 8)
+                _slots = threading.BoundedSemaphore(workers + backlog)
+                _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bcrypt")
+    return _executor, _slots
+
+
+def _run(fn, *args):
+    executor, slots = _pool()
+    if not slots.acquire(blocking=False):
+        raise ServiceError(code="AUTH_BUSY", message="Authentication is busy, please retry shortly")
+    try:
+        future = executor.submit(fn, *args)
+    except Exception:
+        slots.release()
+        raise
+    future.add_done_callback(lambda _: slots.release())
+    try:
+        return future.result(timeout=current_app.config.get("PASSWORD_HASH_TIMEOUT", 10))
+    except FutureTimeout:
+        raise ServiceError(code="AUTH_BUSY", message="Authentication is busy, please retry shortly")
+
+
+def _rounds():
+    return current_app.config.get("BCRYPT_LOG_ROUNDS", 12)
+
+
+def hash_password(password: str) -> str:
+    salt = _bcrypt.gensalt(rounds=_rounds())
+    return _run(_bcrypt.hashpw, password.encode("utf-8"), salt).decode("utf-8")
+
+
+def verify_password(password, hashed_password):
+    if not hashed_password:
+        return False
+    try:
+        return _run(_bcrypt.checkpw, password.encode("utf-8"), hashed_password.encode("utf-8"))
+    except ValueError:
+        # malformed/legacy hash
+        return False
+
+
+def needs_rehash(hashed_password):
+    """True when the stored hash was made with a different cost than BCRYPT_LOG_ROUNDS."""
+    match = _HASH_ROUNDS_RE.match(hashed_password or "")
+    return not match or int(match.group(1)) != _rounds()
+
+
+def shutdown():
+    global _executor, _slots
+    with _pool_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False)
+        _executor = None
+        _slots = None
@@ -2,12 +2,36 @@ from app.extensions import db
 from app.models.transaction import Transaction
 from app.models.payment_method import PaymentMethod
 
+def _balance(earned=0, pending=0, total=0):
+    return {"available_balance": float(earned or 0), "pending_balance": float(pending or 0), "total_earned": float(total or 0), "currency": "USD"}
+
+def get_balances_for_users(user_ids):
+    """{user_id: balance} for many users from one grouped query over their earnings."""
+    user_ids = set(user_ids)
+    if not user_ids:
+        return {}
+
+    def earned_where(*conditions):
+        return db.func.sum(db.case((db.and_(*conditions), Transaction.amount), else_=0))
+
+    rows = (
+        db.session.query(
+            Transaction.user_id,
+            earned_where(Transaction.status == "completed"),
+            earned_where(Transaction.status == "pending"),
+            db.func.sum(Transaction.amount),
+        )
+        .filter(Transaction.user_id.in_(user_ids), Transaction.type == "earning")
+        .group_by(Transaction.user_id)
+        .all()
+    )
+    balances = {uid: _balance() for uid in user_ids}
+    for uid, earned, pending, total in rows:
+        balances[uid] = _balance(earned, pending, total)
+    return balances
+
 def get_balance_for_user(user):
-    # Simple computation using transactions - extend as needed
-    earned = db.session.query(Transaction).filter_by(user_id=user.id, type="earning", status="completed").with_entities(db.func.coalesce(db.func.sum(Transaction.amount), 0)).scalar() or 0
-    pending = db.session.query(Transaction).filter_by(user_id=user.id, type="earning", status="pending").with_entities(db.func.coalesce(db.func.sum(Transaction.amount), 0)).scalar() or 0
-    total = db.session.query(Transaction).filter_by(user_id=user.id, type="earning").with_entities(db.func.coalesce(db.func.sum(Transaction.amount), 0)).scalar() or 0
-    return {"available_balance": float(earned), "pending_balance": float(pending), "total_earned": float(total), "currency": "USD"}
+    return get_balances_for_users([user.id])[user.id]
 
 def create_withdrawal(user_id, amount, method, details):
     # Save email into PaymentMethod if not exists
@@ -6,16 +6,31 @@ from app.models.submission import Submission
 from app.models.order import Order
 from app.services.order_service import update_order_status
 from app.services.order_service import save_uploaded_file
-from sqlalchemy import func
+from app.services.document_service import enqueue_document
+from sqlalchemy import update
+from sqlalchemy.orm.attributes import set_committed_value
 
-def create_submission(*, order: Order, writer, files, message=None):
-    last_number = (
-        db.session.query(func.max(Submission.submission_number))
-        .filter_by(order_id=order.id)
-        .scalar()
-    ) or 0
+def allocate_submission_number(order: Order):
+    """
+    Next submission number for `order` in one round trip.
+
+    The UPDATE row-locks the order until the caller commits, so concurrent
+    submissions to the same order get consecutive numbers instead of racing
+    on MAX()+1; the unique constraint on (order_id, submission_number) backs it up.
+    """
+    counter = Order.__table__.c.submission_counter
+    number = db.session.execute(
+        update(Order.__table__)
+        .where(Order.__table__.c.id == order.id)
+        .values(submission_counter=counter + 1)
+        .returning(counter)
+    ).scalar_one()
+    set_committed_value(order, "submission_counter", number)
+    return number
 
-    next_number = last_number + 1
+
+def create_submission(*, order: Order, writer, files, message=None):
+    next_number = allocate_submission_number(order)
 
     submission = Submission(
         id=f"SUB-{uuid.uuid4().hex[:8]}",
@@ -27,6 +42,7 @@ def create_submission(*, order: Order, writer, files, message=None):
     )
 
     db.session.add(submission)
+    # number secured and row inserted before anything is staged
     db.session.flush()
 
     root_dir = current_app.config.get("SUBMISSIONS_FOLDER", "uploads/submissions")
@@ -38,11 +54,12 @@ def create_submission(*, order: Order, writer, files, message=None):
         if not file or not file.filename:
             continue
 
-        fname, fpath = save_uploaded_file(file, submission_dir)
+        fname, fpath = save_uploaded_file(file, submission_dir, kind="submission", owner_id=submission.id)
         saved_files.append({
             "name": fname,
             "path": fpath
         })
+        enqueue_document("submission", submission.id, "submission", fpath)
 
     submission.files = saved_files
     db.session.commit()
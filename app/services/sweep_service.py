@@ -0,0 +1,198 @@
+"""
+Time-based state transitions, run as set-based sweeps.
+
+Each sweep is a conditional `UPDATE ... WHERE <due> RETURNING` over at most
+SWEEP_BATCH_SIZE rows, followed by one multi-row INSERT of the notifications
+for the rows it changed, committed together. The UPDATE re-checks the due
+condition, so sweeps running concurrently (the in-process scheduler in
+several workers, or alongside `flask sweeps run` from cron) hand each row to
+exactly one of them and nobody is notified twice.
+
+Read endpoints never make these writes; they treat a due-but-unswept row as
+already transitioned where it matters (see list_chats).
+"""
+import logging
+import threading
+import time
+from datetime import datetime
+from flask import current_app
+from sqlalchemy import and_, select, update
+from app.extensions import db, response_cache
+from app.models.bid import Bid
+from app.models.chat import Chat
+from app.models.order import Order
+from app.services.notification_service import send_notifications_to_users
+
+logger = logging.getLogger(__name__)
+
+# orders whose deadline still binds someone; submitted/completed/cancelled ones are never overdue
+OVERDUE_STATUSES = ("in_progress", "revision_requested")
+
+
+def _sweep(model, due, values, returning, notes_for, notif_type, batch_size):
+    """Apply `values` to every `due` row, batch by batch; returns the number of rows changed."""
+    changed = 0
+    while True:
+        batch = select(model.id).where(due).limit(batch_size)
+        rows = db.session.execute(
+            update(model).where(model.id.in_(batch), due)
+            .values(**values).returning(*returning)
+            .execution_options(synchronize_session=False)
+        ).all()
+        send_notifications_to_users(notes_for(rows), notif_type=notif_type)
+        db.session.commit()
+        changed += len(rows)
+        if len(rows) < batch_size:
+            return changed
+
+
+# ---------------------------------------
+# 1. SWEEPS
+# ---------------------------------------
+
+def expire_chat_warnings(now, batch_size):
+    """Clear chat warnings whose expiry has passed and tell the warned user."""
+    return _sweep(
+        Chat,
+        and_(Chat.warning_active == True, Chat.warning_expires_at < now),
+        dict(warning_active=False, warning_risk=None, warning_message=None, warning_expires_at=None),
+        (Chat.id, Chat.order_id, Chat.warning_for_user_id),
+        lambda rows: [
+            {
+                "user_id": row.warning_for_user_id,
+                "title": "Chat warning lifted",
+                "message": f"The warning on your chat for order {row.order_id} has expired.",
+                "details": {"chat_id": row.id, "order_id": row.order_id},
+            }
+            for row in rows if row.warning_for_user_id
+        ],
+        "system",
+        batch_size,
+    )
+
+
+def expire_bids(now, batch_size):
+    """Move open bids past their response deadline to "expired" and tell the bidder."""
+    def notes_for(rows):
+        return [
+            {
+                "user_id": row.user_id,
+                "title": "Bid expired",
+                "message": f"Your bid on order {row.order_id} expired before the client responded.",
+                "details": {"bid_id": row.id, "order_id": row.order_id},
+            }
+            for row in rows
+        ]
+
+    changed = _sweep(
+        Bid,
+        and_(Bid.status == "open", Bid.response_deadline < now),
+        dict(status="expired"),
+        (Bid.id, Bid.user_id, Bid.order_id),
+        notes_for,
+        "bid_update",
+        batch_size,
+    )
+    if changed:
+        # available-orders shows bid counts
+        response_cache.invalidate("orders")
+    return changed
+
+
+def flag_overdue_orders(now, batch_size):
+    """Stamp overdue_at on unfinished orders past their deadline and tell the client and writer."""
+    def notes_for(rows):
+        notes = []
+        for row in rows:
+            details = {"order_id": row.id}
+            notes.append({
+                "user_id": row.client_id,
+                "title": "Order overdue",
+                "message": f'"{row.title}" passed its deadline before it was delivered.',
+                "details": details,
+            })
+            if row.writer_id:
+                notes.append({
+                    "user_id": row.writer_id,
+                    "title": "Order overdue",
+                    "message": f'"{row.title}" is past its deadline. Please deliver or contact the client.',
+                    "details": details,
+                })
+        return [n for n in notes if n["user_id"]]
+
+    changed = _sweep(
+        Order,
+        and_(Order.status.in_(OVERDUE_STATUSES), Order.deadline < now, Order.overdue_at.is_(None)),
+        # keep updated_at: bids derive "unconfirmed" from order edits, and this isn't one
+        dict(overdue_at=now, updated_at=Order.updated_at),
+        (Order.id, Order.title, Order.client_id, Order.writer_id),
+        notes_for,
+        "order_update",
+        batch_size,
+    )
+    if changed:
+        response_cache.invalidate("orders")
+    return changed
+
+
+SWEEPS = {
+    "chat_warnings": expire_chat_warnings,
+    "bids": expire_bids,
+    "overdue_orders": flag_overdue_orders,
+}
+
+
+def run_sweeps(now=None, batch_size=None):
+    """Run every sweep once; returns {sweep name: rows changed}. A failing sweep doesn't stop the others."""
+    now = now or datetime.utcnow()
+    batch_size = batch_size or current_app.config["SWEEP_BATCH_SIZE"]
+    counts = {}
+    for name, sweep in SWEEPS.items():
+        try:
+            counts[name] = sweep(now, batch_size)
+        except Exception:
+            db.session.rollback()
+            logger.exception("sweep %s failed", name)
+            counts[name] = None
+    changed = {name: n for name, n in counts.items() if n}
+    if changed:
+        logger.info("sweeps changed %s", changed)
+    return counts
+
+
+# ---------------------------------------
+# 2. SCHEDULING
+# ---------------------------------------
+
+def run_forever(interval=None, batch_size=None, stop=None):
+    """
+    Run the sweeps every `interval` seconds (default SWEEP_INTERVAL) until `stop` is set.
+
+    Used by `flask sweeps run --loop` and by the in-process scheduler. Must be
+    called inside an app context.
+    """
+    interval = interval or current_app.config["SWEEP_INTERVAL"]
+    stop = stop or threading.Event()
+    while not stop.is_set():
+        started = time.monotonic()
+        run_sweeps(batch_size=batch_size)
+        db.session.remove()
+        stop.wait(max(0.0, interval - (time.monotonic() - started)))
+
+
+def start_scheduler(app):
+    """
+    Run the sweeps on a daemon thread of this process; returns the thread's stop event.
+
+    Enabled with SWEEPS_ENABLED. Every worker that enables it sweeps; that is
+    safe, but one scheduler (or a cron `flask sweeps run`) is enough.
+    """
+    stop = threading.Event()
+
+    def loop():
+        with app.app_context():
+            run_forever(stop=stop)
+
+    threading.Thread(target=loop, name="sweeps", daemon=True).start()
+    logger.info("sweep scheduler started (every %ss)", app.config["SWEEP_INTERVAL"])
+    return stop
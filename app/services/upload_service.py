@@ -0,0 +1,246 @@
+"""
+Two-phase upload persistence tied to the SQLAlchemy session.
+
+Uploads are written (and fsynced) into UPLOAD_STAGING_FOLDER and moved to their
+final path with an atomic rename only once the session commits; on rollback
+they are discarded. Deletes are deferred the same way. Every staged operation
+leaves a small intent file next to it, so `flask uploads reconcile` only has
+to look at the staging folder (not the upload tree) to settle operations a
+crash interrupted.
+"""
+import errno
+import json
+import logging
+import os
+import shutil
+import time
+import uuid
+from dataclasses import dataclass
+from flask import current_app
+from sqlalchemy import event
+from app.extensions import db
+
+logger = logging.getLogger(__name__)
+
+_PENDING_KEY = "pending_uploads"
+
+
+@dataclass
+class _Pending:
+    action: str        # "put" | "delete"
+    path: str          # final path
+    intent: str        # intent file in the staging folder
+    staged: str = None  # data file for puts
+
+
+def _staging_dir():
+    path = current_app.config["UPLOAD_STAGING_FOLDER"]
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def _fsync_dir(path):
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _write_intent(staging, token, **intent):
+    path = os.path.join(staging, f"{token}.json")
+    with open(path, "w") as fh:
+        json.dump({**intent, "created_at": time.time()}, fh)
+        fh.flush()
+        os.fsync(fh.fileno())
+    return path
+
+
+def _track(pending):
+    session = db.session()
+    if not session.in_transaction():
+        # begin now so the commit / rollback hooks see this operation
+        session.begin()
+    session.info.setdefault(_PENDING_KEY, []).append(pending)
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+# ---------------------------------------
+# 1. STAGE (inside the request transaction)
+# ---------------------------------------
+
+def stage_upload(file, final_path, owner_type, owner_id):
+    """
+    Write an uploaded file to staging; it appears at `final_path` when the session commits.
+
+    Returns the staged path (readable until the commit, e.g. for size metrics).
+    """
+    staging = _staging_dir()
+    token = uuid.uuid4().hex
+    staged = os.path.join(staging, f"{token}.part")
+    with open(staged, "wb") as fh:
+        file.save(fh)
+        fh.flush()
+        os.fsync(fh.fileno())
+    intent = _write_intent(
+        staging, token, action="put", path=os.path.abspath(final_path),
+        owner_type=owner_type, owner_id=owner_id,
+    )
+    _fsync_dir(staging)
+    _track(_Pending("put", os.path.abspath(final_path), intent, staged))
+    return staged
+
+
+def schedule_delete(path, owner_type, owner_id):
+    """Delete `path` once the session commits; kept if it rolls back."""
+    intent = _write_intent(
+        _staging_dir(), uuid.uuid4().hex, action="delete", path=os.path.abspath(path),
+        owner_type=owner_type, owner_id=owner_id,
+    )
+    _track(_Pending("delete", os.path.abspath(path), intent))
+
+
+# ---------------------------------------
+# 2. APPLY / DISCARD (session hooks)
+# ---------------------------------------
+
+def _promote(staged, final_path):
+    directory = os.path.dirname(final_path)
+    os.makedirs(directory, exist_ok=True)
+    try:
+        os.replace(staged, final_path)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        # staging on another filesystem: copy + rename inside the target directory
+        tmp = f"{final_path}.{uuid.uuid4().hex}.tmp"
+        shutil.copyfile(staged, tmp)
+        with open(tmp, "rb") as fh:
+            os.fsync(fh.fileno())
+        os.replace(tmp, final_path)
+        os.remove(staged)
+    _fsync_dir(directory)
+
+
+def _apply(pending):
+    if pending.action == "put":
+        _promote(pending.staged, pending.path)
+    else:
+        _remove(pending.path)
+    _remove(pending.intent)
+
+
+def _discard(pending):
+    if pending.staged:
+        _remove(pending.staged)
+    _remove(pending.intent)
+
+
+@event.listens_for(db.session, "after_commit")
+def _apply_after_commit(session):
+    for pending in session.info.pop(_PENDING_KEY, ()):
+        try:
+            _apply(pending)
+        except OSError:
+            # intent file stays behind; the reconciler finishes the move
+            logger.exception("could not %s upload %s; run `flask uploads reconcile`", pending.action, pending.path)
+
+
+@event.listens_for(db.session, "after_transaction_end")
+def _discard_uncommitted(session, transaction):
+    # anything still pending when the outermost transaction ends was rolled back or abandoned
+    if transaction.parent is None:
+        for pending in session.info.pop(_PENDING_KEY, ()):
+            _discard(pending)
+
+
+# ---------------------------------------
+# 3. RECONCILE
+# ---------------------------------------
+
+def _referenced(owner_type, owner_id, path):
+    """Whether the committed database state still points at `path`."""
+    from app.models.order import Order
+    from app.models.submission import Submission
+    from app.models.writer_application import WriterApplication
+
+    if owner_type == "order":
+        order = db.session.get(Order, owner_id)
+        # order attachments are listed by name in the requirements text
+        return order is not None and os.path.basename(path) in (order.requirements or "").split("\n")
+    if owner_type == "submission":
+        submission = db.session.get(Submission, owner_id)
+        return submission is not None and any(
+            os.path.abspath(f.get("path") or "") == path for f in submission.files or ()
+        )
+    if owner_type == "application":
+        application = db.session.get(WriterApplication, owner_id)
+        if application is None:
+            return False
+        paths = [application.essay_file_path, application.cv_file_path,
+                 *(application.work_samples or ()), *(application.degree_certificates or ())]
+        return any(p and os.path.abspath(p) == path for p in paths)
+    return False
+
+
+def reconcile_uploads(grace_seconds=None):
+    """
+    Settle staged operations older than `grace_seconds` that no commit hook finished.
+
+    A put is promoted if its owner row references the file and discarded
+    otherwise; a delete goes ahead only if nothing references the file any
+    more. Returns counts per outcome.
+    """
+    grace = current_app.config["UPLOAD_RECONCILE_GRACE"] if grace_seconds is None else grace_seconds
+    staging = _staging_dir()
+    cutoff = time.time() - grace
+    counts = {"promoted": 0, "discarded": 0, "deleted": 0, "kept": 0}
+
+    for name in sorted(os.listdir(staging)):
+        path = os.path.join(staging, name)
+        if not name.endswith(".json") or os.path.getmtime(path) > cutoff:
+            continue
+        try:
+            with open(path) as fh:
+                intent = json.load(fh)
+        except (OSError, ValueError):
+            logger.warning("unreadable upload intent %s", path)
+            continue
+
+        staged = os.path.join(staging, name[:-len(".json")] + ".part")
+        referenced = _referenced(intent.get("owner_type"), intent.get("owner_id"), intent["path"])
+        if intent["action"] == "put":
+            if referenced and os.path.exists(staged):
+                _promote(staged, intent["path"])
+                counts["promoted"] += 1
+            else:
+                _remove(staged)
+                counts["discarded"] += 1
+        elif referenced:
+            counts["kept"] += 1
+        else:
+            _remove(intent["path"])
+            counts["deleted"] += 1
+        _remove(path)
+
+    # data files whose intent was never written (crash mid-upload)
+    for name in os.listdir(staging):
+        path = os.path.join(staging, name)
+        if name.endswith(".part") and not os.path.exists(path[:-len(".part")] + ".json") \
+                and os.path.getmtime(path) <= cutoff:
+            _remove(path)
+            counts["discarded"] += 1
+
+    db.session.rollback()
+    return counts
@@ -0,0 +1,193 @@
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+from flask import current_app
+from sqlalchemy import event, func, or_
+from app.models.user import User
+from app.extensions import db
+
+DEFAULT_LIMIT = 10
+
+# pg_trgm's default similarity threshold for the `%` operator
+SIMILARITY_THRESHOLD = 0.3
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+def escape_like(value):
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _trigrams(text):
+    """Trigrams the way pg_trgm extracts them: per word, lowercased, padded "  word "."""
+    grams = set()
+    for word in _WORD_RE.findall(text.lower()):
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def _use_trigram_index():
+    backend = current_app.config.get("USER_SEARCH_BACKEND", "auto")
+    if backend == "auto":
+        return db.engine.dialect.name == "postgresql"
+    return backend == "trigram"
+
+
+# ---------------------------------------
+# 1. IN-MEMORY N-GRAM INDEX (SQLite / fallback)
+# ---------------------------------------
+
+class _NgramIndex:
+    """Writer names keyed by trigram; similarity scores match pg_trgm's."""
+
+    def __init__(self, rows):
+        self.names = {}
+        self.grams = {}
+        self.postings = defaultdict(set)
+        for user_id, full_name in rows:
+            name = (full_name or "").lower()
+            self.names[user_id] = name
+            self.grams[user_id] = _trigrams(name)
+            for gram in self.grams[user_id]:
+                self.postings[gram].add(user_id)
+        self.built_at = time.monotonic()
+
+    def search(self, query, limit):
+        query = query.lower()
+        query_grams = _trigrams(query)
+        if len(query) < 3 or not query_grams:
+            # too short for trigrams; plain substring over the names
+            hits = [(0.0, name, uid) for uid, name in self.names.items() if query in name]
+        else:
+            shared = Counter()
+            for gram in query_grams:
+                for uid in self.postings.get(gram, ()):
+                    shared[uid] += 1
+            hits = []
+            for uid, common in shared.items():
+                name = self.names[uid]
+                score = common / (len(query_grams) + len(self.grams[uid]) - common)
+                if query in name or score >= SIMILARITY_THRESHOLD:
+                    hits.append((score, name, uid))
+
+        # substring matches first (what ILIKE would have returned), then by similarity
+        hits.sort(key=lambda h: (query not in h[1], -h[0], h[1]))
+        return [uid for _, _, uid in hits[:limit]]
+
+
+_ngram_index = None
+_ngram_lock = threading.Lock()
+
+
+def invalidate_search_index():
+    global _ngram_index
+    _ngram_index = None
+
+
+def _get_ngram_index():
+    global _ngram_index
+    ttl = current_app.config.get("USER_SEARCH_INDEX_TTL", 300)
+    index = _ngram_index
+    if index and time.monotonic() - index.built_at < ttl:
+        return index
+
+    with _ngram_lock:
+        index = _ngram_index
+        if index and time.monotonic() - index.built_at < ttl:
+            return index
+        rows = db.session.query(User.id, User.full_name).filter(User.role == "writer").all()
+        _ngram_index = _NgramIndex(rows)
+        return _ngram_index
+
+
+@event.listens_for(db.session, "after_flush")
+def _track_user_changes(session, flush_context):
+    if any(isinstance(obj, User) for obj in (*session.new, *session.dirty, *session.deleted)):
+        session.info["user_search_changed"] = True
+
+
+@event.listens_for(db.session, "after_commit")
+def _refresh_after_commit(session):
+    if session.info.pop("user_search_changed", False):
+        invalidate_search_index()
+
+
+@event.listens_for(db.session, "after_rollback")
+def _discard_after_rollback(session):
+    session.info.pop("user_search_changed", None)
+
+
+# ---------------------------------------
+# 2. PUBLIC API
+# ---------------------------------------
+
+def search_writers(query, limit=DEFAULT_LIMIT):
+    """
+    Writers whose name contains or closely resembles `query`, best match first.
+
+    An exact user ID returns just that writer without touching the name index.
+    """
+    query = query.strip()
+    if not query:
+        return []
+
+    exact = db.session.get(User, query)
+    if exact is not None:
+        return [exact] if exact.role == "writer" else []
+
+    if not _use_trigram_index():
+        ids = _get_ngram_index().search(query, limit)
+        if not ids:
+            return []
+        users = {u.id: u for u in User.query.filter(User.id.in_(ids))}
+        return [users[uid] for uid in ids if uid in users]
+
+    # served by the gin_trgm_ops index on users.full_name
+    contains = User.full_name.ilike(f"%{escape_like(query)}%", escape="\\")
+    q = User.query.filter(User.role == "writer")
+    if len(query) < 3:
+        # no trigrams to rank by; take the first substring hits
+        return q.filter(contains).limit(limit).all()
+
+    similarity = func.similarity(User.full_name, query)
+    return (
+        q.filter(or_(contains, User.full_name.bool_op("%")(query)))
+        .order_by(similarity.desc(), User.full_name)
+        .limit(limit)
+        .all()
+    )
+
+
+def resolve_writers(values):
+    """
+    Map names or IDs (e.g. preferred_writers[] form fields) to writers in one query.
+
+    An exact ID wins; otherwise the writer whose name contains the value,
+    preferring an exact (case-insensitive) name and then the shortest name.
+    Unresolved values are left out of the result.
+    """
+    values = list(dict.fromkeys(v.strip() for v in values if v and v.strip()))
+    if not values:
+        return {}
+
+    name_matches = [User.full_name.ilike(f"%{escape_like(v)}%", escape="\\") for v in values]
+    candidates = User.query.filter(
+        User.role == "writer",
+        or_(User.id.in_(values), *name_matches),
+    ).all()
+
+    by_id = {u.id: u for u in candidates}
+    resolved = {}
+    for value in values:
+        if value in by_id:
+            resolved[value] = by_id[value]
+            continue
+        lowered = value.lower()
+        matches = [u for u in candidates if u.full_name and lowered in u.full_name.lower()]
+        if matches:
+            resolved[value] = min(
+                matches, key=lambda u: (u.full_name.lower() != lowered, len(u.full_name), u.id)
+            )
+    return resolved
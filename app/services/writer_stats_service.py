@@ -0,0 +1,264 @@
+import logging
+from datetime import datetime
+from sqlalchemy import case, delete, event, func, inspect, literal, or_, select
+from sqlalchemy.dialects import postgresql, sqlite
+from app.extensions import db
+from app.models.user import User
+from app.models.order import Order
+from app.models.bid import Bid
+from app.models.submission import Submission
+from app.models.transaction import Transaction
+from app.models.writer_stats import WriterStats
+from app.utils.pagination import keyset_paginate
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_ORDER_STATUSES = ("in_progress", "submitted_for_review", "revision_requested")
+
+# statuses listed on the admin roster, as before
+ROSTER_APPLICATION_STATUSES = ("approved", "awaiting_initial_deposit")
+
+SORTS = {
+    "rating": WriterStats.rating,
+    "completed_orders": WriterStats.completed_orders,
+    "total_earned": WriterStats.total_earned,
+}
+
+MAX_ROSTER_LIMIT = 200
+
+_STAT_COLUMNS = (
+    "user_id", "rating", "completed_orders", "total_earned", "active_orders", "delivered_orders",
+    "on_time_deliveries", "revised_orders", "bid_count", "bid_total", "updated_at",
+)
+
+
+# ---------------------------------------
+# 1. RECOMPUTE
+# ---------------------------------------
+
+def _stats_select(writer_ids=None):
+    """One row per writer with every stat aggregated from the source tables."""
+    def scoped(column):
+        return [column.in_(writer_ids)] if writer_ids is not None else []
+
+    order_totals = (
+        select(
+            Order.writer_id.label("user_id"),
+            func.sum(case((Order.status == "completed", 1), else_=0)).label("completed_orders"),
+            func.sum(case((Order.status.in_(ACTIVE_ORDER_STATUSES), 1), else_=0)).label("active_orders"),
+        )
+        .where(Order.writer_id.isnot(None), *scoped(Order.writer_id))
+        .group_by(Order.writer_id)
+        .subquery()
+    )
+
+    first_delivery = select(
+        Submission.order_id,
+        func.min(Submission.created_at).label("first_at"),
+        func.max(Submission.submission_number).label("rounds"),
+    ).group_by(Submission.order_id)
+    if writer_ids is not None:
+        first_delivery = first_delivery.where(
+            Submission.order_id.in_(select(Order.id).where(Order.writer_id.in_(writer_ids)))
+        )
+    first_delivery = first_delivery.subquery()
+
+    deliveries = (
+        select(
+            Order.writer_id.label("user_id"),
+            func.count().label("delivered_orders"),
+            func.sum(case(
+                (or_(Order.deadline.is_(None), first_delivery.c.first_at <= Order.deadline), 1), else_=0,
+            )).label("on_time_deliveries"),
+            func.sum(case((first_delivery.c.rounds > 1, 1), else_=0)).label("revised_orders"),
+        )
+        .join(first_delivery, first_delivery.c.order_id == Order.id)
+        .where(Order.writer_id.isnot(None), *scoped(Order.writer_id))
+        .group_by(Order.writer_id)
+        .subquery()
+    )
+
+    bids = (
+        select(Bid.user_id, func.count(Bid.id).label("bid_count"), func.sum(Bid.bid_amount).label("bid_total"))
+        .where(*scoped(Bid.user_id))
+        .group_by(Bid.user_id)
+        .subquery()
+    )
+
+    earnings = (
+        select(Transaction.user_id, func.sum(Transaction.amount).label("total_earned"))
+        .where(Transaction.type == "earning", Transaction.status == "completed", *scoped(Transaction.user_id))
+        .group_by(Transaction.user_id)
+        .subquery()
+    )
+
+    return (
+        select(
+            User.id,
+            func.coalesce(User.rating, 0.0),
+            func.coalesce(order_totals.c.completed_orders, 0),
+            func.coalesce(earnings.c.total_earned, 0.0),
+            func.coalesce(order_totals.c.active_orders, 0),
+            func.coalesce(deliveries.c.delivered_orders, 0),
+            func.coalesce(deliveries.c.on_time_deliveries, 0),
+            func.coalesce(deliveries.c.revised_orders, 0),
+            func.coalesce(bids.c.bid_count, 0),
+            func.coalesce(bids.c.bid_total, 0.0),
+            literal(datetime.utcnow()),
+        )
+        .select_from(User)
+        .outerjoin(order_totals, order_totals.c.user_id == User.id)
+        .outerjoin(deliveries, deliveries.c.user_id == User.id)
+        .outerjoin(bids, bids.c.user_id == User.id)
+        .outerjoin(earnings, earnings.c.user_id == User.id)
+        # the WHERE also keeps SQLite's INSERT ... SELECT ... ON CONFLICT unambiguous
+        .where(User.role == "writer", *scoped(User.id))
+    )
+
+
+def refresh_writer_stats(connection, writer_ids):
+    """Recompute the rows for `writer_ids`; rows for users who are no longer writers are dropped."""
+    writer_ids = list(writer_ids)
+    if not writer_ids:
+        return
+    table = WriterStats.__table__
+    source = _stats_select(writer_ids)
+
+    insert = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}.get(connection.dialect.name)
+    if insert is not None:
+        stmt = insert(table).from_select(_STAT_COLUMNS, source)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id"],
+            set_={name: stmt.excluded[name] for name in _STAT_COLUMNS[1:]},
+        )
+        connection.execute(stmt)
+        connection.execute(delete(table).where(
+            table.c.user_id.in_(writer_ids),
+            table.c.user_id.not_in(select(User.id).where(User.id.in_(writer_ids), User.role == "writer")),
+        ))
+        return
+
+    connection.execute(delete(table).where(table.c.user_id.in_(writer_ids)))
+    connection.execute(table.insert().from_select(_STAT_COLUMNS, source))
+
+
+def rebuild_writer_stats():
+    """Recompute every writer's row (after bulk loads or Core updates that skip the session hooks)."""
+    table = WriterStats.__table__
+    db.session.execute(delete(table))
+    db.session.execute(table.insert().from_select(_STAT_COLUMNS, _stats_select()))
+    db.session.commit()
+
+
+# ---------------------------------------
+# 2. INCREMENTAL REFRESH (session hooks)
+# ---------------------------------------
+
+def _changed(obj, *attrs):
+    state = inspect(obj)
+    return any(state.attrs[a].history.has_changes() for a in attrs)
+
+
+def _old_and_new(obj, attr):
+    history = inspect(obj).attrs[attr].history
+    return {*history.deleted, *history.added, getattr(obj, attr)}
+
+
+def _affected_writers(session):
+    ids = set()
+    for obj in session.new | session.deleted:
+        if isinstance(obj, Order):
+            ids.add(obj.writer_id)
+        elif isinstance(obj, (Bid, Transaction)):
+            ids.add(obj.user_id)
+        elif isinstance(obj, Submission):
+            ids.add(obj.writer_id)
+        elif isinstance(obj, User) and obj.role == "writer":
+            ids.add(obj.id)
+
+    for obj in session.dirty:
+        if isinstance(obj, Order) and _changed(obj, "writer_id", "status", "deadline"):
+            ids |= _old_and_new(obj, "writer_id")
+        elif isinstance(obj, Bid) and _changed(obj, "bid_amount", "user_id"):
+            ids |= _old_and_new(obj, "user_id")
+        elif isinstance(obj, Transaction) and _changed(obj, "type", "status", "amount", "user_id"):
+            ids |= _old_and_new(obj, "user_id")
+        elif isinstance(obj, Submission) and _changed(obj, "created_at", "submission_number"):
+            ids.add(obj.writer_id)
+        elif isinstance(obj, User) and _changed(obj, "rating", "role"):
+            ids.add(obj.id)
+
+    ids.discard(None)
+    return ids
+
+
+@event.listens_for(db.session, "after_flush")
+def _track_writer_changes(session, flush_context):
+    ids = _affected_writers(session)
+    if ids:
+        session.info.setdefault("writer_stats_dirty", set()).update(ids)
+
+
+@event.listens_for(db.session, "after_commit")
+def _refresh_after_commit(session):
+    ids = session.info.pop("writer_stats_dirty", None)
+    if not ids:
+        return
+    # own transaction on the primary: a failed refresh must not undo the caller's commit
+    try:
+        with db.engine.begin() as connection:
+            refresh_writer_stats(connection, ids)
+    except Exception:
+        logger.exception("writer stats refresh failed for %d writer(s); run `flask writer-stats rebuild`", len(ids))
+
+
+@event.listens_for(db.session, "after_rollback")
+def _discard_after_rollback(session):
+    session.info.pop("writer_stats_dirty", None)
+
+
+# ---------------------------------------
+# 3. ROSTER
+# ---------------------------------------
+
+def _serialize(writer, stats):
+    return {
+        "id": writer.id,
+        "email": writer.email,
+        "full_name": writer.full_name,
+        "rating": stats.rating,
+        "completed_orders": stats.completed_orders,
+        "total_earned": stats.total_earned,
+        "joined_at": writer.joined_at.isoformat() if writer.joined_at else None,
+        "status": "active" if writer.is_verified else "suspended-temporary",
+        "account_status": writer.account_status,
+        "stats": {
+            "active_orders": stats.active_orders,
+            "on_time_rate": stats.on_time_rate,
+            "revision_rate": stats.revision_rate,
+            "average_bid": stats.average_bid,
+        },
+    }
+
+
+def list_writer_roster(sort="rating", descending=True, account_statuses=None, limit=50, cursor=None):
+    """One page of approved writers joined to their stats row. Raises ValueError for a bad cursor."""
+    q = (
+        db.session.query(User, WriterStats)
+        .join(WriterStats, WriterStats.user_id == User.id)
+        .filter(User.role == "writer", User.application_status.in_(ROSTER_APPLICATION_STATUSES))
+    )
+    if account_statuses:
+        q = q.filter(User.account_status.in_(account_statuses))
+    total = q.order_by(None).count()
+
+    column = SORTS[sort]
+    rows, next_cursor = keyset_paginate(
+        q, (column, WriterStats.user_id), cursor, limit, descending,
+        key=lambda row: [getattr(row.WriterStats, sort), row.WriterStats.user_id],
+        scope=f"writers:{sort}:{'desc' if descending else 'asc'}",
+    )
+    return {
+        "writers": [_serialize(writer, stats) for writer, stats in rows],
+        "pagination": {"total": total, "limit": limit, "next_cursor": next_cursor},
+    }
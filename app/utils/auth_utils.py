@@ -1,7 +1,125 @@
-from app.extensions import bcrypt
+import logging
+import time
+from functools import wraps
+from flask import g, current_app
+from werkzeug.local import LocalProxy
+from flask_jwt_extended import get_jwt, get_jwt_identity, decode_token
+from app.extensions import jwt, token_store
+from app.models.user import User
+from app.services import password_service
+from app.utils.response_formatter import error_response
+
+logger = logging.getLogger(__name__)
 
 def hash_password(password: str) -> str:
-    return bcrypt.generate_password_hash(password).decode("utf-8")
+    return password_service.hash_password(password)
 
 def check_password(password, hashed_password):
-    return bcrypt.check_password_hash(hashed_password, password)
+    return password_service.verify_password(password, hashed_password)
+
+
+# ---------------------------------------
+# Current user (resolved once per request)
+# ---------------------------------------
+
+def get_current_user():
+    """Return the caller's User, loading it at most once per request."""
+    uid = get_jwt_identity()
+    cached = g.get("_current_user")
+    # keyed by identity so a reused app context (tests, CLI) never leaks another caller
+    if cached is None or cached[0] != uid:
+        cached = (uid, User.query.get(uid) if uid else None)
+        g._current_user = cached
+    return cached[1]
+
+
+@jwt.user_lookup_loader
+def _lookup_user(jwt_header, jwt_data):
+    # flask-jwt-extended calls this on every protected request; hand back a
+    # lazy proxy so routes that never touch current_user skip the query.
+    return LocalProxy(get_current_user)
+
+
+@jwt.token_in_blocklist_loader
+def _is_token_revoked(jwt_header, jwt_payload):
+    return token_store.is_revoked(jwt_payload["jti"])
+
+
+def identity_from_token(encoded):
+    """
+    Identity of a raw access token passed outside the Authorization header (e.g. ?token=).
+
+    Applies the checks @jwt_required would: refresh tokens and revoked tokens
+    give None, as do undecodable or expired ones.
+    """
+    try:
+        claims = decode_token(encoded)
+    except Exception as e:
+        logger.info("token decode failed: %s", e)
+        return None
+    if claims.get("type") != "access" or _is_token_revoked(None, claims):
+        return None
+    return claims.get("sub")
+
+
+def token_claims_for_user(user):
+    """Signed role/status claims embedded in access tokens, stamped with the user's token version."""
+    return {
+        "role": user.role,
+        "account_status": user.account_status,
+        "ver": token_store.get_version(user.id),
+    }
+
+
+def invalidate_user_claims(user_id):
+    """Call after changing a user's role or account status so their existing tokens stop vouching for it."""
+    token_store.bump_version(user_id)
+
+
+def _claims_are_current(claims):
+    if "role" not in claims:
+        return False
+    if "ver" in claims and claims["ver"] != token_store.get_version(claims["sub"]):
+        return False
+    if "ver" in claims and token_store.shared:
+        return True
+    # process-local store (or pre-versioning token): only trust recent claims
+    ttl = current_app.config.get("ROLE_CLAIMS_TTL", 300)
+    return time.time() - claims.get("iat", 0) < ttl
+
+
+def get_role_claims():
+    """
+    Return {"role", "account_status"} for the caller.
+
+    Token claims are used when their version matches the token store; stale
+    or missing claims fall back to the per-request user lookup.
+    """
+    claims = get_jwt()
+    if _claims_are_current(claims):
+        return {"role": claims["role"], "account_status": claims.get("account_status")}
+
+    user = get_current_user()
+    if not user:
+        return None
+    return {"role": user.role, "account_status": user.account_status}
+
+
+def role_required(*roles, message="Access denied"):
+    """
+    Reject callers whose role is not in `roles`. Must sit below @jwt_required().
+    """
+    allowed = {r.lower() for r in roles}
+
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            claims = get_role_claims()
+            if not claims or (claims["role"] or "").lower() not in allowed:
+                return error_response("FORBIDDEN", message, status=403)
+            return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+admin_required = role_required("admin", message="Admin privileges required")
@@ -0,0 +1,78 @@
+"""
+Conditional GET for detail endpoints polled by dashboards.
+
+A view declares a `version` function returning the cheap values its response
+is built from (row timestamps, child counts), usually one indexed query. The
+response carries a weak ETag derived from them and Last-Modified; a request
+whose If-None-Match (or If-Modified-Since) still matches gets a 304 before
+the view runs, so nothing is loaded, serialized or listed on disk.
+"""
+import hashlib
+from datetime import datetime, timezone
+from functools import wraps
+from flask import request, current_app, make_response
+from flask_jwt_extended import get_jwt_identity
+
+
+def _etag(parts):
+    digest = hashlib.sha1()
+    # the query string selects pages/filters and the identity what the caller may see
+    for part in (request.endpoint, request.full_path, get_jwt_identity(), *parts):
+        digest.update(repr(part).encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _last_modified(parts):
+    stamps = [p for p in parts if isinstance(p, datetime)]
+    # naive datetimes in this app are UTC; HTTP dates have one-second resolution
+    return max(stamps).replace(tzinfo=timezone.utc, microsecond=0) if stamps else None
+
+
+def _not_modified(etag, last_modified):
+    # If-None-Match wins when both are sent (RFC 9110 13.2.2)
+    if request.if_none_match:
+        return request.if_none_match.contains_weak(etag)
+    if request.if_modified_since and last_modified:
+        return last_modified <= request.if_modified_since
+    return False
+
+
+def _validators(response, etag, last_modified):
+    response.set_etag(etag, weak=True)
+    if last_modified:
+        response.last_modified = last_modified
+    # private: per-user data; no-cache: revalidate on every use instead of heuristic freshness
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
+
+
+def conditional(version):
+    """
+    Answer GETs with 304 Not Modified while `version(**view_kwargs)` is unchanged.
+
+    `version` returns a tuple of values, or None when the resource is missing
+    or not visible to the caller; the view then runs as usual and produces the
+    error. Every change to the response must change one of the values.
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if request.method not in ("GET", "HEAD"):
+                return fn(*args, **kwargs)
+
+            parts = version(**kwargs)
+            if parts is None:
+                return fn(*args, **kwargs)
+
+            etag, last_modified = _etag(parts), _last_modified(parts)
+            if _not_modified(etag, last_modified):
+                return _validators(current_app.response_class(status=304), etag, last_modified)
+
+            response = make_response(fn(*args, **kwargs))
+            if response.status_code == 200:
+                _validators(response, etag, last_modified)
+            return response
+        return wrapper
+    return decorator
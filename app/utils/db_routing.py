@@ -0,0 +1,159 @@
+import random
+import threading
+import time
+from functools import wraps
+from flask import g, request, current_app, has_request_context
+from flask_jwt_extended import get_jwt_identity
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event
+
+REPLICA_BIND_PREFIX = "replica_"
+_READ_METHODS = frozenset(("GET", "HEAD", "OPTIONS"))
+
+
+def replica_binds(urls):
+    """SQLALCHEMY_BINDS entries for a comma-separated list of replica URLs."""
+    return {
+        f"{REPLICA_BIND_PREFIX}{i}": url.strip()
+        for i, url in enumerate(u for u in (urls or "").split(",") if u.strip())
+    }
+
+
+# ---------------------------------------
+# sticky-primary window (read-your-writes)
+# ---------------------------------------
+
+class MemoryStickyBackend:
+    """Process-local; enough for one worker or local testing."""
+
+    def __init__(self):
+        self._until = {}
+        self._lock = threading.Lock()
+
+    def mark(self, key, seconds):
+        with self._lock:
+            now = time.time()
+            self._until[key] = now + seconds
+            if len(self._until) > 10_000:
+                for k in [k for k, until in self._until.items() if until < now]:
+                    del self._until[k]
+
+    def is_sticky(self, key):
+        return self._until.get(key, 0) > time.time()
+
+
+class RedisStickyBackend:
+    """Shared across workers so a write on one worker pins reads on all of them. Requires `redis`."""
+
+    def __init__(self, url, prefix="dbsticky:"):
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError("DB_STICKY_BACKEND=redis requires the 'redis' package") from e
+        self._client = redis.Redis.from_url(url)
+        self._prefix = prefix
+
+    def mark(self, key, seconds):
+        self._client.set(self._prefix + key, 1, ex=max(int(seconds), 1))
+
+    def is_sticky(self, key):
+        return self._client.exists(self._prefix + key) == 1
+
+
+_sticky = MemoryStickyBackend()
+
+
+def _caller_identity():
+    try:
+        return get_jwt_identity()
+    except RuntimeError:
+        # JWT not verified for this request (public endpoint)
+        return None
+
+
+def mark_primary_sticky():
+    """Pin the current caller (and the rest of this request) to the primary."""
+    g.db_use_primary = True
+    uid = _caller_identity()
+    seconds = current_app.config.get("DB_STICKY_PRIMARY_SECONDS", 5)
+    if uid and seconds:
+        _sticky.mark(str(uid), seconds)
+
+
+def primary_required(fn):
+    """Force every query in this view to the primary. Place it under @jwt_required()."""
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        g.db_use_primary = True
+        return fn(*args, **kwargs)
+    return wrapper
+
+
+def _reads_may_use_replica():
+    if not has_request_context() or request.method not in _READ_METHODS:
+        return False
+    if g.get("db_use_primary"):
+        return False
+    uid = _caller_identity()
+    if uid and _sticky.is_sticky(str(uid)):
+        g.db_use_primary = True
+        return False
+    return True
+
+
+class RoutingSession(Session):
+    """
+    Sends reads made while serving GET/HEAD requests to a replica bind.
+
+    Everything else goes to the primary: flushes, DML, SELECT ... FOR UPDATE,
+    work outside a request, views marked @primary_required, and callers
+    inside their sticky window after writing. One replica is picked per
+    request, so a response never mixes rows read at different lag points.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        engine = super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+        if bind is not None or self._flushing:
+            return engine
+
+        engines = self._db.engines
+        replicas = sorted(key for key in engines if key and key.startswith(REPLICA_BIND_PREFIX))
+        if not replicas or engine is not engines.get(None):
+            return engine
+
+        if clause is not None and (getattr(clause, "is_dml", False) or getattr(clause, "_for_update_arg", None) is not None):
+            return engine
+        if not _reads_may_use_replica():
+            return engine
+        if "db_replica" not in g:
+            g.db_replica = random.choice(replicas)
+        return engines[g.db_replica]
+
+
+def _stick_after_flush(session, flush_context):
+    if has_request_context():
+        mark_primary_sticky()
+
+
+def _stick_after_bulk_dml(state):
+    # session.execute(update(...)) never flushes, so catch ORM-enabled DML here
+    if has_request_context() and (state.is_update or state.is_delete or state.is_insert):
+        mark_primary_sticky()
+
+
+def _reset_request_routing():
+    g.pop("db_use_primary", None)
+    g.pop("db_replica", None)
+
+
+def init_app(app, db):
+    global _sticky
+    if app.config.get("DB_STICKY_BACKEND", "memory") == "redis":
+        _sticky = RedisStickyBackend(app.config["DB_STICKY_URL"])
+    else:
+        _sticky = MemoryStickyBackend()
+
+    if not event.contains(db.session, "after_flush", _stick_after_flush):
+        event.listen(db.session, "after_flush", _stick_after_flush)
+        event.listen(db.session, "do_orm_execute", _stick_after_bulk_dml)
+    app.before_request(_reset_request_routing)
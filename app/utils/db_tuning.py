@@ -0,0 +1,144 @@
+import re
+from functools import lru_cache, wraps
+from flask import g, has_request_context, current_app
+from sqlalchemy import event, text
+from sqlalchemy.dialects.postgresql.base import PGDialect
+
+_PG_VERSION_RE = re.compile(
+    r".*(?:PostgreSQL|EnterpriseDB) (\d+)\.?(\d+)?(?:\.(\d+))?(?:\.\d+)?(?:devel|beta)?"
+)
+_ANY_VERSION_RE = re.compile(r"v?(\d+)\.(\d+)")
+
+
+# ---------------------------------------
+# 1. SERVER VERSION DETECTION (CockroachDB)
+# ---------------------------------------
+
+@lru_cache(maxsize=8)
+def parse_server_version(version_string):
+    """
+    Turn `SELECT version()` into a version tuple.
+
+    CockroachDB answers "CockroachDB CCL v23.1.11 (...)", which the stock
+    PostgreSQL regex rejects; fall back to the first dotted number. Cached so
+    every engine/pool reconnect reuses the parsed result.
+    """
+    match = _PG_VERSION_RE.match(version_string)
+    if match:
+        return tuple(int(x) for x in match.group(1, 2, 3) if x is not None)
+    match = _ANY_VERSION_RE.search(version_string)
+    if match:
+        return tuple(map(int, match.groups()))
+    return (25, 0)
+
+
+def patch_pg_version_detection():
+    """Replace PGDialect's version lookup once per process; safe to call repeatedly."""
+    if getattr(PGDialect, "_version_detection_patched", False):
+        return
+
+    def _get_server_version_info(self, connection):
+        return parse_server_version(connection.exec_driver_sql("select pg_catalog.version()").scalar())
+
+    PGDialect._get_server_version_info = _get_server_version_info
+    PGDialect._version_detection_patched = True
+
+
+# ---------------------------------------
+# 2. ENGINE OPTIONS
+# ---------------------------------------
+
+def build_engine_options(uri, env):
+    """
+    SQLALCHEMY_ENGINE_OPTIONS from environment variables.
+
+    Pool sizing only applies to server databases; SQLite keeps SQLAlchemy's
+    defaults (in-memory SQLite uses a pool that rejects these arguments).
+    """
+    if uri.startswith("sqlite"):
+        return {}
+
+    options = {
+        "pool_size": int(env.get("DB_POOL_SIZE", 10)),
+        "max_overflow": int(env.get("DB_MAX_OVERFLOW", 20)),
+        "pool_timeout": float(env.get("DB_POOL_TIMEOUT", 10)),
+        "pool_recycle": int(env.get("DB_POOL_RECYCLE", 1800)),
+        "pool_pre_ping": env.get("DB_POOL_PRE_PING", "true").lower() == "true",
+    }
+
+    # off by default: it would also cap migrations and the long CLI jobs (rollup rebuilds,
+    # backfills, sweeps); requests get DB_REQUEST_STATEMENT_TIMEOUT_MS with SET LOCAL instead
+    timeout_ms = int(env.get("DB_STATEMENT_TIMEOUT_MS", 0))
+    if uri.startswith(("postgresql", "postgres")):
+        connect_args = {}
+        if timeout_ms:
+            connect_args["options"] = f"-c statement_timeout={timeout_ms}"
+        options["connect_args"] = connect_args
+        if uri.startswith(("postgresql://", "postgresql+psycopg2://", "postgres://")):
+            # batch executemany() UPDATE/DELETE with execute_batch; INSERTs already use multi-row VALUES
+            options["executemany_mode"] = env.get("DB_EXECUTEMANY_MODE", "values_plus_batch")
+            options["insertmanyvalues_page_size"] = int(env.get("DB_INSERT_PAGE_SIZE", 1000))
+    return options
+
+
+# ---------------------------------------
+# 3. PER-REQUEST STATEMENT TIMEOUT
+# ---------------------------------------
+
+def statement_timeout(ms):
+    """Override the statement timeout for every transaction a view opens. Place it under @jwt_required()."""
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            g.statement_timeout_ms = ms
+            return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _apply_statement_timeout(session, transaction, connection):
+    if not has_request_context() or connection.dialect.name != "postgresql":
+        return
+    ms = g.get("statement_timeout_ms") or current_app.config.get("DB_REQUEST_STATEMENT_TIMEOUT_MS")
+    if ms:
+        # SET LOCAL ends with the transaction, so pooled connections never keep it
+        connection.exec_driver_sql(f"SET LOCAL statement_timeout = {int(ms)}")
+
+
+def _reset_statement_timeout():
+    g.pop("statement_timeout_ms", None)
+
+
+def init_app(app, db):
+    if not event.contains(db.session, "after_begin", _apply_statement_timeout):
+        event.listen(db.session, "after_begin", _apply_statement_timeout)
+    app.before_request(_reset_statement_timeout)
+
+
+# ---------------------------------------
+# 4. POOL STATUS
+# ---------------------------------------
+
+def pool_status(engine):
+    pool = engine.pool
+    if not hasattr(pool, "checkedout"):
+        return {"pool": type(pool).__name__}
+
+    size = pool.size()
+    max_overflow = getattr(pool, "_max_overflow", 0)
+    checked_out = pool.checkedout()
+    capacity = size + max(max_overflow, 0)
+    return {
+        "pool": type(pool).__name__,
+        "size": size,
+        "max_overflow": max_overflow,
+        "checked_in": pool.checkedin(),
+        "checked_out": checked_out,
+        "overflow": max(pool.overflow(), 0),
+        "saturation": round(checked_out / capacity, 3) if capacity else None,
+    }
+
+
+def ping(engine):
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
@@ -0,0 +1,187 @@
+"""
+Document preprocessing: content hash, page count, text and a first-page thumbnail.
+
+Runs inside worker processes, so nothing here touches Flask or the database.
+DOCX is handled with the standard library. The optional packages below are
+used when installed and skipped otherwise (the manifest records what could
+be derived):
+
+    pypdf     PDF page count and text (without it pages are counted from the raw bytes)
+    PyMuPDF   PDF thumbnails (falls back to the `pdftoppm` binary when on PATH)
+    Pillow    image thumbnails and resizing DOCX embedded thumbnails
+"""
+import hashlib
+import os
+import re
+import shutil
+import subprocess
+import zipfile
+from xml.etree import ElementTree
+
+CONTENT_TYPES = {
+    ".pdf": "application/pdf",
+    ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+}
+
+EXCERPT_CHARS = 500
+
+_PDF_PAGE_RE = re.compile(rb"/Type\s*/Page(?!s)")
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_EXTENDED_PROPS = "{http://schemas.openxmlformats.org/officeDocument/2006/extended-properties}"
+
+
+def sha256_file(path, chunk_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# ---------------------------------------
+# per-format extractors: (page_count, text, thumbnail_path)
+# ---------------------------------------
+
+def _image_thumbnail(source, out_base, px):
+    try:
+        from PIL import Image
+    except ImportError:
+        return None
+    with Image.open(source) as img:
+        img.thumbnail((px, px))
+        out = out_base + ".png"
+        img.save(out, "PNG")
+        return out
+
+
+def _pdf(path, out_base, px, max_chars):
+    pages, text = None, None
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        PdfReader = None
+
+    if PdfReader is not None:
+        reader = PdfReader(path)
+        pages = len(reader.pages)
+        parts, length = [], 0
+        for page in reader.pages:
+            part = page.extract_text() or ""
+            parts.append(part)
+            length += len(part)
+            if length >= max_chars:
+                break
+        text = "\n".join(parts)
+    else:
+        with open(path, "rb") as fh:
+            pages = len(_PDF_PAGE_RE.findall(fh.read())) or None
+
+    return pages, text, _pdf_thumbnail(path, out_base, px)
+
+
+def _pdf_thumbnail(path, out_base, px):
+    try:
+        import fitz
+    except ImportError:
+        fitz = None
+
+    if fitz is not None:
+        with fitz.open(path) as doc:
+            page = doc[0]
+            scale = px / max(page.rect.width, page.rect.height)
+            out = out_base + ".png"
+            page.get_pixmap(matrix=fitz.Matrix(scale, scale)).save(out)
+            return out
+
+    if shutil.which("pdftoppm"):
+        subprocess.run(
+            ["pdftoppm", "-png", "-singlefile", "-f", "1", "-l", "1", "-scale-to", str(px), path, out_base],
+            check=True, capture_output=True, timeout=60,
+        )
+        return out_base + ".png"
+    return None
+
+
+def _docx(path, out_base, px, max_chars):
+    with zipfile.ZipFile(path) as archive:
+        root = ElementTree.fromstring(archive.read("word/document.xml"))
+        paragraphs, length = [], 0
+        for paragraph in root.iter(f"{_W}p"):
+            line = "".join(node.text or "" for node in paragraph.iter(f"{_W}t"))
+            paragraphs.append(line)
+            length += len(line)
+            if length >= max_chars:
+                break
+        text = "\n".join(paragraphs)
+
+        pages = None
+        if "docProps/app.xml" in archive.namelist():
+            node = ElementTree.fromstring(archive.read("docProps/app.xml")).find(f"{_EXTENDED_PROPS}Pages")
+            if node is not None and (node.text or "").isdigit():
+                pages = int(node.text)
+
+        # Word stores a first-page preview when "save thumbnail" is on
+        thumbnail = None
+        embedded = next((n for n in archive.namelist() if n.startswith("docProps/thumbnail.")), None)
+        if embedded:
+            raw = out_base + ".embedded" + os.path.splitext(embedded)[1]
+            with open(raw, "wb") as fh:
+                fh.write(archive.read(embedded))
+            thumbnail = _image_thumbnail(raw, out_base, px) or raw
+            if thumbnail != raw:
+                os.remove(raw)
+
+    return pages, text, thumbnail
+
+
+def _image(path, out_base, px, max_chars):
+    return 1, None, _image_thumbnail(path, out_base, px)
+
+
+_EXTRACTORS = {
+    "application/pdf": _pdf,
+    CONTENT_TYPES[".docx"]: _docx,
+    "image/jpeg": _image,
+    "image/png": _image,
+}
+
+
+def extract_document(path, artifacts_dir, thumbnail_px=320, max_text_chars=1_000_000):
+    """
+    Derive everything the manifest stores for one upload.
+
+    Artifacts are named by content hash, so re-uploads of the same file reuse
+    them. Returns a dict of manifest fields; raises on unreadable files.
+    """
+    os.makedirs(artifacts_dir, exist_ok=True)
+    digest = sha256_file(path)
+    content_type = CONTENT_TYPES.get(os.path.splitext(path)[1].lower(), "application/octet-stream")
+    result = {
+        "sha256": digest,
+        "size_bytes": os.path.getsize(path),
+        "content_type": content_type,
+        "page_count": None,
+        "text_excerpt": None,
+        "text_path": None,
+        "thumbnail_path": None,
+    }
+
+    extractor = _EXTRACTORS.get(content_type)
+    if extractor is None:
+        return result
+
+    out_base = os.path.join(artifacts_dir, digest)
+    pages, text, thumbnail = extractor(path, out_base, thumbnail_px, max_text_chars)
+    result["page_count"] = pages
+    result["thumbnail_path"] = thumbnail
+    if text:
+        text = text[:max_text_chars]
+        text_path = out_base + ".txt"
+        with open(text_path, "w", encoding="utf-8") as fh:
+            fh.write(text)
+        result["text_path"] = text_path
+        result["text_excerpt"] = text[:EXCERPT_CHARS]
+    return result
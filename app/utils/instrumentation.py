@@ -0,0 +1,153 @@
+import hashlib
+import logging
+import re
+import time
+from collections import Counter
+from flask import g, request, current_app, has_request_context
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# bound parameter lists ("(?, ?, ?)", "(%(id_1)s, %(id_2)s)") collapse to one
+# placeholder so `IN (...)` queries with different lengths share a fingerprint
+_PARAM_LIST_RE = re.compile(r"\(\s*(?:\?|%s|%\(\w+\)s)(?:\s*,\s*(?:\?|%s|%\(\w+\)s))*\s*\)")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Raised in strict mode when an endpoint runs more queries than its budget."""
+
+
+def fingerprint(statement):
+    normalized = _PARAM_LIST_RE.sub("(?)", _WHITESPACE_RE.sub(" ", statement).strip())
+    return hashlib.sha1(normalized.encode()).hexdigest()[:12], normalized
+
+
+def query_budget(max_queries):
+    """Declare the most queries a view may run per request. Place it directly under @bp.route."""
+    def decorator(fn):
+        fn._query_budget = max_queries
+        return fn
+    return decorator
+
+
+class _RequestStats:
+    __slots__ = ("started", "queries", "db_time", "fingerprints", "samples")
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.queries = 0
+        self.db_time = 0.0
+        self.fingerprints = Counter()
+        self.samples = {}
+
+
+class QueryInstrumentation:
+    """
+    Per-request query count, DB time and repeated-statement detection.
+
+    Engine events feed a stats object on `g`; after_request turns it into a
+    Server-Timing header, one structured log line, and (in strict mode) a
+    hard failure when a view exceeds its @query_budget.
+    """
+
+    def __init__(self):
+        self._listening = False
+
+    def init_app(self, app):
+        app.extensions["query_instrumentation"] = self
+        if not app.config.get("INSTRUMENTATION_ENABLED", True):
+            return
+        if not self._listening:
+            # listen on the Engine class so replica/secondary engines are covered too
+            event.listen(Engine, "before_cursor_execute", self._before_cursor_execute)
+            event.listen(Engine, "after_cursor_execute", self._after_cursor_execute)
+            self._listening = True
+        app.before_request(self._start_request)
+        app.after_request(self._finish_request)
+
+    # ---------------------------------------
+    # engine hooks
+    # ---------------------------------------
+
+    @staticmethod
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("_query_started", []).append(time.perf_counter())
+
+    @staticmethod
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info.get("_query_started")
+        elapsed = time.perf_counter() - started.pop() if started else 0.0
+        if not has_request_context():
+            return
+        stats = g.get("_query_stats")
+        if stats is None:
+            return
+        stats.queries += 1
+        stats.db_time += elapsed
+        key, normalized = fingerprint(statement)
+        stats.fingerprints[key] += 1
+        stats.samples.setdefault(key, normalized)
+
+    # ---------------------------------------
+    # request hooks
+    # ---------------------------------------
+
+    @staticmethod
+    def _start_request():
+        g._query_stats = _RequestStats()
+
+    def _finish_request(self, response):
+        stats = g.pop("_query_stats", None)
+        if stats is None:
+            return response
+
+        config = current_app.config
+        total_ms = (time.perf_counter() - stats.started) * 1000
+        db_ms = stats.db_time * 1000
+        threshold = config.get("QUERY_REPEAT_THRESHOLD", 5)
+        repeated = {
+            key: count for key, count in stats.fingerprints.most_common() if count >= threshold
+        }
+
+        if config.get("SERVER_TIMING_ENABLED", True):
+            response.headers.add(
+                "Server-Timing",
+                f'db;dur={db_ms:.1f};desc="{stats.queries} queries", app;dur={total_ms - db_ms:.1f}',
+            )
+
+        record = {
+            "method": request.method,
+            "path": request.path,
+            "endpoint": request.endpoint,
+            "status": response.status_code,
+            "duration_ms": round(total_ms, 1),
+            "db_ms": round(db_ms, 1),
+            "queries": stats.queries,
+        }
+        if repeated:
+            record["repeated"] = [
+                {"fingerprint": key, "count": count, "sql": stats.samples[key][:200]}
+                for key, count in repeated.items()
+            ]
+            logger.warning("repeated statements in request", extra={"fields": record})
+        else:
+            logger.info("request completed", extra={"fields": record})
+
+        budget = self._budget_for(request.endpoint)
+        if budget is not None and stats.queries > budget:
+            message = f"{request.endpoint} ran {stats.queries} queries (budget {budget})"
+            if config.get("QUERY_BUDGET_STRICT", False):
+                raise QueryBudgetExceeded(message)
+            logger.warning(message)
+
+        return response
+
+    @staticmethod
+    def _budget_for(endpoint):
+        view = current_app.view_functions.get(endpoint) if endpoint else None
+        budget = getattr(view, "_query_budget", None)
+        if budget is None:
+            budget = current_app.config.get("QUERY_BUDGET_DEFAULT")
+        return budget
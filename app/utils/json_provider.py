@@ -0,0 +1,50 @@
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # pure-Python fallback
+    orjson = None
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """
+    Flask's JSON provider with orjson encoding responses when it is installed.
+
+    Output matches the default provider: keys are sorted, and datetimes,
+    dataclasses, Decimal and UUID go through the same `default` hook. Anything
+    orjson rejects (e.g. integers wider than 64 bits) is handed to the stdlib.
+    Non-ASCII text is emitted as UTF-8 rather than \\u escapes, which is the
+    same JSON. Request bodies are still parsed by the stdlib, which keeps big
+    integers exact.
+    """
+
+    _options = (
+        orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    ) if orjson else 0
+
+    def _encode(self, obj, indent=False):
+        options = self._options | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, default=self.default, option=options)
+
+    def dumps(self, obj, **kwargs):
+        # orjson has no spacing options: take it only where its layout is what json.dumps would produce
+        compact = kwargs.get("separators") == (",", ":") and not kwargs.get("indent")
+        indented = kwargs.get("indent") == 2 and "separators" not in kwargs
+        if orjson is None or set(kwargs) - {"indent", "separators"} or not (compact or indented):
+            return super().dumps(obj, **kwargs)
+        try:
+            return self._encode(obj, indent=indented).decode()
+        except orjson.JSONEncodeError:
+            return super().dumps(obj, **kwargs)
+
+    def response(self, *args, **kwargs):
+        if orjson is None:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        try:
+            body = self._encode(obj, indent=indent)
+        except orjson.JSONEncodeError:
+            return super().response(*args, **kwargs)
+        return self._app.response_class(body + b"\n", mimetype=self.mimetype)
@@ -0,0 +1,342 @@
+import glob
+import json
+import os
+import threading
+import time
+from functools import wraps
+from flask import Response, request, current_app
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names, values, extra=None):
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value):
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    kind = None
+
+    def __init__(self, registry, name, documentation, labelnames=()):
+        self._registry = registry
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+
+    def _key(self, labels):
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[n]) for n in self.labelnames)
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._registry.lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def set(self, value, **labels):
+        key = self._key(labels)
+        with self._registry.lock:
+            self._values[key] = value
+
+
+class _Timer:
+    """Context manager / decorator that observes elapsed seconds into a histogram."""
+
+    def __init__(self, histogram, labels):
+        self._histogram = histogram
+        self._labels = labels
+
+    def __enter__(self):
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self._histogram.observe(time.perf_counter() - self._started, **self._labels)
+        return False
+
+    def __call__(self, fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            with _Timer(self._histogram, self._labels):
+                return fn(*args, **kwargs)
+        return wrapper
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, registry, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(registry, name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self._registry.lock:
+            state = self._values.get(key)
+            if state is None:
+                # per-bucket (non-cumulative) counts, then sum, then count
+                state = self._values[key] = [0] * len(self.buckets) + [0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[i] += 1
+                    break
+            state[-2] += value
+            state[-1] += 1
+
+    def time(self, **labels):
+        return _Timer(self, labels)
+
+
+class MetricsRegistry:
+    """
+    Minimal Prometheus-compatible registry.
+
+    Metrics are plain in-process dicts guarded by one lock, so recording is
+    cheap. Under gunicorn set METRICS_MULTIPROC_DIR: each worker periodically
+    writes its values to <dir>/<pid>.json and /metrics merges every file
+    (counters and histograms are summed; gauges are summed over live workers).
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self._metrics = {}
+        self._collectors = []
+        self._last_flush = 0.0
+        self.multiproc_dir = None
+        self.flush_interval = 5
+
+        self.request_latency = self.histogram(
+            "http_request_duration_seconds", "Request latency by blueprint and endpoint",
+            ("blueprint", "endpoint", "method", "status"),
+        )
+        self.rate_limited = self.counter(
+            "http_rate_limited_total", "Requests rejected by the rate limiter", ("endpoint",),
+        )
+        # bytes/second = rate(upload_bytes_total) / rate(upload_seconds_total)
+        self.upload_bytes = self.counter("upload_bytes_total", "Bytes written for uploaded files", ("kind",))
+        self.upload_seconds = self.counter("upload_seconds_total", "Seconds spent writing uploaded files", ("kind",))
+
+    # ---------------------------------------
+    # metric factories
+    # ---------------------------------------
+
+    def _register(self, metric):
+        existing = self._metrics.get(metric.name)
+        if existing is not None:
+            return existing
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name, documentation, labelnames=()):
+        return self._register(Counter(self, name, documentation, labelnames))
+
+    def gauge(self, name, documentation, labelnames=()):
+        return self._register(Gauge(self, name, documentation, labelnames))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        return self._register(Histogram(self, name, documentation, labelnames, buckets))
+
+    def observe_upload(self, kind, path, started):
+        """Record one saved upload at `path` that began writing at perf_counter() `started`."""
+        self.upload_seconds.inc(time.perf_counter() - started, kind=kind)
+        self.upload_bytes.inc(os.path.getsize(path), kind=kind)
+
+    def add_collector(self, fn):
+        """Register a callable run just before values are read (e.g. to refresh gauges)."""
+        self._collectors.append(fn)
+
+    # ---------------------------------------
+    # flask integration
+    # ---------------------------------------
+
+    def init_app(self, app):
+        app.extensions["metrics"] = self
+        if not app.config.get("METRICS_ENABLED", True):
+            return
+
+        self.multiproc_dir = app.config.get("METRICS_MULTIPROC_DIR")
+        self.flush_interval = app.config.get("METRICS_FLUSH_INTERVAL", 5)
+        if self.multiproc_dir:
+            os.makedirs(self.multiproc_dir, exist_ok=True)
+
+        app.before_request(self._start_timer)
+        app.after_request(self._observe_request)
+        app.add_url_rule("/metrics", "metrics", self._metrics_view, methods=["GET"])
+
+        with app.app_context():
+            from app.extensions import db
+            for engine in db.engines.values():
+                self.instrument_pool(engine)
+
+    @staticmethod
+    def _start_timer():
+        request.environ["metrics.started"] = time.perf_counter()
+
+    def _observe_request(self, response):
+        started = request.environ.get("metrics.started")
+        if started is not None and request.endpoint != "metrics":
+            self.request_latency.observe(
+                time.perf_counter() - started,
+                blueprint=request.blueprint or "",
+                endpoint=request.endpoint or "unmatched",
+                method=request.method,
+                status=response.status_code,
+            )
+        if self.multiproc_dir and time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+        return response
+
+    def _metrics_view(self):
+        token = current_app.config.get("METRICS_AUTH_TOKEN")
+        if token and request.headers.get("Authorization") != f"Bearer {token}":
+            return Response("unauthorized\n", status=401, mimetype="text/plain")
+        return Response(self.render(), mimetype="text/plain; version=0.0.4; charset=utf-8")
+
+    def instrument_pool(self, engine):
+        """Time pool checkouts and expose pool size gauges for `engine`."""
+        pool = engine.pool
+        if getattr(pool, "_metrics_wrapped", False):
+            return
+        label = engine.url.render_as_string(hide_password=True).split("@")[-1]
+        checkout = self.histogram(
+            "db_pool_checkout_seconds", "Time spent waiting for a pooled connection", ("pool",),
+            buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+        )
+        size = self.gauge("db_pool_size", "Configured pool size", ("pool",))
+        checked_out = self.gauge("db_pool_checked_out", "Connections currently checked out", ("pool",))
+        overflow = self.gauge("db_pool_overflow", "Connections opened beyond pool_size", ("pool",))
+
+        original_connect = pool.connect
+
+        def timed_connect():
+            started = time.perf_counter()
+            try:
+                return original_connect()
+            finally:
+                checkout.observe(time.perf_counter() - started, pool=label)
+
+        pool.connect = timed_connect
+        pool._metrics_wrapped = True
+
+        def collect_pool():
+            # only QueuePool-style pools report sizes
+            if hasattr(pool, "checkedout"):
+                size.set(pool.size(), pool=label)
+                checked_out.set(pool.checkedout(), pool=label)
+                overflow.set(max(pool.overflow(), 0), pool=label)
+
+        self.add_collector(collect_pool)
+
+    # ---------------------------------------
+    # snapshot / multi-process merge
+    # ---------------------------------------
+
+    def snapshot(self):
+        for collect in self._collectors:
+            collect()
+        with self.lock:
+            return {
+                name: {
+                    "type": m.kind,
+                    "help": m.documentation,
+                    "labelnames": list(m.labelnames),
+                    "buckets": list(getattr(m, "buckets", ())),
+                    "samples": [[list(k), list(v) if isinstance(v, list) else v] for k, v in m._values.items()],
+                }
+                for name, m in self._metrics.items()
+            }
+
+    def flush(self):
+        if not self.multiproc_dir:
+            return
+        path = os.path.join(self.multiproc_dir, f"{os.getpid()}.json")
+        tmp = f"{path}.tmp"
+        with open(tmp, "w") as fh:
+            json.dump(self.snapshot(), fh)
+        os.replace(tmp, path)
+        self._last_flush = time.monotonic()
+
+    @staticmethod
+    def _pid_alive(pid):
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True
+        return True
+
+    def collect(self):
+        if not self.multiproc_dir:
+            return self.snapshot()
+
+        self.flush()
+        merged = {}
+        for path in glob.glob(os.path.join(self.multiproc_dir, "*.json")):
+            try:
+                pid = int(os.path.basename(path).split(".")[0])
+                with open(path) as fh:
+                    data = json.load(fh)
+            except (ValueError, OSError):
+                continue
+            alive = self._pid_alive(pid)
+
+            for name, metric in data.items():
+                if metric["type"] == "gauge" and not alive:
+                    continue
+                target = merged.setdefault(name, {**metric, "samples": {}})
+                for labels, value in metric["samples"]:
+                    key = tuple(labels)
+                    current = target["samples"].get(key)
+                    if current is None:
+                        target["samples"][key] = value
+                    elif isinstance(value, list):
+                        target["samples"][key] = [a + b for a, b in zip(current, value)]
+                    else:
+                        target["samples"][key] = current + value
+
+        for metric in merged.values():
+            metric["samples"] = [[list(k), v] for k, v in metric["samples"].items()]
+        return merged
+
+    def render(self):
+        lines = []
+        for name, metric in sorted(self.collect().items()):
+            lines.append(f"# HELP {name} {metric['help']}")
+            lines.append(f"# TYPE {name} {metric['type']}")
+            names = metric["labelnames"]
+            for labels, value in sorted(metric["samples"]):
+                if metric["type"] != "histogram":
+                    lines.append(f"{name}{_format_labels(names, labels)} {_format_value(value)}")
+                    continue
+                cumulative = 0
+                for bound, count in zip(metric["buckets"], value):
+                    cumulative += count
+                    le = f'le="{_format_value(float(bound))}"'
+                    lines.append(f"{name}_bucket{_format_labels(names, labels, le)} {cumulative}")
+                inf = 'le="+Inf"'
+                lines.append(f"{name}_bucket{_format_labels(names, labels, inf)} {value[-1]}")
+                lines.append(f"{name}_sum{_format_labels(names, labels)} {_format_value(float(value[-2]))}")
+                lines.append(f"{name}_count{_format_labels(names, labels)} {value[-1]}")
+        return "\n".join(lines) + "\n"
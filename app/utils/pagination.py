@@ -1,3 +1,9 @@
+import base64
+import json
+from datetime import datetime
+from sqlalchemy import DateTime, tuple_
+
+
 def paginate_query(query, page, limit):
     page = max(int(page) if page else 1, 1)
     limit = max(int(limit) if limit else 10, 1)
@@ -5,3 +11,61 @@ def paginate_query(query, page, limit):
     total = query.order_by(None).count()
     total_pages = (total + limit - 1) // limit
     return items, {"total": total, "page": page, "limit": limit, "total_pages": total_pages}
+
+
+# ---------------------------------------
+# keyset (cursor) pagination
+# ---------------------------------------
+
+def encode_cursor(values, scope=""):
+    """Opaque token for the sort-key values of the last row on a page."""
+    raw = json.dumps({"s": scope, "k": values}, default=lambda v: v.isoformat())
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token, scope=""):
+    """Sort-key values from a token; ValueError if it is malformed or was issued for another sort."""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+        values, token_scope = payload["k"], payload["s"]
+    except (ValueError, TypeError, KeyError) as e:
+        raise ValueError("Invalid cursor") from e
+    if token_scope != scope or not isinstance(values, list):
+        raise ValueError("Invalid cursor")
+    return values
+
+
+def _from_cursor(column, value):
+    if value is not None and isinstance(column.type, DateTime):
+        return datetime.fromisoformat(value)
+    return value
+
+
+def keyset_paginate(query, columns, cursor, limit, descending=True, key=None, scope=""):
+    """
+    One page of `query` ordered by `columns` (the last one must be unique).
+
+    Seeks past the cursor with a row-value comparison instead of OFFSET, so
+    page 500 costs the same as page 1 when an index covers `columns`.
+    `key(row)` returns a row's values for `columns` (default: the columns'
+    attribute names on the row). Returns (items, next_cursor or None).
+    """
+    columns = tuple(columns)
+    if cursor:
+        values = decode_cursor(cursor, scope)
+        if len(values) != len(columns):
+            raise ValueError("Invalid cursor")
+        bound = tuple_(*(_from_cursor(c, v) for c, v in zip(columns, values)))
+        seek = tuple_(*columns) < bound if descending else tuple_(*columns) > bound
+        query = query.filter(seek)
+
+    ordering = [c.desc() if descending else c.asc() for c in columns]
+    rows = query.order_by(*ordering).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        values = key(last) if key else [getattr(last, c.key) for c in columns]
+        next_cursor = encode_cursor(values, scope)
+    return rows, next_cursor
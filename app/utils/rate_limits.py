@@ -0,0 +1,54 @@
+"""
+Rate-limit keys and cost tiers.
+
+Counters live in RATELIMIT_STORAGE_URI: "memory://" keeps them per worker,
+"redis://..." shares them between every worker and survives restarts.
+Callers are keyed by JWT identity when they send a valid token and by client
+address otherwise, so users behind one NAT don't share a budget and a user
+can't reset theirs by switching networks.
+
+Every route draws 1 per request from RATELIMIT_DEFAULT (304 revalidations
+are free). Routes on the expensive hot paths (bcrypt hashing, the chat PII
+sanitizer and analyzer) also draw their tier's cost from one shared
+RATELIMIT_EXPENSIVE budget per caller.
+"""
+from flask import current_app
+from flask_jwt_extended import get_jwt_identity, verify_jwt_in_request
+from flask_limiter.util import get_remote_address
+
+# tier -> config key holding its cost against RATELIMIT_EXPENSIVE
+COST_TIERS = {
+    "password": "RATELIMIT_COST_PASSWORD",
+    "sanitize": "RATELIMIT_COST_SANITIZE",
+}
+
+
+def rate_limit_key():
+    """`user:<id>` for requests with a valid JWT, `ip:<address>` otherwise."""
+    try:
+        # limits are checked before the view's @jwt_required, so verify here
+        verify_jwt_in_request(optional=True)
+        identity = get_jwt_identity()
+    except Exception:
+        # expired or invalid token: the view rejects it, the address pays for the attempt
+        identity = None
+    return f"user:{identity}" if identity else f"ip:{get_remote_address()}"
+
+
+def deduct(response):
+    """Default limits skip 304s: revalidating a cached GET costs one indexed lookup."""
+    return response.status_code != 304
+
+
+def weighted(tier):
+    """Charge the tier's cost against the caller's shared RATELIMIT_EXPENSIVE budget."""
+    from app.extensions import limiter
+
+    config_key = COST_TIERS[tier]
+    return limiter.shared_limit(
+        lambda: current_app.config["RATELIMIT_EXPENSIVE"],
+        scope="expensive",
+        cost=lambda: current_app.config[config_key],
+        # on top of the route's default limit, not instead of it
+        override_defaults=False,
+    )
@@ -0,0 +1,186 @@
+import hashlib
+import pickle
+import threading
+import time
+from collections import Counter, OrderedDict
+from functools import wraps
+from flask import request, current_app, make_response
+from flask_jwt_extended import get_jwt_identity
+
+# Headers that are replayed on a cache hit; everything else is rebuilt per request
+_REPLAYED_HEADERS = ("Content-Type", "Cache-Control", "Vary")
+
+
+class MemoryCacheBackend:
+    """Process-local LRU with per-entry TTL. Tag versions are kept outside the LRU so they are never evicted."""
+
+    def __init__(self, max_entries=2048):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._versions = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_versions(self, tags):
+        return [self._versions.get(t, 0) for t in tags]
+
+    def bump_versions(self, tags):
+        with self._lock:
+            for t in tags:
+                self._versions[t] = self._versions.get(t, 0) + 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._versions.clear()
+
+
+class RedisCacheBackend:
+    """Shared backend for multi-worker deployments. Requires the optional `redis` package."""
+
+    def __init__(self, url, prefix="rc:"):
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError("RESPONSE_CACHE_BACKEND=redis requires the 'redis' package") from e
+        self._client = redis.Redis.from_url(url)
+        self._prefix = prefix
+
+    def get(self, key):
+        raw = self._client.get(self._prefix + key)
+        return pickle.loads(raw) if raw is not None else None
+
+    def set(self, key, value, ttl):
+        self._client.set(self._prefix + key, pickle.dumps(value), ex=max(int(ttl), 1))
+
+    def get_versions(self, tags):
+        if not tags:
+            return []
+        raw = self._client.mget([f"{self._prefix}tag:{t}" for t in tags])
+        return [int(v) if v is not None else 0 for v in raw]
+
+    def bump_versions(self, tags):
+        pipe = self._client.pipeline()
+        for t in tags:
+            pipe.incr(f"{self._prefix}tag:{t}")
+        pipe.execute()
+
+    def clear(self):
+        for key in self._client.scan_iter(f"{self._prefix}*"):
+            self._client.delete(key)
+
+
+class ResponseCache:
+    """
+    Caches successful GET/POST responses per endpoint.
+
+    Entries remember the version of every tag they depend on; invalidating a
+    tag bumps its version, so stale entries simply stop matching. This keeps
+    invalidation O(tags) regardless of how many responses were cached.
+    """
+
+    def __init__(self):
+        self.backend = None
+        self.enabled = False
+        self.hits = Counter()
+        self.misses = Counter()
+
+    def init_app(self, app):
+        self.enabled = app.config.get("RESPONSE_CACHE_ENABLED", True)
+        kind = app.config.get("RESPONSE_CACHE_BACKEND", "memory")
+        if kind == "redis":
+            self.backend = RedisCacheBackend(app.config["RESPONSE_CACHE_URL"])
+        else:
+            self.backend = MemoryCacheBackend(app.config.get("RESPONSE_CACHE_MAX_ENTRIES", 2048))
+        app.extensions["response_cache"] = self
+
+    def _key(self, per_user):
+        digest = hashlib.sha1()
+        digest.update(request.method.encode())
+        digest.update(request.full_path.encode())
+        digest.update(request.host.encode())
+        if request.method == "POST":
+            digest.update(request.get_data())
+        if per_user:
+            digest.update(str(get_jwt_identity()).encode())
+        return f"{request.endpoint}:{digest.hexdigest()}"
+
+    def cached(self, ttl, tags=(), per_user=False):
+        """
+        Cache a view's 200 responses for `ttl` seconds.
+
+        `tags` may reference view arguments, e.g. "order:{order_id}".
+        `per_user` adds the JWT identity to the key for personalised views.
+        """
+        def decorator(fn):
+            @wraps(fn)
+            def wrapper(*args, **kwargs):
+                if not self.enabled or self.backend is None:
+                    return fn(*args, **kwargs)
+
+                endpoint = request.endpoint
+                key = self._key(per_user)
+                entry_tags = [t.format(**kwargs) for t in tags]
+                versions = self.backend.get_versions(entry_tags)
+
+                entry = self.backend.get(key)
+                if entry is not None and entry["versions"] == versions:
+                    self.hits[endpoint] += 1
+                    response = current_app.response_class(entry["body"], status=entry["status"])
+                    for name, value in entry["headers"]:
+                        response.headers[name] = value
+                    response.headers["X-Cache"] = "HIT"
+                    return response
+
+                self.misses[endpoint] += 1
+                response = make_response(fn(*args, **kwargs))
+                if response.status_code == 200 and not response.is_streamed:
+                    self.backend.set(key, {
+                        "body": response.get_data(),
+                        "status": response.status_code,
+                        "headers": [(h, response.headers[h]) for h in _REPLAYED_HEADERS if h in response.headers],
+                        "versions": versions,
+                    }, ttl)
+                response.headers["X-Cache"] = "MISS"
+                return response
+            return wrapper
+        return decorator
+
+    def invalidate(self, *tags):
+        """Drop every cached response that depends on any of `tags`."""
+        if self.backend is not None and tags:
+            self.backend.bump_versions(tags)
+
+    def stats(self):
+        endpoints = sorted(set(self.hits) | set(self.misses))
+        total_hits = sum(self.hits.values())
+        total_misses = sum(self.misses.values())
+        lookups = total_hits + total_misses
+        return {
+            "backend": type(self.backend).__name__ if self.backend else None,
+            "enabled": self.enabled,
+            "hits": total_hits,
+            "misses": total_misses,
+            "hit_ratio": round(total_hits / lookups, 4) if lookups else 0.0,
+            "endpoints": {
+                e: {"hits": self.hits[e], "misses": self.misses[e]} for e in endpoints
+            },
+        }
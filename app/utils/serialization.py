@@ -0,0 +1,53 @@
+"""
+Precompiled row serializers for list endpoints.
+
+A serializer is declared once per response shape as (key, source, converter)
+fields, where source is a column expression, a tuple of them (the converter
+receives all values) or () for a per-row constant. The endpoint selects
+exactly `serializer.columns` and each result row becomes a dict with one zip
+plus the converters, instead of loading ORM instances and reading their
+attributes one by one.
+"""
+
+
+def utc_iso(value):
+    """Naive UTC datetime as ISO 8601 with a trailing Z (the API's usual format)."""
+    return value.isoformat() + "Z" if value is not None else None
+
+
+def iso(value):
+    return value.isoformat() if value is not None else None
+
+
+class RowSerializer:
+    def __init__(self, *fields):
+        plain, converted = [], []
+        for key, source, *convert in fields:
+            (converted if convert else plain).append((key, source, convert[0] if convert else None))
+
+        # unconverted columns come first so they can be zipped straight off the row
+        self.columns = [source for _, source, _ in plain]
+        self._plain_keys = tuple(key for key, _, _ in plain)
+        self._converted = []
+        for key, source, convert in converted:
+            if isinstance(source, tuple):
+                start = len(self.columns)
+                self.columns.extend(source)
+                self._converted.append((key, slice(start, len(self.columns)), convert))
+            else:
+                self._converted.append((key, len(self.columns), convert))
+                self.columns.append(source)
+        self.columns = tuple(self.columns)
+
+    def __call__(self, row):
+        data = dict(zip(self._plain_keys, row))
+        for key, index, convert in self._converted:
+            data[key] = convert(*row[index]) if isinstance(index, slice) else convert(row[index])
+        return data
+
+    def many(self, rows):
+        return [self(row) for row in rows]
+
+    def from_instance(self, obj):
+        """Serialize a loaded instance; only for serializers over that model's own columns."""
+        return self(tuple(getattr(obj, column.key) for column in self.columns))
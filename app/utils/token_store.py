@@ -0,0 +1,98 @@
+import threading
+import time
+
+
+class MemoryTokenBackend:
+    """Process-local versions and revocations. Fine for a single worker or tests."""
+
+    shared = False
+
+    def __init__(self):
+        self._versions = {}
+        self._revoked = {}
+        self._lock = threading.Lock()
+
+    def get_version(self, user_id):
+        return self._versions.get(user_id, 0)
+
+    def bump_version(self, user_id):
+        with self._lock:
+            self._versions[user_id] = self._versions.get(user_id, 0) + 1
+            return self._versions[user_id]
+
+    def revoke(self, jti, ttl):
+        with self._lock:
+            now = time.time()
+            self._revoked[jti] = now + ttl
+            # drop expired entries so the table stays bounded by live tokens
+            for key in [k for k, exp in self._revoked.items() if exp < now]:
+                del self._revoked[key]
+
+    def is_revoked(self, jti):
+        exp = self._revoked.get(jti)
+        return exp is not None and exp >= time.time()
+
+
+class RedisTokenBackend:
+    """Shared store so every worker sees version bumps and revocations. Requires `redis`."""
+
+    shared = True
+
+    def __init__(self, url, prefix="tok:"):
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError("TOKEN_STORE_BACKEND=redis requires the 'redis' package") from e
+        self._client = redis.Redis.from_url(url)
+        self._prefix = prefix
+
+    def get_version(self, user_id):
+        raw = self._client.get(f"{self._prefix}ver:{user_id}")
+        return int(raw) if raw is not None else 0
+
+    def bump_version(self, user_id):
+        return int(self._client.incr(f"{self._prefix}ver:{user_id}"))
+
+    def revoke(self, jti, ttl):
+        self._client.set(f"{self._prefix}revoked:{jti}", 1, ex=max(int(ttl), 1))
+
+    def is_revoked(self, jti):
+        return self._client.exists(f"{self._prefix}revoked:{jti}") == 1
+
+
+class TokenStore:
+    """
+    Tracks a per-user token version and revoked token ids.
+
+    Tokens embed the version they were issued under; bumping it (on role or
+    account status changes) makes their role claims stale without forcing a
+    logout.
+    """
+
+    def __init__(self):
+        self.backend = MemoryTokenBackend()
+
+    def init_app(self, app):
+        if app.config.get("TOKEN_STORE_BACKEND", "memory") == "redis":
+            self.backend = RedisTokenBackend(app.config["TOKEN_STORE_URL"])
+        else:
+            self.backend = MemoryTokenBackend()
+        app.extensions["token_store"] = self
+
+    @property
+    def shared(self):
+        return self.backend.shared
+
+    def get_version(self, user_id):
+        return self.backend.get_version(user_id)
+
+    def bump_version(self, user_id):
+        return self.backend.bump_version(user_id)
+
+    def revoke(self, jti, expires_at):
+        ttl = expires_at - time.time()
+        if ttl > 0:
+            self.backend.revoke(jti, ttl)
+
+    def is_revoked(self, jti):
+        return self.backend.is_revoked(jti)
@@ -0,0 +1,29 @@
+"""
+Load-test and benchmark suite.
+
+    python -m bench.seed --scale 0.01          # synthetic data into DATABASE_URL
+    python -m bench.run --requests 200         # drive the hot endpoints, compare to bench/baseline.json
+    python -m bench.advisor                    # EXPLAIN the replayed workload, report full table scans
+    python -m bench.importtime                 # import-time profile of create_app()
+
+Point DATABASE_URL at a dedicated database: seeding bulk-inserts millions of
+rows at --scale 1.0 (100k users, 1M orders, 5M bids, 10M messages and
+10M notifications).
+"""
+import os
+
+
+def create_bench_app():
+    """App configured for benchmarking: quiet logs, no rate limits, Server-Timing on."""
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+    os.environ.setdefault("SERVER_TIMING_ENABLED", "true")
+    # per-request N+1 warnings would flood the output; the counts still arrive via Server-Timing
+    os.environ.setdefault("LOG_LEVELS", "app.utils.instrumentation=ERROR,werkzeug=WARNING")
+
+    from app.main import create_app
+    from app.extensions import limiter
+
+    app = create_app()
+    # every benchmark request comes from one address; don't let the limiter skew results
+    limiter.enabled = False
+    return app
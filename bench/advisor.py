@@ -0,0 +1,201 @@
+"""
+Index advisor.
+
+Replays the benchmark scenarios (see bench.run) against the seeded database,
+records every distinct statement the app issues, then runs EXPLAIN on each
+one and reports the statements whose plan falls back to a sequential/full
+table scan. Understands PostgreSQL, CockroachDB and SQLite plans.
+
+    python -m bench.advisor                       # 20 requests per scenario
+    python -m bench.advisor --min-rows 10000      # ignore scans of small tables
+
+Small tables are legitimately scanned; --min-rows hides scans of tables
+below that size. Exits non-zero with --strict when anything is reported.
+"""
+import argparse
+import json
+import random
+import sys
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from bench import create_bench_app
+from bench.run import SCENARIOS, TestClientDriver, load_actors, run_scenario
+from app.utils.instrumentation import fingerprint
+
+_EXPLAINABLE = ("SELECT", "UPDATE", "DELETE", "WITH")
+
+
+@dataclass
+class Statement:
+    key: str
+    normalized: str
+    statement: str
+    parameters: object
+    calls: int = 0
+    scenarios: set = field(default_factory=set)
+
+
+class StatementRecorder:
+    """Collects one executable sample per statement fingerprint while active."""
+
+    def __init__(self):
+        self.statements = {}
+        self.scenario = None
+
+    def __enter__(self):
+        event.listen(Engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(Engine, "before_cursor_execute", self._record)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        if executemany or not statement.lstrip().upper().startswith(_EXPLAINABLE):
+            return
+        key, normalized = fingerprint(statement)
+        entry = self.statements.get(key)
+        if entry is None:
+            entry = self.statements[key] = Statement(key, normalized, statement, parameters)
+        entry.calls += 1
+        entry.scenarios.add(self.scenario)
+
+
+# ---------------------------------------
+# plan readers: each returns [(table, detail)] for full scans
+# ---------------------------------------
+
+def _sqlite_scans(conn, statement, parameters):
+    scans = []
+    for row in conn.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters):
+        detail = row[-1]
+        # "SCAN orders" is a full scan; "SCAN orders USING INDEX ..." walks an index
+        if detail.startswith("SCAN ") and " USING " not in detail:
+            scans.append((detail.split()[1], detail))
+    return scans
+
+
+def _walk(node):
+    yield node
+    for child in node.get("Plans", ()):
+        yield from _walk(child)
+
+
+def _postgres_scans(conn, statement, parameters):
+    plan = conn.exec_driver_sql("EXPLAIN (FORMAT JSON) " + statement, parameters).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return [
+        (node["Relation Name"], node.get("Filter", "Seq Scan"))
+        for node in _walk(plan[0]["Plan"])
+        if node["Node Type"] == "Seq Scan"
+    ]
+
+
+def _cockroach_scans(conn, statement, parameters):
+    scans, table = [], None
+    for (line,) in conn.exec_driver_sql("EXPLAIN " + statement, parameters):
+        line = line.strip()
+        if line.startswith("table:"):
+            table = line.split(":", 1)[1].strip().split("@")[0]
+        elif "FULL SCAN" in line and table:
+            scans.append((table, line))
+    return scans
+
+
+def plan_reader(conn):
+    if conn.dialect.name == "sqlite":
+        return _sqlite_scans
+    if conn.dialect.name == "postgresql":
+        version = conn.exec_driver_sql("select version()").scalar()
+        return _cockroach_scans if "CockroachDB" in version else _postgres_scans
+    raise SystemExit(f"no plan reader for dialect {conn.dialect.name!r}")
+
+
+# ---------------------------------------
+# replay / analyse / report
+# ---------------------------------------
+
+def replay(app, n_requests, sample_size, seed):
+    rng = random.Random(seed)
+    actors = load_actors(app, sample_size, rng)
+    driver = TestClientDriver(app, 1)
+    with StatementRecorder() as recorder:
+        for scenario in SCENARIOS:
+            recorder.scenario = scenario.name
+            run_scenario(driver, scenario, actors, n_requests, 0, rng)
+    return recorder.statements
+
+
+def analyse(conn, statements, min_rows):
+    read_scans = plan_reader(conn)
+    table_rows = {}
+    findings = []
+    for entry in statements.values():
+        try:
+            scans = read_scans(conn, entry.statement, entry.parameters)
+        except Exception as e:  # a statement we can't EXPLAIN shouldn't stop the report
+            conn.rollback()
+            print(f"skipped {entry.key}: {e.__class__.__name__}: {e}", file=sys.stderr)
+            continue
+        for table, detail in scans:
+            if table not in table_rows:
+                table_rows[table] = conn.exec_driver_sql(f'SELECT count(*) FROM "{table}"').scalar()
+            if table_rows[table] < min_rows:
+                continue
+            findings.append({
+                "table": table,
+                "rows": table_rows[table],
+                "detail": detail,
+                "fingerprint": entry.key,
+                "calls": entry.calls,
+                "scenarios": sorted(entry.scenarios),
+                "statement": entry.normalized,
+            })
+    findings.sort(key=lambda f: (-f["rows"], -f["calls"]))
+    return findings
+
+
+def print_report(findings, n_statements):
+    print(f"{n_statements} distinct statements explained, {len(findings)} full table scans")
+    by_table = defaultdict(list)
+    for f in findings:
+        by_table[f["table"]].append(f)
+    for table, items in by_table.items():
+        print(f"\n{table} ({items[0]['rows']:,} rows)")
+        for f in items:
+            print(f"  [{f['fingerprint']}] x{f['calls']} via {', '.join(f['scenarios'])}")
+            print(f"    plan: {f['detail']}")
+            print(f"    sql:  {f['statement'][:240]}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report full table scans in the benchmark workload.")
+    parser.add_argument("--requests", type=int, default=20, help="requests replayed per scenario")
+    parser.add_argument("--actors", type=int, default=10, help="distinct users sampled per role")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--min-rows", type=int, default=1000, help="ignore scans of tables smaller than this")
+    parser.add_argument("--output", help="also write the findings as JSON to this path")
+    parser.add_argument("--strict", action="store_true", help="exit 1 when any scan is reported")
+    args = parser.parse_args(argv)
+
+    app = create_bench_app()
+    statements = replay(app, args.requests, args.actors, args.seed)
+
+    with app.app_context():
+        from app.extensions import db
+        with db.engine.connect() as conn:
+            findings = analyse(conn, statements, args.min_rows)
+
+    print_report(findings, len(statements))
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump(findings, fh, indent=2)
+    return 1 if args.strict and findings else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+"""
+Startup import profile.
+
+Runs `create_app()` in a fresh interpreter under `python -X importtime` and
+reports how long startup took, which top-level packages the import time went
+to, the slowest individual modules, and whether anything that is meant to load
+on first use (Presidio/spaCy, alembic) was imported anyway.
+
+    python -m bench.importtime                    # report for the current environment
+    python -m bench.importtime --budget 1.0       # exit 1 when startup takes longer
+    python -m bench.importtime --output out.json  # also write the raw profile
+
+tests/test_startup.py checks the same profile against a budget.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# loaded on first use (chat_service.get_analyzer, `flask db`); importing them in create_app() is a regression
+LAZY_MODULES = ("presidio_analyzer", "spacy", "flask_migrate", "alembic")
+
+_MARKER = "STARTUP_PROFILE "
+_CHILD = f"""
+import json, sys, time
+start = time.perf_counter()
+from app.main import create_app
+create_app()
+seconds = time.perf_counter() - start
+print({_MARKER!r} + json.dumps({{"seconds": seconds, "modules": sorted(sys.modules)}}))
+"""
+
+
+@dataclass
+class ImportRecord:
+    name: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass
+class StartupProfile:
+    seconds: float
+    imports: list = field(default_factory=list)
+    modules: set = field(default_factory=set)
+
+    @property
+    def import_seconds(self):
+        return sum(r.self_us for r in self.imports) / 1e6
+
+    def packages(self):
+        """[(top-level package, seconds)] by self time, most expensive first."""
+        totals = defaultdict(int)
+        for record in self.imports:
+            totals[record.name.split(".")[0]] += record.self_us
+        return sorted(((name, us / 1e6) for name, us in totals.items()), key=lambda item: -item[1])
+
+    def slowest(self, n):
+        return sorted(self.imports, key=lambda r: -r.self_us)[:n]
+
+    def loaded_lazy(self):
+        return [name for name in LAZY_MODULES if name in self.modules]
+
+    def to_dict(self):
+        return {
+            "seconds": self.seconds,
+            "import_seconds": self.import_seconds,
+            "packages": self.packages(),
+            "lazy_modules_loaded": self.loaded_lazy(),
+            "imports": [vars(r) for r in self.imports],
+        }
+
+
+def parse_importtime(stderr):
+    """ImportRecords from `-X importtime` output; other stderr lines (logs, warnings) are skipped."""
+    records = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        if not self_us.strip().isdigit():
+            continue  # header
+        stripped = name.lstrip()
+        records.append(ImportRecord(
+            stripped.strip(), int(self_us), int(cumulative_us), (len(name) - len(stripped) - 1) // 2,
+        ))
+    return records
+
+
+def profile_startup(env=None):
+    """Import the app and call create_app() in a fresh interpreter; `env` overrides os.environ."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _CHILD],
+        cwd=ROOT, env={**os.environ, **(env or {})}, capture_output=True, text=True,
+    )
+    summary = next((line for line in result.stdout.splitlines() if line.startswith(_MARKER)), None)
+    if result.returncode != 0 or summary is None:
+        raise RuntimeError(f"create_app() failed:\n{result.stderr[-2000:]}")
+    summary = json.loads(summary[len(_MARKER):])
+    return StartupProfile(summary["seconds"], parse_importtime(result.stderr), set(summary["modules"]))
+
+
+def print_report(profile, top):
+    print(f"create_app(): {profile.seconds:.3f}s wall, {profile.import_seconds:.3f}s importing "
+          f"{len(profile.imports)} modules\n")
+    print(f"{'package':<32} {'self s':>8}")
+    for name, seconds in profile.packages()[:top]:
+        print(f"{name:<32} {seconds:>8.3f}")
+    print(f"\n{'module':<56} {'self s':>8} {'cumul s':>8}")
+    for record in profile.slowest(top):
+        print(f"{record.name:<56} {record.self_us / 1e6:>8.3f} {record.cumulative_us / 1e6:>8.3f}")
+    loaded = profile.loaded_lazy()
+    print(f"\nlazy modules imported at startup: {', '.join(loaded) if loaded else 'none'}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Profile the imports done by create_app().")
+    parser.add_argument("--top", type=int, default=20, help="packages and modules listed")
+    parser.add_argument("--budget", type=float, help="exit 1 when create_app() takes longer (seconds)")
+    parser.add_argument("--output", help="also write the profile as JSON to this path")
+    args = parser.parse_args(argv)
+
+    profile = profile_startup()
+    print_report(profile, args.top)
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump(profile.to_dict(), fh, indent=2)
+    over_budget = args.budget is not None and profile.seconds > args.budget
+    return 1 if over_budget or profile.loaded_lazy() else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
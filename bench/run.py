@@ -0,0 +1,300 @@
+"""
+Benchmark driver.
+
+Replays the hot endpoints against a seeded database (see bench.seed) and
+reports throughput, p50/p95/p99 latency and queries per request, then
+compares the run to a stored baseline. Query counts come from the
+Server-Timing header written by app.utils.instrumentation.
+
+    python -m bench.run                                  # Flask test client, in-process
+    python -m bench.run --server --concurrency 8         # local threaded WSGI server over HTTP
+    python -m bench.run --save-baseline                  # record the current numbers
+
+Exits non-zero when any scenario regresses past --tolerance (p95 latency)
+or runs more queries than the baseline.
+"""
+import argparse
+import json
+import math
+import os
+import random
+import re
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable
+
+from bench import create_bench_app
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+_QUERIES_RE = re.compile(r'desc="(\d+) queries"')
+
+
+@dataclass
+class Scenario:
+    name: str
+    actor: str                          # "client", "writer" or "chat" (writer posting into one of their chats)
+    method: str
+    path: Callable[[dict], str]
+    body: Callable[[random.Random], dict] = None
+
+
+SCENARIOS = [
+    Scenario("list_orders", "client", "GET", lambda a: "/api/v1/orders?page=1&limit=20"),
+    Scenario("list_chats", "writer", "GET", lambda a: "/api/v1/chats"),
+    Scenario(
+        "post_message", "chat", "POST", lambda a: f"/api/v1/chats/{a['chat_id']}/messages",
+        body=lambda rng: {"content": f"Checking in on the draft, section {rng.randint(1, 9)} is done."},
+    ),
+    Scenario("get_notifications", "writer", "GET", lambda a: "/api/v1/notifications?page=1&limit=20"),
+    Scenario("list_bids_for_client", "client", "GET", lambda a: "/api/v1/client/bids?page=1&limit=10"),
+    Scenario("get_balance", "writer", "GET", lambda a: "/api/v1/balance"),
+]
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    # nearest-rank
+    rank = math.ceil(pct / 100 * len(sorted_values)) - 1
+    return sorted_values[max(0, min(rank, len(sorted_values) - 1))]
+
+
+# ---------------------------------------
+# actors
+# ---------------------------------------
+
+def load_actors(app, sample_size, rng):
+    """Pick real users that own data for each scenario and mint tokens for them."""
+    from flask_jwt_extended import create_access_token
+    from sqlalchemy import func
+    from app.extensions import db
+    from app.models.user import User
+    from app.models.order import Order
+    from app.models.chat import Chat
+    from app.utils.auth_utils import token_claims_for_user
+
+    with app.app_context():
+        busiest_clients = [
+            row[0] for row in db.session.query(Order.client_id)
+            .group_by(Order.client_id).order_by(func.count(Order.id).desc()).limit(sample_size)
+        ]
+        chats = db.session.query(Chat.id, Chat.writer_id).order_by(Chat.id).limit(sample_size * 4).all()
+        if not busiest_clients or not chats:
+            sys.exit("database has no orders/chats; run `python -m bench.seed` first")
+
+        users = {u.id: u for u in User.query.filter(
+            User.id.in_(set(busiest_clients) | {w for _, w in chats})
+        )}
+
+        def token(uid):
+            return create_access_token(identity=uid, additional_claims=token_claims_for_user(users[uid]))
+
+        tokens = {uid: token(uid) for uid in users}
+        writers = list(dict.fromkeys(w for _, w in chats))[:sample_size]
+        chat_sample = rng.sample(chats, min(sample_size, len(chats)))
+        return {
+            "client": [{"token": tokens[c]} for c in busiest_clients],
+            "writer": [{"token": tokens[w]} for w in writers],
+            "chat": [{"token": tokens[w], "chat_id": cid} for cid, w in chat_sample],
+        }
+
+
+# ---------------------------------------
+# drivers
+# ---------------------------------------
+
+class TestClientDriver:
+    label = "test_client"
+
+    def __init__(self, app, concurrency):
+        self.client = app.test_client()
+
+    def request(self, method, path, headers, body):
+        response = self.client.open(path, method=method, headers=headers, json=body)
+        return response.status_code, response.headers.get("Server-Timing", "")
+
+    def map(self, fn, jobs):
+        return [fn(job) for job in jobs]
+
+    def close(self):
+        pass
+
+
+class ServerDriver:
+    label = "wsgi_server"
+
+    def __init__(self, app, concurrency):
+        from werkzeug.serving import make_server
+        self.server = make_server("127.0.0.1", 0, app, threaded=True)
+        self.base = f"http://127.0.0.1:{self.server.server_port}"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.pool = ThreadPoolExecutor(max_workers=concurrency)
+
+    def request(self, method, path, headers, body):
+        data = None
+        if body is not None:
+            data = json.dumps(body).encode()
+            headers = {**headers, "Content-Type": "application/json"}
+        req = urllib.request.Request(self.base + path, data=data, headers=headers, method=method)
+        try:
+            with urllib.request.urlopen(req) as resp:
+                resp.read()
+                return resp.status, resp.headers.get("Server-Timing", "")
+        except urllib.error.HTTPError as e:
+            return e.code, e.headers.get("Server-Timing", "")
+
+    def map(self, fn, jobs):
+        return list(self.pool.map(fn, jobs))
+
+    def close(self):
+        self.pool.shutdown()
+        self.server.shutdown()
+
+
+# ---------------------------------------
+# run / report / compare
+# ---------------------------------------
+
+def run_scenario(driver, scenario, actors, n_requests, warmup, rng):
+    pool = actors[scenario.actor]
+    jobs = []
+    for _ in range(warmup + n_requests):
+        actor = rng.choice(pool)
+        body = scenario.body(rng) if scenario.body else None
+        jobs.append((scenario.path(actor), {"Authorization": f"Bearer {actor['token']}"}, body))
+
+    def call(job):
+        path, headers, body = job
+        started = time.perf_counter()
+        status, timing = driver.request(scenario.method, path, headers, body)
+        elapsed = time.perf_counter() - started
+        match = _QUERIES_RE.search(timing)
+        return elapsed, status, int(match.group(1)) if match else None
+
+    driver.map(call, jobs[:warmup])
+    started = time.perf_counter()
+    samples = driver.map(call, jobs[warmup:])
+    wall = time.perf_counter() - started
+
+    latencies = sorted(s[0] * 1000 for s in samples)
+    queries = [s[2] for s in samples if s[2] is not None]
+    return {
+        "requests": len(samples),
+        "errors": sum(1 for s in samples if s[1] >= 400),
+        "throughput_rps": round(len(samples) / wall, 1) if wall else 0.0,
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p95_ms": round(percentile(latencies, 95), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+        "mean_queries": round(sum(queries) / len(queries), 1) if queries else None,
+        "max_queries": max(queries) if queries else None,
+    }
+
+
+def compare(results, baseline, tolerance):
+    """Return a list of human-readable regressions."""
+    regressions = []
+    for name, current in results.items():
+        base = baseline.get("scenarios", {}).get(name)
+        if not base:
+            continue
+        if base["p95_ms"] and current["p95_ms"] > base["p95_ms"] * (1 + tolerance):
+            regressions.append(f"{name}: p95 {current['p95_ms']}ms vs baseline {base['p95_ms']}ms")
+        if base.get("mean_queries") is not None and current["mean_queries"] is not None \
+                and current["mean_queries"] > base["mean_queries"] + 0.5:
+            regressions.append(f"{name}: {current['mean_queries']} queries/request vs baseline {base['mean_queries']}")
+        if current["errors"] > base.get("errors", 0):
+            regressions.append(f"{name}: {current['errors']} errors vs baseline {base.get('errors', 0)}")
+    return regressions
+
+
+def print_report(results, baseline):
+    base = baseline.get("scenarios", {}) if baseline else {}
+    header = f"{'scenario':<22}{'req':>6}{'err':>5}{'rps':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'queries':>9}{'Δp95':>9}"
+    print(header)
+    print("-" * len(header))
+    for name, r in results.items():
+        delta = ""
+        if name in base and base[name]["p95_ms"]:
+            delta = f"{(r['p95_ms'] / base[name]['p95_ms'] - 1) * 100:+.0f}%"
+        queries = "-" if r["mean_queries"] is None else r["mean_queries"]
+        print(f"{name:<22}{r['requests']:>6}{r['errors']:>5}{r['throughput_rps']:>9}"
+              f"{r['p50_ms']:>9}{r['p95_ms']:>9}{r['p99_ms']:>9}{queries:>9}{delta:>9}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the hot API endpoints.")
+    parser.add_argument("--requests", type=int, default=200, help="measured requests per scenario")
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--scenario", action="append", help="run only these scenarios (repeatable)")
+    parser.add_argument("--server", action="store_true", help="drive a local threaded WSGI server over HTTP")
+    parser.add_argument("--concurrency", type=int, default=4, help="client threads in --server mode")
+    parser.add_argument("--actors", type=int, default=25, help="distinct users sampled per role")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed p95 slowdown before failing")
+    parser.add_argument("--output", help="also write the results as JSON to this path")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    app = create_bench_app()
+    actors = load_actors(app, args.actors, rng)
+    driver = (ServerDriver if args.server else TestClientDriver)(app, args.concurrency)
+
+    scenarios = [s for s in SCENARIOS if not args.scenario or s.name in args.scenario]
+    try:
+        results = {s.name: run_scenario(driver, s, actors, args.requests, args.warmup, rng) for s in scenarios}
+    finally:
+        driver.close()
+
+    with app.app_context():
+        from app.extensions import db
+        from app.models.user import User
+        from app.models.order import Order
+        meta = {
+            "dialect": db.engine.dialect.name,
+            "users": User.query.count(),
+            "orders": Order.query.count(),
+            "driver": driver.label,
+            "concurrency": args.concurrency if args.server else 1,
+            "requests": args.requests,
+        }
+    run = {"meta": meta, "scenarios": results}
+
+    baseline = None
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as fh:
+            baseline = json.load(fh)
+        if baseline.get("meta", {}) != meta:
+            print(f"note: baseline was recorded with {baseline.get('meta')}; this run is {meta}")
+
+    print_report(results, baseline)
+
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump(run, fh, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, "w") as fh:
+            json.dump(run, fh, indent=2)
+            fh.write("\n")
+        print(f"baseline written to {args.baseline}")
+        return 0
+
+    if baseline:
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print("\nREGRESSIONS:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,297 @@
+"""
+Synthetic data generator.
+
+Volumes at --scale 1.0 mirror production targets; every count is multiplied
+by the scale factor. Rows are generated deterministically from --seed and
+bulk-inserted through Core (executemany) in --batch-size chunks, so the ORM
+identity map and per-object flush overhead never come into play.
+
+    python -m bench.seed --scale 0.01 --seed 42
+"""
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+import bcrypt
+from sqlalchemy import func
+
+from bench import create_bench_app
+
+VOLUMES = {
+    "users": 100_000,
+    "orders": 1_000_000,
+    "bids": 5_000_000,
+    "messages": 10_000_000,
+    "notifications": 10_000_000,
+}
+
+BENCH_PASSWORD = "benchmark"
+
+ORDER_STATUSES = (
+    ("pending", 35), ("in_progress", 20), ("submitted_for_review", 5),
+    ("revision_requested", 3), ("completed", 32), ("cancelled", 5),
+)
+BID_STATUSES = (("pending", 70), ("rejected", 20), ("cancelled", 5), ("accepted", 5))
+SUBJECTS = ("Nursing", "History", "Economics", "Computer Science", "Psychology", "Law", "Marketing", "Biology")
+ORDER_TYPES = ("Essay", "Research Paper", "Case Study", "Dissertation", "Lab Report", "Coursework")
+WORDS = (
+    "analysis", "draft", "sources", "deadline", "revision", "outline", "thesis", "format",
+    "citations", "review", "section", "argument", "data", "summary", "chapter", "please",
+)
+
+
+def _weighted(rng, choices):
+    values, weights = zip(*choices)
+    return rng.choices(values, weights=weights)[0]
+
+
+def _sentence(rng, n):
+    return " ".join(rng.choice(WORDS) for _ in range(n)).capitalize() + "."
+
+
+class Seeder:
+    def __init__(self, scale, seed, batch_size):
+        self.scale = scale
+        self.rng = random.Random(seed)
+        self.batch_size = batch_size
+        self.now = datetime.utcnow().replace(microsecond=0)
+        self.counts = {name: max(1, int(n * scale)) for name, n in VOLUMES.items()}
+
+        n_users = self.counts["users"]
+        n_admins = max(1, n_users // 10_000)
+        n_writers = max(1, int(n_users * 0.4))
+        self.admins = [self.user_id(i) for i in range(n_admins)]
+        self.writers = [self.user_id(i) for i in range(n_admins, n_admins + n_writers)]
+        self.clients = [self.user_id(i) for i in range(n_admins + n_writers, n_users)] or self.admins
+
+        # filled while generating orders; reused by bids, chats, messages
+        self.order_meta = []   # (order_id, client_id, writer_id, status, budget, created_at)
+        self.chats = []        # (chat_id, client_id, writer_id)
+
+    @staticmethod
+    def user_id(i):
+        return f"usr-bench-{i:07d}"
+
+    @staticmethod
+    def email(user_id):
+        return f"{user_id}@bench.test"
+
+    def past(self, max_days=365):
+        return self.now - timedelta(seconds=self.rng.randint(0, max_days * 86400))
+
+    # ---------------------------------------
+    # row generators
+    # ---------------------------------------
+
+    def users(self):
+        # one real hash for everyone: hashing 100k passwords would dominate seeding time
+        password_hash = bcrypt.hashpw(BENCH_PASSWORD.encode(), bcrypt.gensalt(rounds=4)).decode()
+        roles = [(u, "admin") for u in self.admins] + [(u, "writer") for u in self.writers]
+        if self.clients is not self.admins:
+            roles += [(u, "client") for u in self.clients]
+        for uid, role in roles:
+            writer = role == "writer"
+            yield {
+                "id": uid,
+                "email": self.email(uid),
+                "password_hash": password_hash,
+                "full_name": f"Bench {role.title()} {uid[-7:]}",
+                "role": role,
+                "rating": round(self.rng.uniform(3.0, 5.0), 2) if writer else 0.0,
+                "completed_orders": 0,
+                "total_earned": 0.0,
+                "joined_at": self.now - timedelta(days=400),
+                "application_status": "approved" if writer else "not_applied",
+                "is_verified": True,
+                "country": self.rng.choice(("KE", "US", "GB", "NG", "IN")),
+                "account_status": "active",
+            }
+
+    def orders(self):
+        for i in range(self.counts["orders"]):
+            status = _weighted(self.rng, ORDER_STATUSES)
+            client_id = self.rng.choice(self.clients)
+            writer_id = None if status == "pending" else self.rng.choice(self.writers)
+            budget = round(self.rng.uniform(10, 500), 2)
+            created_at = self.past()
+            order_id = f"ORD-{i:08x}"
+            self.order_meta.append((order_id, client_id, writer_id, status, budget, created_at))
+            yield {
+                "id": order_id,
+                "title": _sentence(self.rng, 5),
+                "subject": self.rng.choice(SUBJECTS),
+                "type": self.rng.choice(ORDER_TYPES),
+                "pages": self.rng.randint(1, 30),
+                "deadline": created_at + timedelta(days=self.rng.randint(1, 30)),
+                "budget": budget,
+                "status": status,
+                "client_id": client_id,
+                "writer_id": writer_id,
+                "progress": 100 if status == "completed" else 0,
+                "description": _sentence(self.rng, 30),
+                "requirements": _sentence(self.rng, 12),
+                "created_at": created_at,
+                "updated_at": created_at,
+                "minimum_allowed_budget": round(budget * 0.5, 2),
+                "tags": [self.rng.choice(WORDS) for _ in range(3)],
+            }
+
+    def bids(self):
+        for i in range(self.counts["bids"]):
+            order_id, _, writer_id, _, budget, created_at = self.rng.choice(self.order_meta)
+            status = _weighted(self.rng, BID_STATUSES)
+            bidder = self.rng.choice(self.writers)
+            if status == "accepted" and writer_id:
+                bidder = writer_id
+            submitted_at = created_at + timedelta(minutes=self.rng.randint(1, 2000))
+            yield {
+                "id": f"BID-{i:09x}",
+                "order_id": order_id,
+                "user_id": bidder,
+                "bid_amount": round(budget * self.rng.uniform(0.8, 1.3), 2),
+                "original_budget": budget,
+                "status": status,
+                "message": _sentence(self.rng, 10),
+                "is_counter_offer": self.rng.random() < 0.05,
+                "submitted_at": submitted_at,
+                "response_deadline": submitted_at + timedelta(days=2),
+            }
+
+    def chat_rows(self):
+        for order_id, client_id, writer_id, _, _, created_at in self.order_meta:
+            if not writer_id:
+                continue
+            chat_id = f"chat-{len(self.chats):08x}"
+            self.chats.append((chat_id, client_id, writer_id))
+            yield {
+                "id": chat_id,
+                "order_id": order_id,
+                "client_id": client_id,
+                "writer_id": writer_id,
+                "created_at": created_at,
+                "warning_active": False,
+            }
+
+    def messages(self):
+        if not self.chats:
+            return
+        for i in range(self.counts["messages"]):
+            chat_id, client_id, writer_id = self.rng.choice(self.chats)
+            yield {
+                "id": f"msg-{i:09x}",
+                "chat_id": chat_id,
+                "sender_id": client_id if self.rng.random() < 0.5 else writer_id,
+                "content": _sentence(self.rng, self.rng.randint(3, 25)),
+                "is_read": self.rng.random() < 0.8,
+                "created_at": self.past(),
+            }
+
+    def notifications(self):
+        everyone = self.writers + self.clients
+        for i in range(self.counts["notifications"]):
+            roll = self.rng.random()
+            if roll < 0.001:
+                target = {"target_type": "all", "target_group": None, "user_email": None}
+            elif roll < 0.02:
+                target = {"target_type": "group", "target_group": self.rng.choice(("writer", "client")), "user_email": None}
+            else:
+                target = {"target_type": "individual", "target_group": None,
+                          "user_email": self.email(self.rng.choice(everyone))}
+            yield {
+                "id": f"notif-{i:09x}",
+                "sender_id": self.rng.choice(self.admins),
+                "type": self.rng.choice(("info", "order", "payment", "bid")),
+                "title": _sentence(self.rng, 4),
+                "message": _sentence(self.rng, 15),
+                "created_at": self.past(),
+                **target,
+            }
+
+    def transactions(self):
+        i = 0
+        for order_id, _, writer_id, status, budget, created_at in self.order_meta:
+            if status != "completed":
+                continue
+            yield {
+                "id": f"txn-{i:09x}",
+                "user_id": writer_id,
+                "type": "earning",
+                "amount": round(budget * 0.8, 2),
+                "description": f"Payment for {order_id}",
+                "status": "completed",
+                "order_id": order_id,
+                "created_at": created_at + timedelta(days=self.rng.randint(1, 30)),
+            }
+            i += 1
+
+    # ---------------------------------------
+    # insertion
+    # ---------------------------------------
+
+    def insert(self, db, table, rows):
+        started = time.perf_counter()
+        batch, total = [], 0
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= self.batch_size:
+                db.session.execute(table.insert(), batch)
+                db.session.commit()
+                total += len(batch)
+                batch = []
+        if batch:
+            db.session.execute(table.insert(), batch)
+            db.session.commit()
+            total += len(batch)
+        elapsed = time.perf_counter() - started
+        print(f"  {table.name:<16} {total:>10,} rows  {elapsed:7.1f}s  ({total / max(elapsed, 1e-9):,.0f} rows/s)")
+
+
+def seed(scale, seed_value, batch_size, force=False):
+    from app.extensions import db
+    from app.models.user import User
+    from app.models.order import Order
+    from app.models.bid import Bid
+    from app.models.chat import Chat
+    from app.models.message import Message
+    from app.models.notification import Notification
+    from app.models.transaction import Transaction
+    from app.services.leaderboard_service import rebuild_leaderboard
+    from app.services.writer_stats_service import rebuild_writer_stats
+
+    app = create_bench_app()
+    with app.app_context():
+        db.create_all()
+        existing = db.session.query(func.count(User.id)).scalar()
+        if existing and not force:
+            sys.exit(f"users table already has {existing} rows; refusing to seed without --force")
+
+        seeder = Seeder(scale, seed_value, batch_size)
+        print(f"Seeding {db.engine.url.render_as_string(hide_password=True)} at scale {scale}")
+        seeder.insert(db, User.__table__, seeder.users())
+        seeder.insert(db, Order.__table__, seeder.orders())
+        seeder.insert(db, Bid.__table__, seeder.bids())
+        seeder.insert(db, Chat.__table__, seeder.chat_rows())
+        seeder.insert(db, Message.__table__, seeder.messages())
+        seeder.insert(db, Notification.__table__, seeder.notifications())
+        seeder.insert(db, Transaction.__table__, seeder.transactions())
+
+        # Core inserts bypass the ORM flush hooks that maintain the rollups
+        rebuild_leaderboard()
+        rebuild_writer_stats()
+        print("Done.")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Seed a benchmark database.")
+    parser.add_argument("--scale", type=float, default=0.01, help="fraction of the full volumes (1.0 = 100k users)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--force", action="store_true", help="seed even if the database already has users")
+    args = parser.parse_args(argv)
+    seed(args.scale, args.seed, args.batch_size, force=args.force)
+
+
+if __name__ == "__main__":
+    main()
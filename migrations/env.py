@@ -97,6 +97,14 @@ def run_migrations_online():
     connectable = get_engine()
 
     with connectable.connect() as connection:
+        # index builds and backfills must not inherit a DB_STATEMENT_TIMEOUT_MS connection
+        # default: a cancelled CREATE INDEX CONCURRENTLY leaves an INVALID index that
+        # if_not_exists then skips on every retry
+        postgres = connection.dialect.name == 'postgresql'
+        if postgres:
+            connection.exec_driver_sql('SET statement_timeout = 0')
+            connection.commit()
+
         context.configure(
             connection=connection,
             target_metadata=get_metadata(),
@@ -106,6 +114,11 @@ def run_migrations_online():
         with context.begin_transaction():
             context.run_migrations()
 
+        if postgres:
+            # back to the connection's default before it returns to the app's pool
+            connection.exec_driver_sql('RESET statement_timeout')
+            connection.commit()
+
 
 if context.is_offline_mode():
     run_migrations_offline()
@@ -0,0 +1,58 @@
+"""Add orders.overdue_at and indexes for the sweeps
+
+Revision ID: 1b5562e284d8
+Revises: 39debaf88407
+Create Date: 2026-10-19 21:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '1b5562e284d8'
+down_revision = '39debaf88407'
+branch_labels = None
+depends_on = None
+
+
+INDEXES = [
+    ('ix_bids_status_response_deadline', 'bids', ['status', 'response_deadline']),
+    ('ix_chats_warning_expires', 'chats', ['warning_active', 'warning_expires_at']),
+    ('ix_orders_status_deadline', 'orders', ['status', 'deadline']),
+]
+
+
+def _is_postgres():
+    return op.get_bind().dialect.name == 'postgresql'
+
+
+def upgrade():
+    # existing overdue orders are flagged (and notified) by the first sweep
+    with op.batch_alter_table('orders', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('overdue_at', sa.DateTime(), nullable=True))
+
+    if not _is_postgres():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, unique=False)
+        return
+
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name, table, columns, unique=False,
+                postgresql_concurrently=True, if_not_exists=True,
+            )
+
+
+def downgrade():
+    if not _is_postgres():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table)
+    else:
+        with op.get_context().autocommit_block():
+            for name, table, _ in reversed(INDEXES):
+                op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+    with op.batch_alter_table('orders', schema=None) as batch_op:
+        batch_op.drop_column('overdue_at')
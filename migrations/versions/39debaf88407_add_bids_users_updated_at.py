@@ -0,0 +1,33 @@
+"""Add bids.updated_at and users.updated_at
+
+Revision ID: 39debaf88407
+Revises: dd06b4ca3dd1
+Create Date: 2026-10-19 19:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '39debaf88407'
+down_revision = 'dd06b4ca3dd1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # left NULL for existing rows; conditional GET versions fall back to submitted_at / joined_at
+    with op.batch_alter_table('bids', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('updated_at', sa.DateTime(), nullable=True))
+
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('updated_at', sa.DateTime(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_column('updated_at')
+
+    with op.batch_alter_table('bids', schema=None) as batch_op:
+        batch_op.drop_column('updated_at')
@@ -0,0 +1,43 @@
+"""Add trigram index on users.full_name
+
+Revision ID: 41137e9876ae
+Revises: 6c5b5a482db4
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '41137e9876ae'
+down_revision = '6c5b5a482db4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        # other dialects search through the in-memory trigram index
+        op.create_index('ix_users_full_name_trgm', 'users', ['full_name'], unique=False)
+        return
+
+    # CockroachDB ships trigram support built in; stock PostgreSQL needs the extension
+    if 'CockroachDB' not in bind.exec_driver_sql('select version()').scalar():
+        op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_users_full_name_trgm', 'users', ['full_name'], unique=False,
+            postgresql_using='gin', postgresql_ops={'full_name': 'gin_trgm_ops'},
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        op.drop_index('ix_users_full_name_trgm', table_name='users')
+        return
+
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_users_full_name_trgm', table_name='users', postgresql_concurrently=True, if_exists=True)
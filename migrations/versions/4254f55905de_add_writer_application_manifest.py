@@ -0,0 +1,55 @@
+"""Add writer_applications.file_manifest and review-queue indexes
+
+Revision ID: 4254f55905de
+Revises: d85d6db38f81
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4254f55905de'
+down_revision = 'd85d6db38f81'
+branch_labels = None
+depends_on = None
+
+
+INDEXES = [
+    ('ix_writer_applications_user_id', ['user_id']),
+    ('ix_writer_applications_status_created', ['status', 'created_at', 'id']),
+    ('ix_writer_applications_created', ['created_at', 'id']),
+]
+
+
+def upgrade():
+    # existing rows keep NULL until `flask applications backfill-manifests`;
+    # until then their manifest is derived from the stored absolute paths
+    with op.batch_alter_table('writer_applications', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('file_manifest', sa.JSON(), nullable=True))
+
+    if op.get_bind().dialect.name != 'postgresql':
+        for name, columns in INDEXES:
+            op.create_index(name, 'writer_applications', columns, unique=False)
+        return
+
+    with op.get_context().autocommit_block():
+        for name, columns in INDEXES:
+            op.create_index(
+                name, 'writer_applications', columns, unique=False,
+                postgresql_concurrently=True, if_not_exists=True,
+            )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        for name, _ in reversed(INDEXES):
+            op.drop_index(name, table_name='writer_applications')
+    else:
+        with op.get_context().autocommit_block():
+            for name, _ in reversed(INDEXES):
+                op.drop_index(name, table_name='writer_applications', postgresql_concurrently=True, if_exists=True)
+
+    with op.batch_alter_table('writer_applications', schema=None) as batch_op:
+        batch_op.drop_column('file_manifest')
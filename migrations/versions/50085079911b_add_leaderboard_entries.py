@@ -0,0 +1,67 @@
+"""Add leaderboard_entries rollup table
+
+Backfilled with the current week, current month and all-time buckets (what
+`flask leaderboard rebuild` writes); from then on earnings maintain it.
+
+Revision ID: 50085079911b
+Revises: fa23b53873b1
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from datetime import datetime, timedelta
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '50085079911b'
+down_revision = 'fa23b53873b1'
+branch_labels = None
+depends_on = None
+
+
+# same aggregation as leaderboard_service.rebuild_leaderboard, frozen here
+BACKFILL = """
+INSERT INTO leaderboard_entries (period, period_start, user_id, total_earned, orders_completed, updated_at)
+SELECT :period, :period_start, user_id, SUM(amount), COUNT(order_id), :now
+FROM transactions
+WHERE type = 'earning' AND status = 'completed' AND user_id IS NOT NULL
+  AND (:period = 'all' OR created_at >= :period_start)
+GROUP BY user_id
+"""
+
+
+def _period_starts(now):
+    # leaderboard_service.period_start: Monday of this week, first of this month, the all-time epoch
+    week = (now - timedelta(days=now.weekday())).replace(hour=0, minute=0, second=0, microsecond=0)
+    month = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    return {'week': week, 'month': month, 'all': datetime(1970, 1, 1)}
+
+
+def upgrade():
+    op.create_table('leaderboard_entries',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('period', sa.String(length=10), nullable=False),
+    sa.Column('period_start', sa.DateTime(), nullable=False),
+    sa.Column('user_id', sa.String(length=50), nullable=False),
+    sa.Column('total_earned', sa.Float(), nullable=False),
+    sa.Column('orders_completed', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('period', 'period_start', 'user_id', name='uq_leaderboard_period_user')
+    )
+    with op.batch_alter_table('leaderboard_entries', schema=None) as batch_op:
+        batch_op.create_index('ix_leaderboard_period_total', ['period', 'period_start', 'total_earned'], unique=False)
+
+    now = datetime.utcnow()
+    bind = op.get_bind()
+    for period, start in _period_starts(now).items():
+        bind.execute(sa.text(BACKFILL), {'period': period, 'period_start': start, 'now': now})
+
+
+def downgrade():
+    with op.batch_alter_table('leaderboard_entries', schema=None) as batch_op:
+        batch_op.drop_index('ix_leaderboard_period_total')
+
+    op.drop_table('leaderboard_entries')
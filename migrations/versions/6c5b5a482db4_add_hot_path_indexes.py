@@ -0,0 +1,63 @@
+"""Add indexes for hot-path predicates
+
+Revision ID: 6c5b5a482db4
+Revises: 50085079911b
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '6c5b5a482db4'
+down_revision = '50085079911b'
+branch_labels = None
+depends_on = None
+
+
+INDEXES = [
+    ('ix_orders_client_id', 'orders', ['client_id']),
+    ('ix_orders_writer_id', 'orders', ['writer_id']),
+    ('ix_orders_status', 'orders', ['status']),
+    ('ix_orders_created_at', 'orders', ['created_at']),
+    ('ix_messages_chat_read_sender', 'messages', ['chat_id', 'is_read', 'sender_id']),
+    ('ix_chats_client_id', 'chats', ['client_id']),
+    ('ix_chats_writer_id', 'chats', ['writer_id']),
+    ('ix_transactions_user_type_status', 'transactions', ['user_id', 'type', 'status']),
+    ('ix_declined_orders_writer_order', 'declined_orders', ['writer_id', 'order_id']),
+    ('ix_order_invitations_writer_id', 'order_invitations', ['writer_id']),
+    ('ix_notifications_created_at', 'notifications', ['created_at']),
+    ('ix_submissions_order_id', 'submissions', ['order_id']),
+    ('ix_users_role', 'users', ['role']),
+]
+
+
+def _is_postgres():
+    return op.get_bind().dialect.name == 'postgresql'
+
+
+def upgrade():
+    if not _is_postgres():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, unique=False)
+        return
+
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction; building
+    # without it would hold a write lock on orders/messages for the whole build
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name, table, columns, unique=False,
+                postgresql_concurrently=True, if_not_exists=True,
+            )
+
+
+def downgrade():
+    if not _is_postgres():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table)
+        return
+
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,37 @@
+"""Add trigram index on users.email
+
+Revision ID: c3409ace2b18
+Revises: 41137e9876ae
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'c3409ace2b18'
+down_revision = '41137e9876ae'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # PostgreSQL only: elsewhere ix_users_email already exists and a second
+    # plain index on the column would add nothing
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_users_email_trgm', 'users', ['email'], unique=False,
+            postgresql_using='gin', postgresql_ops={'email': 'gin_trgm_ops'},
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_users_email_trgm', table_name='users', postgresql_concurrently=True, if_exists=True)
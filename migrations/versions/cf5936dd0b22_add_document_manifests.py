@@ -0,0 +1,55 @@
+"""Add document_manifests for upload preprocessing
+
+Revision ID: cf5936dd0b22
+Revises: 4254f55905de
+Create Date: 2026-10-19 17:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'cf5936dd0b22'
+down_revision = '4254f55905de'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # new table, so plain index creation is fine on every dialect;
+    # queue existing uploads afterwards with `flask documents backfill`
+    op.create_table(
+        'document_manifests',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('owner_type', sa.String(length=20), nullable=False),
+        sa.Column('owner_id', sa.String(length=50), nullable=False),
+        sa.Column('kind', sa.String(length=30), nullable=False),
+        sa.Column('path', sa.String(length=512), nullable=False),
+        sa.Column('filename', sa.String(length=255), nullable=False),
+        sa.Column('content_type', sa.String(length=120), nullable=True),
+        sa.Column('size_bytes', sa.BigInteger(), nullable=True),
+        sa.Column('sha256', sa.String(length=64), nullable=True),
+        sa.Column('page_count', sa.Integer(), nullable=True),
+        sa.Column('text_excerpt', sa.Text(), nullable=True),
+        sa.Column('text_path', sa.String(length=512), nullable=True),
+        sa.Column('thumbnail_path', sa.String(length=512), nullable=True),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('attempts', sa.Integer(), nullable=False),
+        sa.Column('claim_token', sa.String(length=32), nullable=True),
+        sa.Column('claimed_at', sa.DateTime(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('processed_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_document_manifests_owner', 'document_manifests', ['owner_type', 'owner_id'], unique=False)
+    op.create_index('ix_document_manifests_status', 'document_manifests', ['status', 'id'], unique=False)
+    op.create_index('ix_document_manifests_sha256', 'document_manifests', ['sha256'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_document_manifests_sha256', table_name='document_manifests')
+    op.drop_index('ix_document_manifests_status', table_name='document_manifests')
+    op.drop_index('ix_document_manifests_owner', table_name='document_manifests')
+    op.drop_table('document_manifests')
@@ -0,0 +1,115 @@
+"""Add writer_stats rollup table
+
+Revision ID: d85d6db38f81
+Revises: c3409ace2b18
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd85d6db38f81'
+down_revision = 'c3409ace2b18'
+branch_labels = None
+depends_on = None
+
+
+# same aggregation as writer_stats_service._stats_select, frozen here
+BACKFILL = """
+INSERT INTO writer_stats (
+    user_id, rating, completed_orders, total_earned, active_orders, delivered_orders,
+    on_time_deliveries, revised_orders, bid_count, bid_total, updated_at
+)
+SELECT
+    u.id,
+    COALESCE(u.rating, 0),
+    COALESCE(o.completed_orders, 0),
+    COALESCE(e.total_earned, 0),
+    COALESCE(o.active_orders, 0),
+    COALESCE(d.delivered_orders, 0),
+    COALESCE(d.on_time_deliveries, 0),
+    COALESCE(d.revised_orders, 0),
+    COALESCE(b.bid_count, 0),
+    COALESCE(b.bid_total, 0),
+    CURRENT_TIMESTAMP
+FROM users u
+LEFT JOIN (
+    SELECT writer_id AS user_id,
+           SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END) AS completed_orders,
+           SUM(CASE WHEN status IN ('in_progress', 'submitted_for_review', 'revision_requested')
+                    THEN 1 ELSE 0 END) AS active_orders
+    FROM orders WHERE writer_id IS NOT NULL GROUP BY writer_id
+) o ON o.user_id = u.id
+LEFT JOIN (
+    SELECT ord.writer_id AS user_id,
+           COUNT(*) AS delivered_orders,
+           SUM(CASE WHEN ord.deadline IS NULL OR s.first_at <= ord.deadline THEN 1 ELSE 0 END) AS on_time_deliveries,
+           SUM(CASE WHEN s.rounds > 1 THEN 1 ELSE 0 END) AS revised_orders
+    FROM orders ord
+    JOIN (
+        SELECT order_id, MIN(created_at) AS first_at, MAX(submission_number) AS rounds
+        FROM submissions GROUP BY order_id
+    ) s ON s.order_id = ord.id
+    WHERE ord.writer_id IS NOT NULL
+    GROUP BY ord.writer_id
+) d ON d.user_id = u.id
+LEFT JOIN (
+    SELECT user_id, COUNT(id) AS bid_count, SUM(bid_amount) AS bid_total FROM bids GROUP BY user_id
+) b ON b.user_id = u.id
+LEFT JOIN (
+    SELECT user_id, SUM(amount) AS total_earned FROM transactions
+    WHERE type = 'earning' AND status = 'completed' GROUP BY user_id
+) e ON e.user_id = u.id
+WHERE u.role = 'writer'
+"""
+
+
+def upgrade():
+    op.create_table('writer_stats',
+    sa.Column('user_id', sa.String(length=50), nullable=False),
+    sa.Column('rating', sa.Float(), nullable=False),
+    sa.Column('completed_orders', sa.Integer(), nullable=False),
+    sa.Column('total_earned', sa.Float(), nullable=False),
+    sa.Column('active_orders', sa.Integer(), nullable=False),
+    sa.Column('delivered_orders', sa.Integer(), nullable=False),
+    sa.Column('on_time_deliveries', sa.Integer(), nullable=False),
+    sa.Column('revised_orders', sa.Integer(), nullable=False),
+    sa.Column('bid_count', sa.Integer(), nullable=False),
+    sa.Column('bid_total', sa.Float(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('user_id')
+    )
+    with op.batch_alter_table('writer_stats', schema=None) as batch_op:
+        batch_op.create_index('ix_writer_stats_rating', ['rating', 'user_id'], unique=False)
+        batch_op.create_index('ix_writer_stats_completed', ['completed_orders', 'user_id'], unique=False)
+        batch_op.create_index('ix_writer_stats_earned', ['total_earned', 'user_id'], unique=False)
+
+    op.execute(BACKFILL)
+
+    if op.get_bind().dialect.name != 'postgresql':
+        op.create_index('ix_users_application_status', 'users', ['application_status'], unique=False)
+        return
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_users_application_status', 'users', ['application_status'], unique=False,
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        op.drop_index('ix_users_application_status', table_name='users')
+    else:
+        with op.get_context().autocommit_block():
+            op.drop_index('ix_users_application_status', table_name='users', postgresql_concurrently=True, if_exists=True)
+
+    with op.batch_alter_table('writer_stats', schema=None) as batch_op:
+        batch_op.drop_index('ix_writer_stats_earned')
+        batch_op.drop_index('ix_writer_stats_completed')
+        batch_op.drop_index('ix_writer_stats_rating')
+
+    op.drop_table('writer_stats')
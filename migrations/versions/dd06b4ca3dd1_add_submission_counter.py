@@ -0,0 +1,61 @@
+"""Add orders.submission_counter and the submissions (order_id, submission_number) unique constraint
+
+Revision ID: dd06b4ca3dd1
+Revises: cf5936dd0b22
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'dd06b4ca3dd1'
+down_revision = 'cf5936dd0b22'
+branch_labels = None
+depends_on = None
+
+
+# MAX()+1 numbering could hand two submissions the same number; renumber each
+# order's submissions 1..n in their existing order so the constraint can be added
+RENUMBER = """
+UPDATE submissions SET submission_number = (
+    SELECT ranked.rn FROM (
+        SELECT id, row_number() OVER (
+            PARTITION BY order_id ORDER BY submission_number, created_at, id
+        ) AS rn
+        FROM submissions
+    ) AS ranked
+    WHERE ranked.id = submissions.id
+)
+WHERE order_id IN (
+    SELECT order_id FROM submissions
+    GROUP BY order_id, submission_number HAVING count(*) > 1
+)
+"""
+
+BACKFILL_COUNTER = """
+UPDATE orders SET submission_counter = COALESCE(
+    (SELECT max(submission_number) FROM submissions WHERE submissions.order_id = orders.id), 0
+)
+WHERE id IN (SELECT order_id FROM submissions)
+"""
+
+
+def upgrade():
+    with op.batch_alter_table('orders', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('submission_counter', sa.Integer(), nullable=False, server_default='0'))
+
+    op.execute(RENUMBER)
+    op.execute(BACKFILL_COUNTER)
+
+    with op.batch_alter_table('submissions', schema=None) as batch_op:
+        batch_op.create_unique_constraint('uq_submissions_order_number', ['order_id', 'submission_number'])
+
+
+def downgrade():
+    with op.batch_alter_table('submissions', schema=None) as batch_op:
+        batch_op.drop_constraint('uq_submissions_order_number', type_='unique')
+
+    with op.batch_alter_table('orders', schema=None) as batch_op:
+        batch_op.drop_column('submission_counter')
@@ -0,0 +1,20 @@
+import os
+import pytest
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from app.main import create_app
+from app.extensions import db
+
+
+@pytest.fixture
+def app():
+    """create_app() on a fresh in-memory SQLite schema, inside an app context."""
+    app = create_app()
+    app.config.update(TESTING=True)
+    with app.app_context():
+        # default database only; the extension keeps metadata for binds other tests configured
+        db.create_all(bind_key=None)
+        yield app
+        db.session.remove()
+        db.drop_all(bind_key=None)
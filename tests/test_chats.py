@@ -0,0 +1,39 @@
+from app.extensions import db
+from app.models.chat import Chat
+from app.models.message import Message
+from app.models.order import Order
+from app.models.user import User
+from app.services.auth_service import generate_tokens_for_user
+
+
+def test_chat_list_batches_last_message_and_unread_counts(app):
+    app.config["QUERY_BUDGET_STRICT"] = True
+    client_user = User(email="client@example.com", password_hash="x", role="client")
+    db.session.add(client_user)
+    db.session.flush()
+    for i in range(12):
+        writer = User(email=f"writer{i}@example.com", password_hash="x", role="writer", full_name=f"Writer {i}")
+        order = Order(title=f"Order {i}", client_id=client_user.id, minimum_allowed_budget=0)
+        db.session.add_all([writer, order])
+        db.session.flush()
+        chat = Chat(order_id=order.id, client_id=client_user.id, writer_id=writer.id)
+        db.session.add(chat)
+        db.session.flush()
+        # i unread messages from the writer, then the client's reply last
+        for n in range(i):
+            db.session.add(Message(chat_id=chat.id, sender_id=writer.id, content=f"hello {n}"))
+            db.session.flush()
+        db.session.add(Message(chat_id=chat.id, sender_id=client_user.id, content=f"reply {i}"))
+        db.session.flush()
+    db.session.commit()
+    headers = {"Authorization": f"Bearer {generate_tokens_for_user(client_user)[0]}"}
+
+    response = app.test_client().get("/api/v1/chats", headers=headers)
+    assert response.status_code == 200
+    chats = {c["order_title"]: c for c in response.get_json()["chats"]}
+    assert len(chats) == 12
+    for i in range(12):
+        chat = chats[f"Order {i}"]
+        assert chat["other_user"]["name"] == f"Writer {i}"
+        assert chat["last_message"]["content"] == f"reply {i}"
+        assert chat["unread_count"] == i
@@ -0,0 +1,95 @@
+import time
+import pytest
+from flask import jsonify
+from flask_jwt_extended import jwt_required
+from app.config import Config
+from app.extensions import db
+from app.main import create_app
+from app.models.user import User
+from app.services.auth_service import generate_tokens_for_user
+from app.utils.db_routing import primary_required, replica_binds
+
+# the same user row on every database, named after the database it lives in
+DATABASES = ("primary", "replica0", "replica1")
+
+
+@pytest.fixture
+def routed(tmp_path, monkeypatch):
+    """create_app() on a SQLite primary with two SQLite replicas, plus a few probe views."""
+    urls = {name: f"sqlite:///{tmp_path / name}.db" for name in DATABASES}
+    monkeypatch.setattr(Config, "SQLALCHEMY_DATABASE_URI", urls["primary"])
+    monkeypatch.setattr(Config, "SQLALCHEMY_BINDS", replica_binds(f"{urls['replica0']},{urls['replica1']}"))
+    app = create_app()
+    app.config.update(TESTING=True)
+
+    def name():
+        return db.session.get(User, "usr-1").full_name
+
+    @app.get("/_probe")
+    @jwt_required()
+    def probe():
+        return jsonify(name=name())
+
+    @app.get("/_probe/primary")
+    @jwt_required()
+    @primary_required
+    def probe_primary():
+        return jsonify(name=name())
+
+    @app.post("/_probe/write")
+    @jwt_required()
+    def probe_write():
+        db.session.get(User, "usr-1").bio = "updated"
+        db.session.commit()
+        return jsonify(name=name())
+
+    with app.app_context():
+        for key, engine in db.engines.items():
+            db.metadata.create_all(engine)
+            label = "primary" if key is None else key.replace("_", "")
+            with engine.begin() as conn:
+                conn.execute(User.__table__.insert().values(
+                    id="usr-1", email="writer@example.com", password_hash="x", role="writer", full_name=label,
+                ))
+        token = generate_tokens_for_user(db.session.get(User, "usr-1"))[0]
+        db.session.remove()
+
+    yield app, {"Authorization": f"Bearer {token}"}
+
+
+def _name(client, path, headers, method="get"):
+    response = getattr(client, method)(path, headers=headers)
+    assert response.status_code == 200, response.get_json()
+    return response.get_json()["name"]
+
+
+def test_get_reads_from_a_replica(routed):
+    app, headers = routed
+    assert _name(app.test_client(), "/_probe", headers) in ("replica0", "replica1")
+
+
+def test_one_replica_per_request(routed):
+    app, _ = routed
+    with app.test_request_context("/_probe", method="GET"):
+        engines = {db.session.get_bind(mapper=User.__mapper__) for _ in range(50)}
+        assert len(engines) == 1
+        assert engines != {db.engines[None]}
+
+
+def test_primary_required_reads_from_primary(routed):
+    app, headers = routed
+    assert _name(app.test_client(), "/_probe/primary", headers) == "primary"
+
+
+def test_caller_reads_from_primary_after_writing(routed):
+    app, headers = routed
+    client = app.test_client()
+    # the write and the read inside its own request both use the primary
+    assert _name(client, "/_probe/write", headers, method="post") == "primary"
+    # so do the caller's GETs inside the sticky window
+    assert _name(client, "/_probe", headers) == "primary"
+
+    app.config["DB_STICKY_PRIMARY_SECONDS"] = 0.05
+    assert _name(client, "/_probe/write", headers, method="post") == "primary"
+    time.sleep(0.1)
+    assert _name(client, "/_probe", headers) in ("replica0", "replica1")
@@ -0,0 +1,39 @@
+import pytest
+from app.extensions import db
+from app.models.document_manifest import DocumentManifest
+from app.models.user import User
+from app.services.auth_service import generate_tokens_for_user
+
+
+@pytest.fixture
+def cv_text(app, tmp_path):
+    """An admin, their tokens, and the extracted text of a processed CV."""
+    text = tmp_path / "cv.txt"
+    text.write_text("curriculum vitae")
+    admin = User(email="admin@example.com", password_hash="x", role="admin")
+    document = DocumentManifest(
+        owner_type="application", owner_id="app-1", kind="cv",
+        path=str(tmp_path / "cv.pdf"), filename="cv.pdf", text_path=str(text), status="done",
+    )
+    db.session.add_all([admin, document])
+    db.session.commit()
+    access, refresh = generate_tokens_for_user(admin)
+    return app.test_client(), f"/api/v1/documents/{document.id}/text", access, refresh
+
+
+def test_query_token_accepts_access_token(cv_text):
+    client, url, access, _ = cv_text
+    response = client.get(url, query_string={"token": access})
+    assert response.status_code == 200
+    assert response.get_data(as_text=True) == "curriculum vitae"
+
+
+def test_query_token_rejects_refresh_token(cv_text):
+    client, url, _, refresh = cv_text
+    assert client.get(url, query_string={"token": refresh}).status_code == 401
+
+
+def test_query_token_rejects_logged_out_token(cv_text):
+    client, url, access, _ = cv_text
+    assert client.post("/api/v1/auth/logout", headers={"Authorization": f"Bearer {access}"}).status_code == 200
+    assert client.get(url, query_string={"token": access}).status_code == 401
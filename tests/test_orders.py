@@ -0,0 +1,56 @@
+import pytest
+from app.extensions import db
+from app.models.order import Order
+from app.models.order_invitation import OrderInvitation
+from app.models.user import User
+from app.services.auth_service import generate_tokens_for_user
+
+
+@pytest.fixture
+def invited_order(app):
+    client = User(email="client@example.com", password_hash="x", role="client")
+    writer = User(email="writer@example.com", password_hash="x", role="writer", full_name="Old Name")
+    db.session.add_all([client, writer])
+    db.session.flush()
+    order = Order(title="Essay", client_id=client.id, minimum_allowed_budget=0)
+    db.session.add(order)
+    db.session.flush()
+    db.session.add(OrderInvitation(order_id=order.id, writer_id=writer.id))
+    db.session.commit()
+    headers = {"Authorization": f"Bearer {generate_tokens_for_user(client)[0]}"}
+    return app.test_client(), headers, order.id, writer.id
+
+
+def _preferred_names(response):
+    return [w["name"] for w in response.get_json()["preferred_writers"]]
+
+
+def test_order_etag_and_body_change_together(invited_order):
+    client, headers, order_id, writer_id = invited_order
+    first = client.get(f"/api/v1/orders/{order_id}", headers=headers)
+    assert _preferred_names(first) == ["Old Name"]
+    assert client.get(f"/api/v1/orders/{order_id}", headers={**headers, "If-None-Match": first.headers["ETag"]}).status_code == 304
+
+    db.session.get(User, writer_id).full_name = "New Name"
+    db.session.commit()
+
+    second = client.get(f"/api/v1/orders/{order_id}", headers={**headers, "If-None-Match": first.headers["ETag"]})
+    assert second.status_code == 200
+    assert second.headers["ETag"] != first.headers["ETag"]
+    # the body served under the new ETag must be the one it was computed for
+    assert _preferred_names(second) == ["New Name"]
+
+
+def test_order_details_stay_within_query_budget(invited_order, app):
+    client, headers, order_id, _ = invited_order
+    app.config["QUERY_BUDGET_STRICT"] = True
+    for i in range(12):
+        writer = User(email=f"writer{i}@example.com", password_hash="x", role="writer", full_name=f"Writer {i}")
+        db.session.add(writer)
+        db.session.flush()
+        db.session.add(OrderInvitation(order_id=order_id, writer_id=writer.id))
+    db.session.commit()
+
+    response = client.get(f"/api/v1/orders/{order_id}", headers=headers)
+    assert response.status_code == 200
+    assert len(_preferred_names(response)) == 13
@@ -0,0 +1,77 @@
+from datetime import datetime, timedelta
+import pytest
+from app.extensions import db
+from app.models.order import Order
+from app.models.user import User
+from app.services.auth_service import generate_tokens_for_user
+
+# (orders' budgets) per client; repeated totals make the id tie-breaker matter
+CLIENT_ORDERS = [[], [50.0], [20.0, 30.0], [], [10.0, 10.0, 30.0], [50.0], [5.0, 5.0]]
+
+SORT_KEYS = {
+    "joinedDate": lambda c: c["joined_at"],
+    "totalOrders": lambda c: len(c["orders"]),
+    "totalSpent": lambda c: sum(c["orders"]),
+}
+
+
+@pytest.fixture
+def directory(app):
+    app.config["QUERY_BUDGET_STRICT"] = True
+    admin = User(email="admin@example.com", password_hash="x", role="admin")
+    db.session.add(admin)
+    start = datetime(2026, 1, 1)
+    clients = []
+    for i, budgets in enumerate(CLIENT_ORDERS):
+        user = User(email=f"client{i}@example.com", password_hash="x", role="client",
+                    joined_at=start + timedelta(days=i % 4))  # shared join dates too
+        db.session.add(user)
+        db.session.flush()
+        for budget in budgets:
+            db.session.add(Order(title="t", client_id=user.id, budget=budget, minimum_allowed_budget=0))
+        clients.append({"id": user.id, "joined_at": user.joined_at, "orders": budgets})
+    db.session.commit()
+    token = generate_tokens_for_user(admin)[0]
+    return app.test_client(), {"Authorization": f"Bearer {token}"}, clients
+
+
+def _get(client, headers, **params):
+    return client.get("/api/v1/admin/clients", query_string=params, headers=headers)
+
+
+@pytest.mark.parametrize("order", ["asc", "desc"])
+@pytest.mark.parametrize("sort", list(SORT_KEYS))
+def test_pages_follow_sort(directory, sort, order):
+    client, headers, clients = directory
+    expected = [c["id"] for c in sorted(clients, key=lambda c: (SORT_KEYS[sort](c), c["id"]), reverse=order == "desc")]
+
+    seen, cursor = [], None
+    while True:
+        params = {"sort": sort, "order": order, "limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = _get(client, headers, **params)
+        assert response.status_code == 200, response.get_json()
+        body = response.get_json()
+        seen += [c["id"] for c in body["clients"]]
+        cursor = body["pagination"]["next_cursor"]
+        if not cursor:
+            break
+
+    assert seen == expected
+    assert body["pagination"]["total"] == len(clients)
+
+
+def test_malformed_cursor_is_rejected(directory):
+    client, headers, _ = directory
+    for cursor in ("not-a-cursor", "e30", "eyJzIjogMX0"):  # garbage, {}, {"s": 1}
+        assert _get(client, headers, cursor=cursor).status_code == 400
+
+
+@pytest.mark.parametrize("other", [{"sort": "totalOrders"}, {"sort": "joinedDate", "order": "asc"}])
+def test_cursor_from_another_sort_is_rejected(directory, other):
+    client, headers, _ = directory
+    cursor = _get(client, headers, limit=2, **other).get_json()["pagination"]["next_cursor"]
+    assert cursor
+    response = _get(client, headers, sort="joinedDate", order="desc", limit=2, cursor=cursor)
+    assert response.status_code == 400
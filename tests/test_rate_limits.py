@@ -0,0 +1,218 @@
+import fnmatch
+import hashlib
+import os
+import socketserver
+import threading
+import time
+import pytest
+
+pytest.importorskip("redis")  # limits' Redis storage client
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from flask_jwt_extended import create_access_token
+from limits.storage import RedisStorage
+from app.main import create_app
+from app.extensions import limiter
+from app.utils.rate_limits import rate_limit_key
+
+# the only Lua the fixed-window strategy runs; matched by content like a real server's script cache
+_SCRIPTS = {
+    "incr_expire": RedisStorage.SCRIPT_INCR_EXPIRE.decode(),
+    "clear_keys": RedisStorage.SCRIPT_CLEAR_KEYS.decode(),
+}
+
+
+class RespStandIn(socketserver.ThreadingTCPServer):
+    """
+    Just enough of the Redis protocol for limits' fixed-window storage.
+
+    One instance plays the shared store that every worker's limiter talks to.
+    """
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _RespHandler)
+        self.values, self.expires, self.scripts = {}, {}, {}
+        self.lock = threading.Lock()
+        self.down = False
+
+    @property
+    def url(self):
+        return "redis://%s:%d/0" % self.server_address
+
+    def stop(self):
+        """Go away like a crashed server: refuse new connections and drop open ones."""
+        self.down = True
+        self.shutdown()
+        self.server_close()
+
+    def _live(self, key):
+        if key in self.expires and self.expires[key] <= time.monotonic():
+            self.values.pop(key, None)
+            self.expires.pop(key, None)
+        return key in self.values
+
+    def execute(self, name, *args):
+        with self.lock:
+            return getattr(self, f"cmd_{name.lower()}", self.cmd_unknown)(*args)
+
+    def cmd_unknown(self, *args):
+        return Exception("ERR unknown command")
+
+    def cmd_ping(self):
+        return "PONG"
+
+    def cmd_client(self, *args):
+        return "OK"
+
+    def cmd_select(self, db):
+        return "OK"
+
+    def cmd_get(self, key):
+        return self.values[key].encode() if self._live(key) else None
+
+    def cmd_incrby(self, key, amount):
+        value = int(self.values[key]) + int(amount) if self._live(key) else int(amount)
+        self.values[key] = str(value)
+        return value
+
+    def cmd_expire(self, key, seconds):
+        if not self._live(key):
+            return 0
+        self.expires[key] = time.monotonic() + int(seconds)
+        return 1
+
+    def cmd_ttl(self, key):
+        if not self._live(key):
+            return -2
+        return int(self.expires[key] - time.monotonic()) if key in self.expires else -1
+
+    def cmd_del(self, *keys):
+        return sum(self.values.pop(k, None) is not None for k in keys if self._live(k))
+
+    def cmd_keys(self, pattern):
+        return [k.encode() for k in list(self.values) if self._live(k) and fnmatch.fnmatchcase(k, pattern)]
+
+    def cmd_script(self, action, script):
+        sha = hashlib.sha1(script.encode()).hexdigest()
+        self.scripts[sha] = script
+        return sha.encode()
+
+    def cmd_evalsha(self, sha, numkeys, *rest):
+        script = self.scripts.get(sha)
+        if script is None:
+            return Exception("NOSCRIPT No matching script. Please use EVAL.")
+        keys, argv = rest[:int(numkeys)], rest[int(numkeys):]
+        if script == _SCRIPTS["incr_expire"]:
+            value = self.cmd_incrby(keys[0], argv[1])
+            if value == int(argv[1]):
+                self.cmd_expire(keys[0], argv[0])
+            return value
+        if script == _SCRIPTS["clear_keys"]:
+            return self.cmd_del(*[k.decode() for k in self.cmd_keys(keys[0])])
+        return Exception("ERR script not supported by the stand-in")
+
+
+class _RespHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        while True:
+            line = self.rfile.readline()
+            if not line or self.server.down:
+                return
+            args = []
+            for _ in range(int(line[1:])):
+                length = int(self.rfile.readline()[1:])
+                args.append(self.rfile.read(length + 2)[:-2].decode())
+            self.wfile.write(self._encode(self.server.execute(*args)))
+
+    def _encode(self, value):
+        if value is None:
+            return b"$-1\r\n"
+        if isinstance(value, Exception):
+            return f"-{value}\r\n".encode()
+        if isinstance(value, int):
+            return f":{value}\r\n".encode()
+        if isinstance(value, str):
+            return f"+{value}\r\n".encode()
+        if isinstance(value, bytes):
+            return b"$%d\r\n%s\r\n" % (len(value), value)
+        return b"*%d\r\n" % len(value) + b"".join(self._encode(v) for v in value)
+
+
+@pytest.fixture
+def store():
+    server = RespStandIn()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    if not server.down:
+        server.stop()
+
+
+@pytest.fixture
+def make_worker(store):
+    """create_app() wired to the stand-in, as another gunicorn worker would be."""
+    apps = []
+
+    def make(**config):
+        app = create_app()
+        app.config.update(
+            TESTING=True, RATELIMIT_STORAGE_URI=store.url, RATELIMIT_STORAGE_OPTIONS={"protocol": 2}, **config,
+        )
+        limiter.init_app(app)
+        apps.append(app)
+        return app
+
+    yield make
+    # the limiter is process-wide; leave it on memory storage for other tests
+    for app in apps:
+        app.config.update(RATELIMIT_STORAGE_URI="memory://", RATELIMIT_STORAGE_OPTIONS={})
+        limiter.init_app(app)
+
+
+def _login(client):
+    # rejected before any database work, but still charged like a real attempt
+    return client.post("/api/v1/auth/login", json={"email": "someone@example.com"})
+
+
+def test_counters_are_shared_between_workers(make_worker, store):
+    budget = dict(RATELIMIT_EXPENSIVE="25 per minute", RATELIMIT_COST_PASSWORD=10)
+    first = make_worker(**budget).test_client()
+    assert _login(first).status_code == 422
+    assert _login(first).status_code == 422
+
+    # a fresh worker (or a restarted one) sees the 20 already spent
+    second = make_worker(**budget).test_client()
+    assert _login(second).status_code == 429
+    assert any("expensive" in key for key in store.values)
+
+
+def test_cost_tiers_weigh_routes_differently(make_worker):
+    client = make_worker(RATELIMIT_EXPENSIVE="10 per minute", RATELIMIT_COST_PASSWORD=10).test_client()
+    assert _login(client).status_code == 422
+    assert _login(client).status_code == 429
+    # cheap routes only draw from their own default limit
+    assert client.get("/api/v1/profile").status_code == 401
+
+
+def test_falls_back_to_memory_when_store_is_down(make_worker, store):
+    client = make_worker(RATELIMIT_EXPENSIVE="25 per minute", RATELIMIT_COST_PASSWORD=10).test_client()
+    assert _login(client).status_code == 422
+    store.stop()
+    # per-worker counting resumes instead of failing the request
+    assert _login(client).status_code == 422
+    assert _login(client).status_code == 422
+    assert _login(client).status_code == 429
+
+
+def test_key_is_jwt_identity_when_token_is_valid():
+    app = create_app()
+    with app.app_context():
+        token = create_access_token(identity="usr-1")
+    with app.test_request_context(headers={"Authorization": f"Bearer {token}"}, environ_base={"REMOTE_ADDR": "10.0.0.1"}):
+        assert rate_limit_key() == "user:usr-1"
+    with app.test_request_context(headers={"Authorization": "Bearer not-a-jwt"}, environ_base={"REMOTE_ADDR": "10.0.0.1"}):
+        assert rate_limit_key() == "ip:10.0.0.1"
+    with app.test_request_context(environ_base={"REMOTE_ADDR": "10.0.0.2"}):
+        assert rate_limit_key() == "ip:10.0.0.2"
@@ -0,0 +1,32 @@
+import os
+import pytest
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from bench.importtime import profile_startup
+from app.main import create_app
+
+# create_app() runs for every test session, CLI command and worker boot; raise on slow CI machines
+STARTUP_BUDGET_SECONDS = float(os.getenv("STARTUP_BUDGET_SECONDS", "1.0"))
+
+
+@pytest.fixture(scope="module")
+def profile():
+    return profile_startup(env={"DATABASE_URL": "sqlite://"})
+
+
+def test_create_app_defers_heavy_imports(profile):
+    assert profile.loaded_lazy() == []
+
+
+def test_create_app_within_budget(profile):
+    slowest = ", ".join(f"{name} {seconds:.3f}s" for name, seconds in profile.packages()[:5])
+    assert profile.seconds < STARTUP_BUDGET_SECONDS, f"startup took {profile.seconds:.3f}s ({slowest})"
+
+
+@pytest.mark.parametrize("args", [["db", "heads"], ["db", "-d", "migrations", "heads"], ["db", "-x", "a=b", "heads"]])
+def test_lazy_db_group_runs_migrate_commands(args):
+    # a fresh app has only the stand-in group; its options must still reach Flask-Migrate
+    result = create_app().test_cli_runner().invoke(args=args)
+    assert result.exception is None, result.output
+    assert result.exit_code == 0
@@ -0,0 +1,33 @@
+import pytest
+from sqlalchemy.exc import IntegrityError
+from app.extensions import db
+from app.models.order import Order
+from app.models.submission import Submission
+from app.models.user import User
+from app.services.submission_service import allocate_submission_number
+
+
+@pytest.fixture
+def order(app):
+    client = User(email="client@example.com", password_hash="x", role="client")
+    writer = User(email="writer@example.com", password_hash="x", role="writer")
+    db.session.add_all([client, writer])
+    db.session.flush()
+    order = Order(title="Essay", client_id=client.id, writer_id=writer.id, minimum_allowed_budget=0)
+    db.session.add(order)
+    db.session.commit()
+    return order
+
+
+def test_allocates_consecutive_numbers(order):
+    assert allocate_submission_number(order) == 1
+    assert allocate_submission_number(order) == 2
+    db.session.commit()
+    assert db.session.get(Order, order.id).submission_counter == 2
+
+
+def test_duplicate_number_for_order_is_rejected(order):
+    for _ in range(2):
+        db.session.add(Submission(order_id=order.id, submission_number=1, writer_id=order.writer_id))
+    with pytest.raises(IntegrityError):
+        db.session.flush()